@@ -1,4 +1,5 @@
 import os
+import sys
 from dbacademy.clients.airtable import AirTableClient
 from typing import List
 from datetime import datetime
@@ -182,6 +183,8 @@ elif action == 1:
     if read_str("""Please confirm you wish to create these workspaces""", "no").lower() in CONFIRMATIONS:
 
         FALSE = False  # easier for my eyes to recognize
-        workspace_setup.create_workspaces(remove_metastore=FALSE,      # This should always be False
-                                          remove_users=FALSE,          # This should always be False
-                                          uninstall_courseware=FALSE)  # This should always be False
+        failed_workspaces = workspace_setup.create_workspaces(remove_metastore=FALSE,      # This should always be False
+                                                              remove_users=FALSE,          # This should always be False
+                                                              uninstall_courseware=FALSE)  # This should always be False
+        if len(failed_workspaces) > 0:
+            sys.exit(1)
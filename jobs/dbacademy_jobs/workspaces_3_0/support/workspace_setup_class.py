@@ -1,4 +1,4 @@
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Tuple
 
 from dbacademy.clients.airtable import AirTableClient
 from dbacademy.dbrest import DBAcademyRestClient
@@ -81,6 +81,9 @@ class WorkspaceSetup:
     from dbacademy.clients.dougrest.accounts.workspaces import Workspace
     from dbacademy_jobs.workspaces_3_0.support.account_config_class import AccountConfig
 
+    # The number of concurrent SCIM requests made against any one workspace when creating or removing users.
+    MAX_USER_WORKERS = 10
+
     def __init__(self, account_config: AccountConfig, run_workspace_setup: bool):
         import os
         from dbacademy import common
@@ -124,11 +127,41 @@ class WorkspaceSetup:
     def account_config(self) -> AccountConfig:
         return self.__account_config
 
-    @classmethod
-    def __for_each_workspace(cls, workspaces: List[WorkspaceTrio], some_action: Callable[[WorkspaceTrio], None]) -> None:
+    def __run_workspace_pipelines(self, steps: List[Tuple[str, Callable[[WorkspaceTrio], None]]], max_workers: int) -> List[str]:
+        """Runs the steps in every configured workspace, max_workers workspaces at a time, returning the names of those that failed."""
         from multiprocessing.pool import ThreadPool
-        with ThreadPool(len(workspaces)) as pool:
-            pool.map(some_action, workspaces)
+
+        workspace_configs = self.account_config.workspaces
+        with ThreadPool(max(1, min(max_workers, len(workspace_configs)))) as pool:
+            results = pool.map(lambda wc: self.__run_workspace_pipeline(wc, steps), workspace_configs)
+
+        return [wc.name for wc, succeeded in zip(workspace_configs, results) if not succeeded]
+
+    def __run_workspace_pipeline(self, workspace_config: WorkspaceConfig, steps: List[Tuple[str, Callable[[WorkspaceTrio], None]]]) -> bool:
+        import time
+        import traceback
+
+        start = time.time()
+        description = "Initializing REST APIs"
+        try:
+            trio = self.__create_workspace(workspace_config)
+
+            description = "Waiting for the workspace to finish provisioning"
+            print(f"""{description} for "{workspace_config.name}".""")
+            trio.workspace_api.wait_until_ready()
+
+            for description, action in steps:
+                print(f"""{description} for "{workspace_config.name}".""")
+                action(trio)
+
+        except Exception as e:
+            # Stop this workspace's pipeline; the remaining steps depend on the one that failed.
+            self.log_error(f"""Failed while "{description}" for "{workspace_config.name}", skipping its remaining steps.\n{str(e)}\n{traceback.format_exc()}""")
+            return False
+
+        duration = int((time.time() - start) / 60)
+        print(f"""Finished {len(steps)} steps for "{workspace_config.name}" ({duration} minutes).""")
+        return True
 
     @classmethod
     def __get_metastore(cls, workspace_api: Workspace, workspace_name: str) -> Optional[Dict[str, Any]]:
@@ -274,7 +307,8 @@ class WorkspaceSetup:
             self.__remove_metastore(trio)
             self.__delete_workspace(trio)
 
-    def create_workspaces(self, *, remove_users: bool, remove_metastore: bool, uninstall_courseware: bool = False):
+    def create_workspaces(self, *, remove_users: bool, remove_metastore: bool, uninstall_courseware: bool = False, max_workers: int = 50) -> List[str]:
+        """Creates and configures every workspace, returning the names of those whose setup failed."""
 
         self.__air_table_records = self.air_table_client.read()
 
@@ -296,7 +330,8 @@ class WorkspaceSetup:
                 print(f"""WARNING: The workspace naming pattern doesn't start with "classroom", found "{naming_pattern}".""")
 
             if input(f"\nPlease confirm running with this abnormal configuration (y/n):").lower() not in ["1", "y", "yes"]:
-                return print("Execution aborted.")
+                print("Execution aborted.")
+                return list()
 
         print("\n")
         print("-"*100)
@@ -306,102 +341,67 @@ class WorkspaceSetup:
             print(workspace_config.name)
 
         #############################################################
-        from multiprocessing.pool import ThreadPool
-        print("-"*100)
-        print("Initializing REST APIs.")
-
-        # Should be empty, reset anyway
-        self.__workspaces: List[WorkspaceTrio] = list()
-
-        with ThreadPool(len(self.account_config.workspaces)) as pool:
-            pool.map(self.__create_workspace, self.account_config.workspaces)
-
-        #############################################################
-        # Workspaces were all created synchronously, blocking here until we confirm that all workspaces are created.
-        for workspace in self.__workspaces:
-            print(f"""Waiting for the creation of workspace "{workspace.workspace_config.name}" to finish provisioning...""")
-            workspace.workspace_api.wait_until_ready()
+        # Each workspace moves through its own pipeline of steps independently of the others, so a slow step
+        # in one workspace doesn't hold up the rest. The order of the steps within any one workspace is unchanged.
+        steps: List[Tuple[str, Callable[[WorkspaceTrio], None]]] = list()
 
-        #############################################################
-        # Remove any users before doing anything like adding them.
         print("-"*100)
         if remove_users:
-            print("Removing all users from each workspaces.")
-            self.__for_each_workspace(self.__workspaces, self.__remove_users)
+            steps.append(("Removing all users", self.__remove_users))
         else:
             print("Skipping removal of users")
 
-        #############################################################
-        print("-"*100)
-        print(f"""Configuring the entitlements for the group "users" in each workspace.""")
-        self.__for_each_workspace(self.__workspaces, self.__update_entitlements)
-
-        #############################################################
-        print("-"*100)
-        print(f"""Configuring users in each workspace.""")
-        self.__for_each_workspace(self.__workspaces, self.__create_users)
-
-        #############################################################
-        print("-"*100)
-        print(f"""Configuring groups in each workspace.""")
-        self.__for_each_workspace(self.__workspaces, self.__create_group)
+        steps.append(('Configuring the entitlements for the group "users"', self.__update_entitlements))
+        steps.append(("Configuring users", self.__create_users))
+        steps.append(("Configuring groups", self.__create_group))
 
-        #############################################################
-        print("-"*100)
         if remove_metastore:
-            print(f"""Deleting the metastore in each workspace.""")
-            self.__for_each_workspace(self.__workspaces, self.__remove_metastore)
+            steps.append(("Deleting the metastore", self.__remove_metastore))
         else:
             print("Skipping removal of metastore")
 
-        #############################################################
-        print("-"*100)
-        print(f"""Configuring the metastore in each workspace.""")
-        self.__for_each_workspace(self.__workspaces, self.__create_metastore)
-
-        #############################################################
-        print("-"*100)
-        print(f"""Configuring features in each workspace.""")
-        self.__for_each_workspace(self.__workspaces, self.__enable_features)
+        steps.append(("Configuring the metastore", self.__create_metastore))
+        steps.append(("Configuring features", self.__enable_features))
 
-        #############################################################
-        print("-"*100)
         if uninstall_courseware:
-            print(f"""Uninstalling courseware for all users in each workspace.""")
-            self.__for_each_workspace(self.__workspaces, self.__uninstall_courseware)
+            steps.append(("Uninstalling courseware for all users", self.__uninstall_courseware))
         else:
             print("Skipping uninstall of courseware")
 
-        #############################################################
-        print("-"*100)
-        print(f"""Installing courseware for all users in each workspace.""")
-        self.__for_each_workspace(self.__workspaces, self.__install_courseware)
-
-        #############################################################
-        print("-"*100)
-        print(f"""Starting the Workspace-Setup job in each workspace.""")
-        self.__for_each_workspace(self.__workspaces, self.__run_workspace_setup_job)
+        steps.append(("Installing courseware for all users", self.__install_courseware))
+        steps.append(("Starting the Workspace-Setup job", self.__run_workspace_setup_job))
 
-        #############################################################
-        print("-"*100)
         if self.run_workspace_setup:
-            print(f"""Validating select indicators in each workspace.""")
-            self.__for_each_workspace(self.__workspaces, self.__validate_workspace_setup)
+            steps.append(("Validating select indicators", self.__validate_workspace_setup))
         else:
             print("Skipping workspace validation, the Workspace-Setup job has not been run.")
 
+        #############################################################
+        print("-"*100)
+        print(f"""Running {len(steps)} steps in each workspace, {max_workers} workspaces at a time.""")
+
+        # Should be empty, reset anyway
+        self.__workspaces: List[WorkspaceTrio] = list()
+
+        failed_workspaces = self.__run_workspace_pipelines(steps, max_workers)
+        completed_count = len(self.account_config.workspaces) - len(failed_workspaces)
+
         #############################################################
         print("-" * 100)
         if len(self.errors) == 0:
-            print(f"""Completed setup for {len(self.__workspaces)} workspaces with no errors.""")
+            print(f"""Completed setup for {completed_count} workspaces with no errors.""")
         else:
-            print(f"""Completed setup for {len(self.__workspaces)} workspaces with {len(self.errors)} errors.""")
+            print(f"""Completed setup for {completed_count} workspaces with {len(self.errors)} errors.""")
+            if len(failed_workspaces) > 0:
+                print(f"""Failed setup for {len(failed_workspaces)} workspaces: {", ".join(failed_workspaces)}""")
             print("Errors:")
             for error in self.errors:
                 print(error)
                 print("-"*100)
 
-    def __create_workspace(self, workspace_config: WorkspaceConfig):
+        return failed_workspaces
+
+    def __create_workspace(self, workspace_config: WorkspaceConfig) -> WorkspaceTrio:
         from dbacademy.clients.classrooms.classroom import Classroom
 
         workspace_api = self.accounts_api.workspaces.get_by_name(workspace_config.name, if_not_exists="ignore")
@@ -420,11 +420,12 @@ class WorkspaceSetup:
                               username_pattern=workspace_config.username_pattern,
                               databricks_api=workspace_api)
 
-        self.__workspaces.append(WorkspaceTrio(workspace_config, workspace_api, classroom))
+        trio = WorkspaceTrio(workspace_config, workspace_api, classroom)
+        self.__workspaces.append(trio)
+        return trio
 
     @classmethod
     def __install_courseware(cls, trio: WorkspaceTrio):
-        import os
         from dbacademy.dbhelper import WorkspaceHelper
 
         for course_def in trio.workspace_config.course_definitions:
@@ -447,15 +448,8 @@ class WorkspaceSetup:
                 if count > 0:
                     print(f" - Skipping, course already exists.")
                 else:
-                    files = [f.lower() for f in os.listdir("/")]
-                    if "tmp" in files:
-                        local_file_path = "/tmp/download.dbc"
-                    elif "temp" in files:
-                        local_file_path = "/temp/download.dbc"
-                    else:
-                        local_file_path = "/download.dbc"
-
-                    trio.client.workspace.import_dbc_files(install_dir, download_url, local_file_path=local_file_path)
+                    # Downloaded to a path unique to the URL, as other workspaces are installing other courses concurrently.
+                    trio.client.workspace.import_dbc_files(install_dir, download_url)
                     print(f" - Installed.")
 
     @classmethod
@@ -499,71 +493,75 @@ class WorkspaceSetup:
         })
 
     def __remove_users(self, trio: WorkspaceTrio):
+        from multiprocessing.pool import ThreadPool
+
         # Just in case it's not ready
         trio.workspace_api.wait_until_ready()
 
         name = trio.workspace_config.name
         print(f"""Removing {len(trio.existing_users)} users for "{name}".""")
 
-        for user in trio.existing_users:
-            user_id = user.get("id")
-            username = user.get("userName")
-            if username != self.account_config.username:
-                trio.client.scim.users.delete_by_id(user_id)
-                # trio.classroom.databricks.users.delete_by_id(user_id)
+        user_ids = [u.get("id") for u in trio.existing_users if u.get("userName") != self.account_config.username]
+
+        with ThreadPool(self.MAX_USER_WORKERS) as pool:
+            pool.map(trio.client.scim.users.delete_by_id, user_ids)
 
         # Force a reload
         trio.existing_users = None
 
     def __create_users(self, trio: WorkspaceTrio):
+        from multiprocessing.pool import ThreadPool
+
         # Just in case it's not ready
         trio.workspace_api.wait_until_ready()
 
         name = trio.workspace_config.name
         max_users = len(trio.workspace_config.usernames)
 
-        existing_usernames = [u.get("userName") for u in trio.existing_users]
-        remaining_count = max_users-len(existing_usernames)+1
+        existing_users = {u.get("userName"): u for u in trio.existing_users}
+        remaining_count = max_users-len(existing_users)+1
         print(f"""Configuring {remaining_count} of {max_users+1} users for "{name}".""")
 
-        for username in trio.workspace_config.usernames:
-            if username in existing_usernames:
-                user = trio.get_by_username(username)
-            else:
-                try:
-                    user = trio.client.scim.users.create(username)
-                except DatabricksApiException as e:
-                    user = trio.client.scim.users.get_by_username(username)
-                    if user is None:
-                        user = trio.client.scim.users.create(username)
-                        print(f"| {e.message}|")
-                        print("F$@# LIARS !!!")
-                    elif e.http_code == 409:
-                        existing = username in existing_usernames
-                        print("-"*100)
-                        print(f"409 creating user {username}, existing: {existing}")
-                        print(f"| {e.message}|")
-                        print("-"*100)
-                    else:
-                        raise Exception(f"Failed to create user {username} for {name}") from e
-
-            if username != self.account_config.username:
-                self.__remove_entitlement(trio, user, "allow-cluster-create")
-                self.__remove_entitlement(trio, user, "databricks-sql-access")
-                self.__remove_entitlement(trio, user, "workspace-access")
+        with ThreadPool(self.MAX_USER_WORKERS) as pool:
+            pool.map(lambda username: self.__create_user(trio, username, existing_users.get(username)), trio.workspace_config.usernames)
 
         # Force a reload
         trio.existing_users = None
 
+    def __create_user(self, trio: WorkspaceTrio, username: str, user: Optional[Dict[str, Any]]):
+        name = trio.workspace_config.name
+
+        if user is None:
+            try:
+                user = trio.client.scim.users.create(username)
+
+            except DatabricksApiException as e:
+                user = trio.client.scim.users.get_by_username(username)
+                if user is None:
+                    user = trio.client.scim.users.create(username)
+                    print(f"| {e.message}|")
+                    print("F$@# LIARS !!!")
+                elif e.http_code == 409:
+                    print("-"*100)
+                    print(f"409 creating user {username}, existing: False")
+                    print(f"| {e.message}|")
+                    print("-"*100)
+                else:
+                    raise Exception(f"Failed to create user {username} for {name}") from e
+
+        if username != self.account_config.username:
+            self.__remove_entitlements(trio, user, ["allow-cluster-create", "databricks-sql-access", "workspace-access"])
+
     @staticmethod
-    def __remove_entitlement(trio: WorkspaceTrio, user: Dict[str, Any], entitlement: str):
+    def __remove_entitlements(trio: WorkspaceTrio, user: Dict[str, Any], entitlements: List[str]):
         username = user.get("userName")
-        entitlements = [e.get("value") for e in user.get("entitlements", list())]
-        if entitlement in entitlements:
-            try:
-                trio.client.scim.users.remove_entitlement(user.get("id"), entitlement)
-            except Exception as e:
-                raise Exception(f"Exception removing entitlement {entitlement} from {username}") from e
+        existing = [e.get("value") for e in user.get("entitlements", list())]
+        entitlements = [e for e in entitlements if e in existing]
+        try:
+            # One PATCH removes all of them, rather than one request per entitlement; none is made if there are none.
+            trio.client.scim.users.remove_entitlements(user.get("id"), entitlements)
+        except Exception as e:
+            raise Exception(f"Exception removing entitlements {entitlements} from {username}") from e
 
     @staticmethod
     def __update_entitlements(trio: WorkspaceTrio):
@@ -0,0 +1,122 @@
+import threading
+import unittest
+from typing import List
+
+from dbacademy_jobs.workspaces_3_0.support.workspace_setup_class import WorkspaceSetup
+
+
+class FakeWorkspaceConfig:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class FakeAccountConfig:
+    def __init__(self, count: int):
+        self.username = "admin@example.com"
+        self.workspaces = [FakeWorkspaceConfig(f"classroom-{i:03d}") for i in range(count)]
+
+
+class FakeWorkspaceApi:
+    def wait_until_ready(self):
+        pass
+
+
+class FakeTrio:
+    def __init__(self, workspace_config: FakeWorkspaceConfig):
+        self.workspace_config = workspace_config
+        self.name = workspace_config.name
+        self.workspace_api = FakeWorkspaceApi()
+
+
+class TestWorkspaceSetupPipeline(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Skips __init__, which connects to the accounts API and AirTable.
+        self.setup: WorkspaceSetup = WorkspaceSetup.__new__(WorkspaceSetup)
+        self.setup._WorkspaceSetup__errors = list()
+        self.setup._WorkspaceSetup__workspaces = list()
+        self.setup._WorkspaceSetup__account_config = FakeAccountConfig(5)
+        self.setup._WorkspaceSetup__create_workspace = FakeTrio
+
+        self.lock = threading.Lock()
+        self.calls: List[str] = list()
+
+    def step(self, description: str, fail_for: str = None):
+        def action(trio: FakeTrio):
+            with self.lock:
+                self.calls.append(f"{trio.name}: {description}")
+            if trio.name == fail_for:
+                raise ValueError(f"{description} failed")
+        return description, action
+
+    def run_pipelines(self, steps, max_workers=3) -> List[str]:
+        return self.setup._WorkspaceSetup__run_workspace_pipelines(steps, max_workers)
+
+    def test_all_succeed(self):
+        failed = self.run_pipelines([self.step("one"), self.step("two")])
+
+        self.assertEqual([], failed)
+        self.assertEqual([], self.setup.errors)
+        self.assertEqual(10, len(self.calls))
+
+        for i in range(5):
+            calls = [c for c in self.calls if c.startswith(f"classroom-{i:03d}:")]
+            self.assertEqual([f"classroom-{i:03d}: one", f"classroom-{i:03d}: two"], calls)
+
+    def test_failure_stops_only_that_workspace(self):
+        failed = self.run_pipelines([self.step("one"), self.step("two", fail_for="classroom-002"), self.step("three")])
+
+        self.assertEqual(["classroom-002"], failed)
+        self.assertEqual(1, len(self.setup.errors))
+        self.assertIn('Failed while "two" for "classroom-002"', self.setup.errors[0])
+        self.assertNotIn("classroom-002: three", self.calls)
+        self.assertEqual(4, len([c for c in self.calls if c.endswith(": three")]))
+
+    def test_create_workspace_failure(self):
+        def create_workspace(workspace_config):
+            if workspace_config.name == "classroom-000":
+                raise ValueError("Quota exceeded")
+            return FakeTrio(workspace_config)
+
+        self.setup._WorkspaceSetup__create_workspace = create_workspace
+        failed = self.run_pipelines([self.step("one")], max_workers=1)
+
+        self.assertEqual(["classroom-000"], failed)
+        self.assertIn('Failed while "Initializing REST APIs" for "classroom-000"', self.setup.errors[0])
+        self.assertEqual(4, len(self.calls))
+
+
+class FakeScimUsers:
+    def __init__(self):
+        self.removed = dict()
+
+    @staticmethod
+    def create(username: str):
+        return {"id": username, "userName": username, "entitlements": [{"value": "workspace-access"}, {"value": "allow-cluster-create"}]}
+
+    def remove_entitlements(self, user_id: str, entitlements: List[str]):
+        self.removed[user_id] = entitlements
+
+
+class FakeClient:
+    def __init__(self):
+        self.scim = type("Scim", (), {"users": FakeScimUsers()})()
+
+
+class TestWorkspaceSetupUsers(unittest.TestCase):
+
+    def test_create_user_removes_entitlements(self):
+        setup: WorkspaceSetup = WorkspaceSetup.__new__(WorkspaceSetup)
+        setup._WorkspaceSetup__account_config = FakeAccountConfig(1)
+
+        trio = FakeTrio(FakeWorkspaceConfig("classroom-000"))
+        trio.client = FakeClient()
+
+        setup._WorkspaceSetup__create_user(trio, "student@example.com", None)
+        setup._WorkspaceSetup__create_user(trio, "admin@example.com", None)
+
+        self.assertEqual({"student@example.com": ["allow-cluster-create", "workspace-access"]}, trio.client.scim.users.removed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -110,11 +110,12 @@ class Classroom(object):
             folder_name = self.extract_filename(source_url)
         if last_student is None:
             last_student = self.num_students
-        content = self.databricks.workspace.read_data_from_url(source_url, format="DBC")
+        from dbacademy.clients.rest.streaming import download_file
+        local_file_path = download_file(source_url)
         for i in range(first_student, last_student + 1):
             user_name = self.username_pattern.format(student_number=i)
             folder_path = f"/Users/{user_name}/{folder_name}"
-            self.databricks.workspace.import_from_data(content, folder_path, format="DBC", if_exists="ignore")
+            self.databricks.workspace.import_from_file(local_file_path, folder_path, format="DBC", if_exists="ignore")
 
     def create_users(self, last_student=None, first_student=0, allow_cluster_create=False):
         """
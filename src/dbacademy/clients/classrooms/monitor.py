@@ -1,10 +1,10 @@
-from typing import Dict, Any, List, Callable, cast, Optional
+from typing import Dict, Any, List, Callable, cast, Optional, Iterable, Iterator, Mapping, Tuple
 
 from dbacademy.clients.dougrest import DatabricksApi
 from dbacademy.clients.dougrest.accounts.workspaces import Workspace
 from dbacademy.clients.rest.common import DatabricksApiException
 
-__all__ = ["Commands", "scan_workspaces", "find_workspace"]
+__all__ = ["Commands", "scan_workspaces", "scan_workspaces_streaming", "ScanCheckpoint", "find_workspace"]
 
 
 class Commands(object):
@@ -1020,44 +1020,150 @@ def find_workspace(workspaces: List[DatabricksApi], *, name: str = None, url: st
         raise Exception("getWorkspace: must provide workspace name or url")
 
 
-def scan_workspaces(function: Callable[[Workspace], Any], workspaces: List[DatabricksApi], *,
-                    url: str = None, name: str = None, ignore_connection_errors: bool = False):
+def _filter_workspaces(workspaces: Iterable[DatabricksApi], *, url: str = None, name: str = None) -> Iterable[Workspace]:
+    if name:
+        return (w for w in workspaces if w["workspace_name"] == name)
+    elif url:
+        return (w for w in workspaces if url in w.url)
+    else:
+        return workspaces
+
+
+def _check_workspace(function: Callable[[Workspace], Any], ws: Workspace,
+                     ignore_connection_errors: bool) -> Iterator[Tuple[Workspace, Optional[Mapping], Optional[Exception]]]:
     from requests.exceptions import ConnectionError, HTTPError
     from collections.abc import Mapping, Iterable
+    try:
+        result = function(ws)
+        # Standardize results as an iterator of OrderedDict.
+        if not result:
+            result = ()
+        elif not isinstance(result, Iterable) or isinstance(result, str) or isinstance(result, Mapping):
+            result = (result,)
+        for r in result:
+            if not isinstance(r, Mapping):
+                r = {"result": r}
+            yield ws, r, None
+    except DatabricksApiException as e:
+        yield ws, None, e
+    except ConnectionError as e:
+        if not ignore_connection_errors:
+            yield ws, None, e
+    except HTTPError as e:
+        yield ws, None, e
+    # except Exception as e:
+    #     yield ws, None, e
+
+
+def _without_connection_errors(rows: List[Tuple[Workspace, Optional[Mapping], Optional[Exception]]]) -> List[Tuple[Workspace, Optional[Mapping], Optional[Exception]]]:
+    """Applies ignore_connection_errors to rows that were checked without it, e.g. so that a checkpoint sees the error."""
+    from requests.exceptions import ConnectionError
+    return [row for row in rows if not isinstance(row[2], ConnectionError)]
+
+
+class ScanCheckpoint(object):
+    """
+    Persists the outcome of each workspace in a scan to a local JSONL file as soon as it completes, so that an
+    interrupted scan can be resumed.  Workspaces whose most recent record succeeded are skipped when rescanned and
+    their saved results are returned instead; failed or missing workspaces are scanned again.
+    """
+
+    def __init__(self, path: str):
+        import threading
+        self.path = path
+        self.__lock = threading.Lock()
+        self.__completed: Dict[str, List[Dict]] = self.__load()
+
+    def __load(self) -> Dict[str, List[Dict]]:
+        import json
+        import os
+
+        completed = dict()
+        if not os.path.exists(self.path):
+            return completed
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # A partial line written when the previous scan was interrupted.
+                if record.get("status") == "success":
+                    completed[record["workspace"]] = record.get("results", [])
+                else:
+                    completed.pop(record["workspace"], None)
+        return completed
+
+    @staticmethod
+    def key(ws: Workspace) -> str:
+        return ws.url
+
+    def is_complete(self, ws: Workspace) -> bool:
+        """Returns true if the workspace was scanned successfully by a previous run."""
+        return self.key(ws) in self.__completed
+
+    def results(self, ws: Workspace) -> List[Tuple[Workspace, Optional[Mapping], Optional[Exception]]]:
+        """Returns the saved results of a completed workspace, in the form produced by the scan."""
+        return [(ws, r, None) for r in self.__completed.get(self.key(ws), [])]
+
+    def record(self, ws: Workspace, rows: List[Tuple[Workspace, Optional[Mapping], Optional[Exception]]]) -> None:
+        """
+        Appends the outcome of scanning a workspace to the checkpoint file.  The rows must include every exception
+        caught, including connection errors that the scan itself ignores, since any exception marks the workspace as
+        failed.  Results that cannot be saved as JSON are also recorded as a failure, so that a resumed scan rescans
+        the workspace rather than returning results whose types have changed.
+        """
+        import json
+        import os
+        import time
+
+        exceptions = [str(e) for _, _, e in rows if e is not None]
+        results = [dict(r) for _, r, _ in rows if r is not None]
+        record = {
+            "workspace": self.key(ws),
+            "deployment": ws.get("deployment_name"),
+            "status": "error" if exceptions else "success",
+            "results": results,
+            "exception": exceptions[0] if exceptions else None,
+            "timestamp": time.time(),
+        }
+        try:
+            line = json.dumps(record) + "\n"
+        except (TypeError, ValueError) as e:
+            record.update(status="error", results=[], exception=f"The results cannot be saved as JSON: {e}")
+            line = json.dumps(record) + "\n"
+
+        with self.__lock:
+            with open(self.path, "a") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            if record["status"] == "success":
+                self.__completed[record["workspace"]] = results
+            else:
+                self.__completed.pop(record["workspace"], None)
+
+
+def scan_workspaces(function: Callable[[Workspace], Any], workspaces: List[DatabricksApi], *,
+                    url: str = None, name: str = None, ignore_connection_errors: bool = False,
+                    checkpoint_path: str = None):
     from itertools import chain
     from collections import OrderedDict
     from pyspark.sql import Row
-    if name:
-        workspaces = (w for w in workspaces if w["workspace_name"] == name)
-    elif url:
-        workspaces = (w for w in workspaces if url in w.url)
+    workspaces = _filter_workspaces(workspaces, url=url, name=name)
+    checkpoint = ScanCheckpoint(checkpoint_path) if checkpoint_path else None
 
     def check_workspace(ws: Workspace):
-        try:
-            result = function(ws)
-            # Standardize results as an iterator of OrderedDict.
-            if not result:
-                result = ()
-            elif not isinstance(result, Iterable) or isinstance(result, str) or isinstance(result, Mapping):
-                result = (result,)
-            for r in result:
-                if not isinstance(r, Mapping):
-                    r = {"result": r}
-                yield ws, r, None
-        except DatabricksApiException as e:
-            yield ws, None, e
-        except ConnectionError as e:
-            if not ignore_connection_errors:
-                yield ws, None, e
-        except HTTPError as e:
-            yield ws, None, e
-
-    #     except Exception as e:
-    #       yield (w, None, e)
+        if checkpoint and checkpoint.is_complete(ws):
+            return checkpoint.results(ws)
+        if not checkpoint:
+            return list(_check_workspace(function, ws, ignore_connection_errors))
+        rows = list(_check_workspace(function, ws, False))
+        checkpoint.record(ws, rows)
+        return _without_connection_errors(rows) if ignore_connection_errors else rows
 
     from multiprocessing.pool import ThreadPool
     with ThreadPool(500) as pool:
-        map_results = pool.map(lambda w: list(check_workspace(w)), workspaces)
+        map_results = pool.map(check_workspace, workspaces)
 
     # Determine the schema for the results and turn it into a pretty dataframe cs
     example = OrderedDict()
@@ -1096,3 +1202,131 @@ def scan_workspaces(function: Callable[[Workspace], Any], workspaces: List[Datab
         pprint(results)
         print("-----")
         return results
+
+
+def scan_workspaces_streaming(function: Callable[[Workspace], Any], workspaces: Iterable[DatabricksApi], *,
+                              url: str = None, name: str = None, ignore_connection_errors: bool = False,
+                              max_workers: int = 50, timeout_seconds: float = None,
+                              progress_seconds: Optional[float] = 10,
+                              checkpoint_path: str = None) -> Iterator[Tuple[Workspace, Optional[Mapping], Optional[Exception]]]:
+    """
+    Like scan_workspaces(), but yields each (workspace, result, exception) tuple as soon as its workspace completes
+    instead of displaying all results at the end.  At most `max_workers` workspaces are scanned at once, and
+    workspaces are only read from `workspaces` as capacity frees up, so memory stays bounded.
+
+    Args:
+        function: The function to apply to each workspace.
+        workspaces: The workspaces to scan.
+        url: Only scan the workspaces whose url contains this value.
+        name: Only scan the workspace with this name.
+        ignore_connection_errors: If true, workspaces that cannot be reached are omitted from the results.
+        max_workers: The maximum number of workspaces scanned concurrently.
+        timeout_seconds: If set, a workspace still running after this many seconds is reported with a TimeoutError.
+            Its thread is abandoned rather than stopped and keeps counting against `max_workers` until it returns, so a
+            scan whose workers have all timed out waits for one of them to finish before starting another workspace.
+        progress_seconds: How often to print progress (done/total, rate and ETA).  None disables progress.
+        checkpoint_path: If set, each workspace's outcome is appended to this JSONL file as it completes, and
+            workspaces that succeeded in a previous run are answered from the file instead of being rescanned.
+
+    Returns:
+        A generator of (workspace, result, exception) tuples, in order of completion.
+
+    Raises:
+        Any exception raised by `function` other than the API and connection errors captured by scan_workspaces().
+    """
+    import queue
+    import time
+    from collections.abc import Sized
+    from multiprocessing.pool import ThreadPool
+
+    total = len(workspaces) if isinstance(workspaces, Sized) and not (url or name) else None
+    workspaces = iter(_filter_workspaces(workspaces, url=url, name=name))
+    completed = queue.Queue()
+    running: Dict[int, Tuple[Workspace, float]] = dict()  # task id -> (workspace, start time)
+    abandoned = 0  # Timed out tasks whose threads are still working
+    next_task_id = 0
+    exhausted = False
+    done = 0
+    start = last_report = time.time()
+    checkpoint = ScanCheckpoint(checkpoint_path) if checkpoint_path else None
+
+    def run(task_id: int, ws: Workspace):
+        try:
+            # Connection errors are ignored only once the checkpoint has recorded them, see below.
+            rows = list(_check_workspace(function, ws, ignore_connection_errors and not checkpoint))
+            completed.put((task_id, rows, None))
+        except BaseException as ex:
+            completed.put((task_id, None, ex))
+
+    def report():
+        elapsed = time.time() - start
+        rate = done / elapsed if elapsed > 0 else 0.0
+        if total is None:
+            print(f"Scanned {done} workspaces in {elapsed:.0f}s ({rate:.1f}/s)")
+        else:
+            eta = f"{(total - done) / rate:.0f}s" if rate > 0 else "unknown"
+            print(f"Scanned {done}/{total} workspaces in {elapsed:.0f}s ({rate:.1f}/s), ETA {eta}")
+
+    # Tasks are only submitted while a worker is free, so each starts, and its timeout is measured, immediately.
+    pool = ThreadPool(max_workers)
+    try:
+        while True:
+            while not exhausted and len(running) + abandoned < max_workers:
+                ws = next(workspaces, None)
+                if ws is None:
+                    exhausted = True
+                elif checkpoint and checkpoint.is_complete(ws):
+                    done += 1
+                    yield from checkpoint.results(ws)
+                else:
+                    running[next_task_id] = (ws, time.time())
+                    pool.apply_async(run, (next_task_id, ws))
+                    next_task_id += 1
+
+            if not running and (exhausted or abandoned == 0):
+                break  # Abandoned tasks are only waited for while there are workspaces left to scan.
+
+            wait_seconds = progress_seconds
+            if timeout_seconds is not None and running:
+                oldest = min(started for _, started in running.values())
+                deadline = max(0.0, oldest + timeout_seconds - time.time())
+                wait_seconds = deadline if wait_seconds is None else min(wait_seconds, deadline)
+
+            try:
+                task_id, rows, error = completed.get(timeout=wait_seconds)
+            except queue.Empty:
+                task_id, rows, error = None, None, None
+
+            if task_id in running:
+                ws, _ = running.pop(task_id)
+                done += 1
+                if error is not None:
+                    raise error
+                if checkpoint:
+                    checkpoint.record(ws, rows)
+                    if ignore_connection_errors:
+                        rows = _without_connection_errors(rows)
+                yield from rows
+            elif task_id is not None:
+                abandoned -= 1  # A timed out task finally returned; its results are dropped and never recorded.
+
+            if timeout_seconds is not None:
+                now = time.time()
+                for task_id, (ws, started) in list(running.items()):
+                    if now - started >= timeout_seconds:
+                        del running[task_id]
+                        abandoned += 1
+                        done += 1
+                        row = (ws, None, TimeoutError(f"Workspace {ws.url} did not complete within {timeout_seconds} seconds."))
+                        if checkpoint:
+                            checkpoint.record(ws, [row])
+                        yield row
+
+            if progress_seconds is not None and time.time() - last_report >= progress_seconds:
+                last_report = time.time()
+                report()
+    finally:
+        pool.terminate()  # Returns without waiting for abandoned threads, which are daemons.
+
+    if progress_seconds is not None:
+        report()
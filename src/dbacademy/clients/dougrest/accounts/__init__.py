@@ -22,6 +22,7 @@ class AccountsApi(ApiClient):
                  user: str = None, password: str = None,
                  token: str = None,
                  cloud: Cloud = "AWS") -> None:
+        from urllib.parse import urlparse
         if cloud == "AWS":
             url = f'https://accounts.cloud.databricks.com/api/2.0/accounts/{account_id}'
         elif cloud == "GCP":
@@ -34,6 +35,8 @@ class AccountsApi(ApiClient):
         self.session.headers["X-Databricks-Account-Console-API-Version"] = "2.0"
         self.user = user
         self.account_id = account_id
+        # Accounts share a hostname, so each account gets its own rate limit bucket.
+        self.rate_limit_key = f"{urlparse(url).hostname}/{account_id}"
         self.budgets = Budgets(self)
         self.credentials = Credentials(self)
         self.keys = CustomerManagedKeys(self)
@@ -1,7 +1,23 @@
 from __future__ import annotations
 
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 from dbacademy.clients.rest.common import *
 
+if TYPE_CHECKING:
+    from dbacademy.clients.dougrest.clusters import Clusters
+    from dbacademy.clients.dougrest.groups import Groups
+    from dbacademy.clients.dougrest.jobs import Jobs
+    from dbacademy.clients.dougrest.mlflow import MLFlow
+    from dbacademy.clients.dougrest.pools import Pools
+    from dbacademy.clients.dougrest.repos import Repos
+    from dbacademy.clients.dougrest.scim import SCIM
+    from dbacademy.clients.dougrest.scim import Users
+    from dbacademy.clients.dougrest.sql import Sql
+    from dbacademy.clients.dougrest.workspace import Workspace
+    from dbacademy.clients.rest.permissions import Permissions
+
 __all__ = ["DatabricksApi", "DatabricksApiException"]
 
 
@@ -48,33 +64,57 @@ class DatabricksApi(dict, ApiClient):
         self.default_preloaded_versions = ["11.3.x-cpu-ml-scala2.12", "11.3.x-cpu-scala2.12"]
         self.default_spark_version = self.default_preloaded_versions[0]
 
+    @cached_property
+    def clusters(self) -> Clusters:
         from dbacademy.clients.dougrest.clusters import Clusters
-        self.clusters = Clusters(self)
+        return Clusters(self)
 
+    @cached_property
+    def groups(self) -> Groups:
         from dbacademy.clients.dougrest.groups import Groups
-        self.groups = Groups(self)
+        return Groups(self)
 
+    @cached_property
+    def jobs(self) -> Jobs:
         from dbacademy.clients.dougrest.jobs import Jobs
-        self.jobs = Jobs(self)
+        return Jobs(self)
 
+    @cached_property
+    def mlflow(self) -> MLFlow:
         from dbacademy.clients.dougrest.mlflow import MLFlow
-        self.mlflow = MLFlow(self)
+        return MLFlow(self)
 
+    @cached_property
+    def pools(self) -> Pools:
         from dbacademy.clients.dougrest.pools import Pools
-        self.pools = Pools(self)
+        return Pools(self)
 
+    @cached_property
+    def repos(self) -> Repos:
         from dbacademy.clients.dougrest.repos import Repos
-        self.repos = Repos(self)
+        return Repos(self)
+
+    @cached_property
+    def scim(self) -> SCIM:
+        from dbacademy.clients.dougrest.scim import SCIM
+        return SCIM(self)
 
-        from dbacademy.clients.dougrest.scim import SCIM, Users
-        self.scim = SCIM(self)
-        self.users = Users(self)
+    @cached_property
+    def users(self) -> Users:
+        from dbacademy.clients.dougrest.scim import Users
+        return Users(self)
 
+    @cached_property
+    def sql(self) -> Sql:
         from dbacademy.clients.dougrest.sql import Sql
-        self.sql = Sql(self)
+        return Sql(self)
 
+    @cached_property
+    def workspace(self) -> Workspace:
         from dbacademy.clients.dougrest.workspace import Workspace
-        self.workspace = Workspace(self)
+        return Workspace(self)
 
+    @cached_property
+    def permissions(self) -> Permissions:
         from dbacademy.clients.rest.permissions import Permissions
-        self.permissions = Permissions(self)
+        return Permissions(self)
@@ -170,8 +170,15 @@ class Workspace(ApiContainer):
     # TODO Rename parameter "format"
     # noinspection PyShadowingBuiltins
     def import_from_url(self, source_url, workspace_path, format="DBC", *, if_exists="error"):
+        if format == "DBC":
+            # Streamed to disk and reused across calls, rather than downloaded and held in memory for every import.
+            from dbacademy.clients.rest.streaming import download_file
+            local_file_path = download_file(source_url)
+            return self.import_from_file(local_file_path, workspace_path, format, if_exists=if_exists)
+
+        # Base64 encoded whatever the format, as the import API expects.
         content = self.read_data_from_url(source_url)
-        self.import_from_data(content, workspace_path, format, if_exists=if_exists)
+        return self.import_from_data(content, workspace_path, format, if_exists=if_exists)
 
     # TODO Rename parameter "format"
     # noinspection PyShadowingBuiltins
@@ -182,6 +189,21 @@ class Workspace(ApiContainer):
             "format": format,
             "language": language,
         }
+        return self.__import(data, workspace_path, if_exists)
+
+    # TODO Rename parameter "format"
+    # noinspection PyShadowingBuiltins
+    def import_from_file(self, local_file_path, workspace_path, format="DBC", *, language=None, if_exists="error"):
+        """Like import_from_data, but the content is read from a local file and base64 encoded as it is sent."""
+        from dbacademy.clients.rest.streaming import Base64FileBody
+        data = Base64FileBody({
+            "path": workspace_path,
+            "format": format,
+            "language": language,
+        }, "content", local_file_path)
+        return self.__import(data, workspace_path, if_exists)
+
+    def __import(self, data, workspace_path, if_exists):
         try:
             return self.databricks.api("POST", "2.0/workspace/import", data)
         except DatabricksApiException as e:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Container, Dict, Type, TypeVar, Union
+from typing import Any, Container, Dict, Optional, Tuple, Type, TypeVar, Union
 
 try:
     from typing import Literal
@@ -10,9 +10,14 @@ except ImportError:
 from pprint import pformat
 import requests
 
+from dbacademy.clients.rest.connection_pool import connection_pool_manager
+from dbacademy.clients.rest.rate_limiter import rate_limiter
+from dbacademy.clients.rest.retry import RetryPolicy
+from dbacademy.clients.rest.streaming import Base64FileBody
+
 __all__ = ["ApiContainer", "ApiClient", "DatabricksApiException",
            "HttpStatusCodes", "HttpMethod", "HttpReturnType", "IfNotExists", "IfExists",
-           "Item", "ItemId", "ItemOrId", "Cloud"]
+           "Item", "ItemId", "ItemOrId", "Cloud", "RetryPolicy"]
 
 HttpStatusCodes = Union[int, Container[int]]
 HttpMethod = Literal["GET", "PUT", "POST", "DELETE", "PATCH", "HEAD", "OPTIONS"]
@@ -62,7 +67,13 @@ class ApiClient(ApiContainer):
     url: str = None
     dns_verify: bool = True
     dns_retry: bool = False
+    dns_cache_seconds: float = 5 * 60        # How long a successful DNS lookup is trusted
+    dns_negative_cache_seconds: float = 10   # How long a failed DNS lookup is remembered
     trace: bool = False
+    rate_limit_key: str = None  # Shared rate limit bucket for this client, defaults to the request's hostname
+
+    # Process-wide DNS lookup results, hostname -> (resolved, expiry per time.monotonic())
+    _dns_cache: Dict[str, Tuple[bool, float]] = dict()
 
     def __init__(self,
                  url: str,
@@ -73,6 +84,7 @@ class ApiClient(ApiContainer):
                  authorization_header: str = None,
                  client: ApiClient = None,
                  throttle_seconds: int = 0,
+                 retry_policy: RetryPolicy = None,
                  verbose: bool = False):
         """
         Create a Databricks REST API client.
@@ -86,10 +98,11 @@ class ApiClient(ApiContainer):
                 By default, it's generated from the token or password.
             client: A parent ApiClient from which to clone settings.
             throttle_seconds: Number of seconds to sleep between requests.
+            retry_policy: Determines which failed requests are retried and the backoff between attempts.
+                Defaults to the parent client's policy, if any, else to RetryPolicy().
         """
         super().__init__()
         import requests
-        # from urllib3.util.retry import Retry
         from requests.adapters import HTTPAdapter
 
         # Precluding python warning.
@@ -138,40 +151,25 @@ class ApiClient(ApiContainer):
         self._last_request_timestamp = 0
         self.verbose = verbose
         self.authorization_header = authorization_header
-        self.max_retries = 25
-
-        # Reference information for this backoff/retry issues
-        # https://stackoverflow.com/questions/47675138/how-to-override-backoff-max-while-working-with-requests-retry
-
-        # backoff_factor = self.connect_timeout                            # Default is 5
 
-        # noinspection PyUnresolvedReferences
-        # BACKOFF_MAX is not a real parameter but the documented parameter advertised DEFAULT_BACKOFF_MAX doesn't actually exist.
-        # connection_retries = Retry.BACKOFF_MAX / backoff_factor  # Should be 24
-
-        # retry = Retry(connect=connection_retries,                # Retry Connect errors N times
-        #               backoff_factor=backoff_factor,             # A backoff factor to apply between attempts after the second try
-        #               total=connection_retries,                  # Overrides all other retry counts
-        #               allowed_methods=["GET", "DELETE", "PUT"],  # Only retry for idempotent http-verbs
-        #               status=connection_retries,                 # Retry for status_forcelist errors N times
-        #               status_forcelist=[429])                    # list of codes to force a retry for
-        #
-        # retry = Retry(connect=connection_retries, backoff_factor=backoff_factor, status=connection_retries)
-
-        # retry = Retry(connect=connection_retries,
-        #               backoff_factor=backoff_factor)
+        if retry_policy is not None:
+            self.retry_policy = retry_policy
+        elif client is not None:
+            self.retry_policy = client.retry_policy
+        else:
+            self.retry_policy = RetryPolicy()
 
         self.session = requests.Session()
         self.session.headers = {'Authorization': self.authorization_header, 'Content-Type': 'text/json'}
         
-        self.http_adapter = HTTPAdapter()
-        # self.http_adapter = HTTPAdapter(max_retries=retry)
+        # Reuse the process-wide connection pools when they are enabled, see ConnectionPoolManager.
+        self.http_adapter = connection_pool_manager.adapter or HTTPAdapter()
 
         # noinspection HttpUrlsUsage
         self.session.mount('http://', self.http_adapter)
         self.session.mount('https://', self.http_adapter)
 
-    def api(self, _http_method: HttpMethod, _endpoint_path: str, _data: dict = None, *,
+    def api(self, _http_method: HttpMethod, _endpoint_path: str, _data: Union[dict, Base64FileBody] = None, *,
             _expected: HttpStatusCodes = None, _result_type: Type[HttpReturnType] = dict,
             _base_url: str = None, **data: Any) -> HttpReturnType:
         """
@@ -182,6 +180,7 @@ class ApiClient(ApiContainer):
             _endpoint_path: The path to append to the URL for the API endpoint, excluding the leading '/'.
                 For example: path="2.0/secrets/put"
             _data: Payload to attach to the HTTP request.  GET requests encode as params, all others as json.
+                A Base64FileBody is streamed from disk as the json body instead, and cannot be combined with **data.
             _expected: HTTP response status codes to treat as expected rather than as an error.
             _result_type: Determines what type of result is returned.  It may be any of the following:
                str: Return the body as a text str.
@@ -199,13 +198,17 @@ class ApiClient(ApiContainer):
         Raises:
             requests.HTTPError: If the API returns an error and on_error='raise'.
         """
-        import json, time, math
-        from urllib.parse import urljoin
+        import json, time
+        from urllib.parse import urljoin, urlparse
 
         if _data is None:
             _data = {}
 
-        if data:
+        if isinstance(_data, Base64FileBody):
+            assert _http_method not in ('GET', 'HEAD', 'OPTIONS'), f"A Base64FileBody cannot be sent with {_http_method}."
+            assert not data, "Additional kwargs cannot be appended to a Base64FileBody, include them in its payload."
+
+        elif data:
             _data = _data.copy()
             _data.update(data)
 
@@ -224,45 +227,55 @@ class ApiClient(ApiContainer):
         
         url = _base_url + _endpoint_path.lstrip("/")
         timeout = (self.connect_timeout, self.read_timeout)
-        connection_errors = 0
-
-        verbose = False  # Enabling debug prints
-        response = None  # Precluding warning
-        attempts = 0     # Counter for debugging
-
-        for attempt in range(self.max_retries):
+        rate_limit_key = self.rate_limit_key or urlparse(url).hostname
+        policy = self.retry_policy
+        start = time.time()
+
+        verbose = False        # Enabling debug prints
+        response = None        # Precluding warning
+        last_exception = None  # The connection error from the final attempt, if any
+        attempts = 0           # Counter for debugging
+
+        for attempt in range(policy.max_retries):
+            attempts = attempt
+            rate_limiter.acquire(rate_limit_key)
             try:
                 if _http_method in ('GET', 'HEAD', 'OPTIONS'):
                     params = {k: str(v).lower() if isinstance(v, bool) else v for k, v in _data.items()}
                     if self.trace:
                         print(f"{_http_method} {url}: {params=}")
                     response = self.session.request(_http_method, url, params=params, timeout=timeout)
+                elif isinstance(_data, Base64FileBody):
+                    if self.trace:
+                        print(f"{_http_method} {url}: data={_data}")
+                    # A fresh stream for every attempt, as a retried request must resend the body from the start.
+                    response = self.session.request(_http_method, url, data=_data.open(), timeout=timeout)
                 else:
                     json_data = json.dumps(_data)
                     if self.trace:
                         print(f"{_http_method} {url}: data={json_data}")
                     response = self.session.request(_http_method, url, data=json_data, timeout=timeout)
+                last_exception = None
 
-                if response.status_code == 500:
-                    if "REQUEST_LIMIT_EXCEEDED" not in response.text:
-                        attempts = attempt
-                        break  # Don't retry, this is a hard fail, not rate-limited
-                elif response.status_code not in [429]:
-                    attempts = attempt
+                if not policy.should_retry_response(_http_method, response):
                     break  # Don't retry, either we passed or it's a hard fail.
 
             except requests.exceptions.ConnectionError as e:
-                connection_errors += 1
-                if connection_errors >= 2:
+                if not policy.should_retry_exception(_http_method, e):
                     raise e
+                response = None
+                last_exception = e
 
-            # Attempt 1=1s, 2=1s, 3=5s, 4=16s, 5=13s, etc...
-            duration = math.ceil(attempt * attempt / 2)
+            duration = policy.backoff(attempt, response)
+            if attempt + 1 >= policy.max_retries or time.time() - start + duration > policy.max_total_seconds:
+                break  # Out of retries, the final response or exception is reported below.
             if verbose:
-                print(f"Retrying after {duration}s, attempt {attempt+1} of {self.max_retries+1}: {_http_method} {url}")
+                print(f"Retrying after {duration:.1f}s, attempt {attempt+1} of {policy.max_retries}: {_http_method} {url}")
             time.sleep(duration)
 
-        if response is None:  # "None" should never happen
+        if last_exception is not None:
+            raise last_exception
+        elif response is None:  # "None" should never happen
             raise Exception("Unexpected processing error; the final response was None")
         else:  # Always validate the final response
             self._raise_for_status(response, _expected)
@@ -291,31 +304,71 @@ class ApiClient(ApiContainer):
                 }
         # TODO @doug.bateman: missing else clause
 
+    @property
+    def max_retries(self) -> int:
+        """The maximum number of attempts made for a single request, as configured by the retry_policy."""
+        return self.retry_policy.max_retries
+
+    @max_retries.setter
+    def max_retries(self, max_retries: int) -> None:
+        import copy
+
+        # The policy may be shared with this client's parent or children, so change a copy of it rather than theirs.
+        self.retry_policy = copy.copy(self.retry_policy)
+        self.retry_policy.max_retries = max_retries
+
+    def set_rate_limit(self, requests_per_second: Optional[float], burst: float = None) -> None:
+        """
+        Sets the process-wide requests-per-second budget shared by every client using this client's rate_limit_key.
+
+        Args:
+            requests_per_second: The sustained request rate, or None to remove the limit.
+            burst: The number of requests that may be sent back-to-back.  Defaults to max(1, requests_per_second).
+        """
+        from urllib.parse import urlparse
+        rate_limiter.set_rate(self.rate_limit_key or urlparse(self.url).hostname, requests_per_second, burst)
+
     def _verify_hostname(self, url: str) -> None:
-        """Verify the host for the url-endpoint exists.  Throws socket.gaierror if it does not."""
+        """
+        Verify the host for the url-endpoint exists.  Throws requests.exceptions.ConnectionError if it does not.
+
+        Lookups are cached per hostname, for dns_cache_seconds when they succeed and for dns_negative_cache_seconds
+        when they fail.  Cached failures are ignored when dns_retry is set, as the hostname may still be propagating.
+        """
         import time
         from urllib.parse import urlparse
         from socket import gethostbyname, gaierror
         from requests.exceptions import ConnectionError
 
-        if not self.dns_retry:
-            url = urlparse(url)
+        hostname = urlparse(url).hostname
+        cached = ApiClient._dns_cache.get(hostname)
+        if cached is not None and cached[1] > time.monotonic():
+            if cached[0]:
+                return
+            elif not self.dns_retry:
+                raise ConnectionError(f"""DNS lookup for hostname failed for "{hostname}".""")
+
+        retries = 10 if self.dns_retry else 1
+        last_exception = None
+        for i in range(0, retries):
             try:
-                gethostbyname(url.hostname)
+                gethostbyname(hostname)
+                ApiClient._dns_cache[hostname] = (True, time.monotonic() + self.dns_cache_seconds)
+                return
             except gaierror as e:
-                raise ConnectionError(f"""DNS lookup for hostname failed for "{url.hostname}".""") from e
-        else:
-            retries = 10
-            last_exception = None
-            url = urlparse(url)
-            for i in range(0, retries):
-                try:
-                    gethostbyname(url.hostname)
-                    return
-                except gaierror as e:
-                    last_exception = e
+                last_exception = e
+                if i + 1 < retries:
                     time.sleep(i*2)
-            raise ConnectionError(f"""DNS lookup for hostname failed for "{url.hostname}" after {retries} retries.""") from last_exception
+
+        ApiClient._dns_cache[hostname] = (False, time.monotonic() + self.dns_negative_cache_seconds)
+        if not self.dns_retry:
+            raise ConnectionError(f"""DNS lookup for hostname failed for "{hostname}".""") from last_exception
+        raise ConnectionError(f"""DNS lookup for hostname failed for "{hostname}" after {retries} retries.""") from last_exception
+
+    @staticmethod
+    def clear_dns_cache() -> None:
+        """Forget all cached hostname lookups made by _verify_hostname()."""
+        ApiClient._dns_cache.clear()
 
     def _throttle_calls(self):
         if self.throttle_seconds <= 0:
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Optional
+import threading
+
+from requests.adapters import HTTPAdapter
+
+__all__ = ["ConnectionPoolManager", "connection_pool_manager"]
+
+
+class ConnectionPoolManager(object):
+    """
+    Optionally shares one requests HTTPAdapter, and therefore one set of urllib3 connection pools, between every
+    ApiClient created in the process.  Clients keep their own requests.Session (and so their own Authorization
+    headers) but reuse keep-alive connections to each host instead of opening a private pool per client.
+
+    Sharing is off by default.  Call enable() before creating clients; clients created earlier keep their own pools.
+    """
+
+    def __init__(self):
+        self.__adapter: Optional[HTTPAdapter] = None
+        self.__lock = threading.Lock()
+
+    @property
+    def adapter(self) -> Optional[HTTPAdapter]:
+        """The shared adapter, or None if sharing is disabled."""
+        return self.__adapter
+
+    def enable(self, *, pool_connections: int = 100, pool_maxsize: int = 10, pool_block: bool = False) -> HTTPAdapter:
+        """
+        Create the shared adapter used by every ApiClient constructed from now on.
+
+        Args:
+            pool_connections: The number of per-host connection pools kept; the least recently used host's pool is
+                discarded beyond this.
+            pool_maxsize: The maximum number of connections kept open to each host.
+            pool_block: If true, requests wait for a free connection rather than opening one beyond pool_maxsize,
+                bounding the total number of open sockets to pool_connections * pool_maxsize.
+
+        Returns:
+            The new shared adapter.
+        """
+        with self.__lock:
+            self.__adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+            return self.__adapter
+
+    def disable(self) -> None:
+        """Stop sharing; clients constructed from now on get their own adapter.  Existing clients are unaffected."""
+        with self.__lock:
+            self.__adapter = None
+
+
+connection_pool_manager = ConnectionPoolManager()
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from dbacademy.clients.rest.common import *
 
@@ -17,6 +17,10 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
     * _update(item)
     * _delete(item_id)
     * _wrap(item)
+
+    Name lookups normally list every item on each call.  Call enable_index() to serve repeated lookups from a
+    local name-to-item index instead, refreshed after a TTL and invalidated whenever this object creates, updates or
+    deletes an item.
     """
 
     def __init__(self,
@@ -36,11 +40,19 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
         self.plural = plural or self.singular + "s"
         self.id_key = id_key or noun + "_id"
         self.name_key = name_key or noun + "_name"
-        # Update doc strings, replacing placeholders with actual values.
+        self.index_ttl_seconds: Optional[float] = None  # None when the index is disabled
+        self._index: Optional[Tuple[float, Dict[str, Item]]] = None  # (expiry, items by name)
+        # Update doc strings, replacing placeholders with actual values, once per subclass.
+        if not type(self).__dict__.get("_CRUD__docs_formatted", False):
+            self.__format_docs()
+
+    def __format_docs(self) -> None:
         cls = type(self)
+        cls.__docs_formatted = True
         methods = [attr for attr in dir(cls) if not attr.startswith("__") and callable(getattr(cls, attr))]
         for name in methods:
             m = getattr(cls, name)
+            m = getattr(m, "__func__", m)  # Bound classmethods have a read-only __doc__
             if isinstance(m.__doc__, str):
                 m.__doc__ = m.__doc__.format(**self.__dict__)
 
@@ -96,6 +108,50 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
                 result[self.id_key] = item_id
             return result
 
+    def enable_index(self, ttl_seconds: float = 60) -> None:
+        """
+        Serve name lookups from a local index of all {plural}, re-listed from the server at most every `ttl_seconds`.
+        The index is invalidated whenever an item is created, updated or deleted through this object.
+        """
+        self.index_ttl_seconds = ttl_seconds
+        self._index = None
+
+    def disable_index(self) -> None:
+        """Stop caching {plural}; every name lookup will query the server again."""
+        self.index_ttl_seconds = None
+        self._index = None
+
+    def invalidate_index(self) -> None:
+        """Discard the cached index so that the next lookup re-lists the {plural}."""
+        self._index = None
+
+    def _list_items(self) -> List[Item]:
+        """
+        Call _list(), rebuilding the index from the results if it is enabled.
+        """
+        import time
+        items = self._list()
+        if self.index_ttl_seconds is not None and items is not None:
+            by_name = dict()
+            for item in items:
+                if self.name_key in item:
+                    by_name.setdefault(item[self.name_key], item)  # Keep the first match, as _list() would
+            self._index = (time.monotonic() + self.index_ttl_seconds, by_name)
+        return items
+
+    def _lookup_by_name(self, item_name: str) -> Optional[Item]:
+        """
+        Returns the first raw item with the given name, from the index if it is enabled and current.
+        """
+        import time
+        if self.index_ttl_seconds is None:
+            return next((item for item in self._list() if item[self.name_key] == item_name), None)
+        index = self._index
+        if index is None or index[0] <= time.monotonic():
+            self._list_items()
+            index = self._index
+        return None if index is None else index[1].get(item_name)
+
     def _item_id(self, item: Item):
         """
         If `item` has `{id_key}` set, that value is returned.
@@ -120,14 +176,14 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
     def list(self) -> List[Item]:
         """Returns a list of all {plural}."""
         from typing import Sequence
-        result = self._list()
+        result = self._list_items()
         if not isinstance(result, Sequence):
             raise ValueError(f"Invalid response.  Expected list, found {result!r}")
         return [self._refresh(item) for item in result]
 
     def list_names(self) -> List[str]:
         """Returns a list the names of all {plural}."""
-        return [item[self.name_key] for item in self._list()]
+        return [item[self.name_key] for item in self._list_items()]
 
     def get_by_id(self, item_id: ItemId, if_not_exists: IfNotExists = "error") -> Item:
         """
@@ -175,7 +231,7 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
         Raises:
             DatabricksApiException: If not found and `if_not_exists=="error"`.
         """
-        result = next((item for item in self._list() if item[self.name_key] == item_name), None)
+        result = self._lookup_by_name(item_name)
 
         if result is None and if_not_exists == "error":
             raise DatabricksApiException(f"{self.singular} with name '{item_name}' not found", 404)
@@ -242,6 +298,7 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
             existing = self.get_by_example(item, if_not_exists="ignore") if if_exists != "create" else None
         if existing is None:
             result = self._create(item)
+            self.invalidate_index()
             if isinstance(result, dict):
                 return self._refresh(result, fetch)
             else:
@@ -253,6 +310,7 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
         if if_exists == "overwrite":
             self.delete_by_example(item)
             result = self._create(item)
+            self.invalidate_index()
             if isinstance(result, dict):
                 return self._refresh(result, fetch)
             else:
@@ -304,6 +362,7 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
         else:
             raise ValueError("if_not_exists must be 'ignore' or 'error'")
         result = self._update(item, _expected=expected)
+        self.invalidate_index()
         if isinstance(str, dict):
             return self._refresh(result, fetch)
         else:
@@ -332,6 +391,7 @@ class CRUD(ApiContainer, metaclass=ABCMeta):
         else:
             raise ValueError("if_not_exists must be 'ignore' or 'error'")
         result = self._delete(item_id, _expected=expected)
+        self.invalidate_index()
         return result is not None
 
     def delete_by_name(self, item_name, if_not_exists: IfNotExists = "error"):
@@ -1,7 +1,8 @@
 __all__ = ["dbrest_factory", "dougrest_factory"]
 
+import threading
 from functools import cache
-from typing import Dict, Generic, Type, TypeVar, Union, Optional
+from typing import Any, Callable, Dict, Generic, Hashable, Type, TypeVar, Union, Optional
 
 from dbacademy.dbrest.client import DBAcademyRestClient
 from dbacademy.clients.dougrest import AccountsApi, DatabricksApi
@@ -9,6 +10,77 @@ from dbacademy.clients.dougrest import AccountsApi, DatabricksApi
 ApiType = TypeVar('ApiType', bound=Union[DatabricksApi, DBAcademyRestClient])
 
 
+class AzureTokenCache(object):
+    """
+    Caches OAuth access tokens until shortly before they expire.
+
+    A token within refresh_margin_seconds of expiring is still returned, while a single background thread fetches
+    its replacement.  Callers that find no usable token wait for one fetch shared by all of them.
+    """
+
+    refresh_margin_seconds = 5 * 60
+
+    class Entry(object):
+        def __init__(self):
+            self.token: Optional[str] = None
+            self.expires_at: float = 0
+            self.refreshing = False
+            self.lock = threading.Lock()
+
+    def __init__(self):
+        self.__entries: Dict[Hashable, AzureTokenCache.Entry] = dict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable, sign_in: Callable[[], Dict[str, Any]]) -> str:
+        """
+        Returns the cached token for key, calling sign_in() for a new token response when needed.
+        """
+        import time
+
+        with self.__lock:
+            entry = self.__entries.setdefault(key, AzureTokenCache.Entry())
+            now = time.time()
+            if entry.token and now < entry.expires_at - self.refresh_margin_seconds:
+                return entry.token
+            if entry.token and now < entry.expires_at:
+                if not entry.refreshing:
+                    entry.refreshing = True
+                    threading.Thread(target=self.__refresh, args=(entry, sign_in), daemon=True).start()
+                return entry.token
+
+        with entry.lock:
+            if not entry.token or time.time() >= entry.expires_at:
+                self.__update(entry, sign_in)
+            return entry.token
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __refresh(self, entry: Entry, sign_in: Callable[[], Dict[str, Any]]) -> None:
+        try:
+            with entry.lock:
+                self.__update(entry, sign_in)
+        except Exception as e:
+            print(f"Unable to refresh the Azure token; the current token will be used until it expires: {e}")
+        finally:
+            entry.refreshing = False
+
+    @staticmethod
+    def __update(entry: Entry, sign_in: Callable[[], Dict[str, Any]]) -> None:
+        import time
+        response = sign_in()
+        token = response["access_token"]
+        if "expires_on" in response:
+            expires_at = float(response["expires_on"])
+        else:
+            expires_at = time.time() + float(response.get("expires_in", 0))
+        entry.token, entry.expires_at = token, expires_at
+
+
+azure_token_cache = AzureTokenCache()
+
+
 class ApiClientFactory(Generic[ApiType]):
 
     PROFILE_TEST = "TEST"
@@ -188,18 +260,30 @@ class ApiClientFactory(Generic[ApiType]):
 
         return clients
 
+    AZURE_DATABRICKS_SCOPE = "2ff814a6-3304-4ab8-85cb-cd0e6f879c1d/.default"
+
     @classmethod
-    def azure_token(cls, directory_id: str, principal_id: str, secret: str) -> str:
-        """Do Azure Sign-In with Service Principal"""
-        import requests
-        azure_databricks_scope = "2ff814a6-3304-4ab8-85cb-cd0e6f879c1d/.default"
-        token = requests.post(f"https://login.microsoftonline.com/{directory_id}/oauth2/v2.0/token", data={
-            'client_id': principal_id,
-            'grant_type': 'client_credentials',
-            'scope': azure_databricks_scope,
-            'client_secret': secret
-        }).json()["access_token"]
-        return token
+    def azure_token(cls, directory_id: str, principal_id: str, secret: str, *, scope: str = AZURE_DATABRICKS_SCOPE) -> str:
+        """
+        Do Azure Sign-In with Service Principal.
+
+        Tokens are cached per tenant, principal and scope until shortly before they expire, and are refreshed in
+        the background once they are within AzureTokenCache.refresh_margin_seconds of expiring.
+        """
+        import hashlib
+
+        def sign_in() -> Dict[str, Any]:
+            import requests
+            return requests.post(f"https://login.microsoftonline.com/{directory_id}/oauth2/v2.0/token", data={
+                'client_id': principal_id,
+                'grant_type': 'client_credentials',
+                'scope': scope,
+                'client_secret': secret
+            }).json()
+
+        # The secret is part of the key so that a wrong secret is never answered from the cache.
+        key = (directory_id, principal_id, scope, hashlib.sha256(secret.encode()).hexdigest())
+        return azure_token_cache.get(key, sign_in)
 
     @classmethod
     def azure_account(cls, account_id: str, directory_id: str,
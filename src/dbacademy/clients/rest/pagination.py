@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator
+
+try:
+    from typing import Literal
+except ImportError:
+    from typing_extensions import Literal
+
+from dbacademy.clients.rest.common import ApiClient, Item
+
+__all__ = ["PageStyle", "paginate"]
+
+PageStyle = Literal["offset", "token"]
+
+
+def paginate(client: ApiClient,
+             endpoint_path: str,
+             items_key: str,
+             data: Dict[str, Any] = None,
+             *,
+             style: PageStyle = "token",
+             offset: int = 0,
+             offset_key: str = "offset",
+             has_more_key: str = "has_more",
+             page_token_key: str = "page_token",
+             next_page_token_key: str = "next_page_token") -> Iterator[Item]:
+    """
+    Lazily iterate over the items of a paginated GET endpoint, fetching each page only when the previous page has
+    been consumed.  Callers that stop iterating early do not pay for the remaining pages.
+
+    Args:
+        client: The client used to invoke the API.
+        endpoint_path: The list endpoint, e.g. "2.1/jobs/list".
+        items_key: The key of the list of items in each response, e.g. "jobs".
+        data: Additional query parameters sent with every request, such as the page size.
+        style: "offset" to page by item offset until `has_more_key` is false, or
+            "token" to follow `next_page_token_key` until the response no longer includes one.
+        offset: The offset of the first item, when style is "offset".
+        offset_key: The name of the offset query parameter, when style is "offset".
+        has_more_key: The response key indicating more pages exist, when style is "offset".
+        page_token_key: The name of the page token query parameter, when style is "token".
+        next_page_token_key: The response key holding the next page's token, when style is "token".
+
+    Returns:
+        A generator yielding each item as its page arrives.
+
+    Raises:
+        ValueError: If `style` is not "offset" or "token".
+    """
+    if style not in ("offset", "token"):
+        raise ValueError(f"style must be 'offset' or 'token', found {style!r}")
+
+    data = dict(data or {})
+
+    while True:
+        if style == "offset":
+            data[offset_key] = offset
+
+        response = client.api("GET", endpoint_path, data) or {}
+        items = response.get(items_key) or []
+        yield from items
+
+        if style == "offset":
+            if not items or not response.get(has_more_key, False):
+                return
+            offset += len(items)
+        else:
+            next_page_token = response.get(next_page_token_key)
+            if not next_page_token:
+                return
+            data[page_token_key] = next_page_token
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+import threading
+
+__all__ = ["TokenBucket", "RateLimiter", "rate_limiter"]
+
+
+class TokenBucket(object):
+    """
+    A thread-safe token bucket permitting `rate` requests per second on average, with bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Args:
+            rate: The number of tokens added to the bucket per second.
+            capacity: The maximum number of tokens the bucket holds.  Defaults to max(1, rate).
+        """
+        import time
+        if rate <= 0:
+            raise ValueError(f"The rate must be greater than zero, found {rate}.")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._timestamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Takes `tokens` from the bucket, going into debt if there are not enough available.
+
+        Returns:
+            The number of seconds the caller must wait before the reserved tokens are actually available.
+        """
+        import time
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._timestamp) * self.rate)
+            self._timestamp = now
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Blocks until `tokens` are available and takes them from the bucket.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        import time
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class RateLimiter(object):
+    """
+    A registry of token buckets shared by every ApiClient in the process, keyed by hostname (or by any other key
+    an ApiClient chooses via its rate_limit_key attribute).
+
+    No limit applies to a key until one is configured with set_rate(), or unless default_rate is set, in which case
+    every key without an explicit rate gets its own bucket of default_rate requests per second.
+    """
+
+    def __init__(self, default_rate: float = None, default_burst: float = None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._buckets: Dict[str, TokenBucket] = dict()
+        self._lock = threading.Lock()
+
+    def set_rate(self, key: str, requests_per_second: Optional[float], burst: float = None) -> None:
+        """
+        Sets the requests-per-second budget for the key, replacing any prior bucket.
+
+        Args:
+            key: The hostname or other rate limit key.
+            requests_per_second: The sustained request rate, or None to remove the limit for this key.
+            burst: The number of requests that may be sent back-to-back.  Defaults to max(1, requests_per_second).
+        """
+        with self._lock:
+            if requests_per_second is None:
+                self._buckets.pop(key, None)
+            else:
+                self._buckets[key] = TokenBucket(requests_per_second, burst)
+
+    def get_bucket(self, key: str) -> Optional[TokenBucket]:
+        """Returns the bucket for the key, creating one from the default_rate if needed; None if unlimited."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None and self.default_rate is not None:
+                bucket = TokenBucket(self.default_rate, self.default_burst)
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, key: str) -> float:
+        """
+        Blocks until a request to key is permitted.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        bucket = self.get_bucket(key)
+        return 0.0 if bucket is None else bucket.acquire()
+
+    def clear(self) -> None:
+        """Removes every configured bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+
+rate_limiter = RateLimiter()
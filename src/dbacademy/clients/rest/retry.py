@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Container, Optional
+
+import requests
+
+__all__ = ["RetryPolicy"]
+
+
+class RetryPolicy(object):
+    """
+    Decides which failed requests are retried by ApiClient.api() and how long to wait between attempts.
+
+    Rate-limit responses (429, or 500 with REQUEST_LIMIT_EXCEEDED) are retried for every HTTP method because the
+    server rejected the request without processing it.  Transient gateway errors and dropped connections are only
+    retried for idempotent methods, where repeating the request cannot duplicate its side effects.
+
+    Delays use "full jitter" exponential backoff, i.e. a random duration between zero and
+    min(backoff_max, backoff_base * 2^attempt), so that many clients failing at the same moment do not retry in
+    lockstep.  A server supplied Retry-After header takes precedence over the computed delay.
+    """
+
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    RETRY_STATUS_CODES = (502, 503, 504)
+
+    def __init__(self,
+                 *,
+                 max_retries: int = 25,
+                 backoff_base: float = 1.0,
+                 backoff_max: float = 60.0,
+                 max_total_seconds: float = 10 * 60,
+                 idempotent_methods: Container[str] = IDEMPOTENT_METHODS,
+                 retry_status_codes: Container[int] = RETRY_STATUS_CODES,
+                 respect_retry_after: bool = True):
+        """
+        Args:
+            max_retries: The maximum number of attempts made for a single request.
+            backoff_base: The upper bound, in seconds, of the delay before the first retry.  Doubled on each retry.
+            backoff_max: The largest upper bound, in seconds, of any single delay.
+            max_total_seconds: Once this many seconds have been spent on a request, no further retries are made.
+            idempotent_methods: The HTTP methods that are safe to repeat after a connection or gateway error.
+            retry_status_codes: The HTTP status codes retried for idempotent methods.
+            respect_retry_after: If true, wait for the duration given by the Retry-After response header.
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_total_seconds = max_total_seconds
+        self.idempotent_methods = idempotent_methods
+        self.retry_status_codes = retry_status_codes
+        self.respect_retry_after = respect_retry_after
+
+    def is_rate_limited(self, response: requests.Response) -> bool:
+        """Returns true if the server rejected the request because of rate limiting."""
+        if response.status_code == 429:
+            return True
+        return response.status_code == 500 and "REQUEST_LIMIT_EXCEEDED" in response.text
+
+    def should_retry_response(self, http_method: str, response: requests.Response) -> bool:
+        """Returns true if a request that produced this response should be attempted again."""
+        if self.is_rate_limited(response):
+            return True
+        return http_method in self.idempotent_methods and response.status_code in self.retry_status_codes
+
+    def should_retry_exception(self, http_method: str, exception: Exception) -> bool:
+        """Returns true if a request that raised this exception should be attempted again."""
+        if isinstance(exception, requests.exceptions.ConnectTimeout):
+            return True  # The request never reached the server.
+        if isinstance(exception, requests.exceptions.ConnectionError):
+            return http_method in self.idempotent_methods
+        return False
+
+    def backoff(self, attempt: int, response: requests.Response = None) -> float:
+        """Returns the number of seconds to wait before retrying, given the zero-based number of the failed attempt."""
+        import random
+
+        if self.respect_retry_after and response is not None:
+            retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** min(attempt, 32)))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parses a Retry-After header, given either in seconds or as an HTTP date, into a number of seconds."""
+        import time
+        from email.utils import parsedate_to_datetime
+
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+import threading
+
+__all__ = ["Base64FileBody", "download_file"]
+
+
+class Base64FileBody(object):
+    """
+    A JSON request body in which one field holds the base64 encoding of a local file, such as the "content" of a
+    workspace import.  Pass it as the _data of ApiClient.api() and the file is read from disk and encoded a chunk at a
+    time as the request is sent, so memory use stays flat however large the file is.  Each attempt made by the
+    ApiClient opens a fresh stream, so requests can still be retried.
+    """
+
+    # A multiple of 3, so that every chunk encodes to base64 without padding and the encoded chunks can be concatenated.
+    CHUNK_SIZE = 3 * 256 * 1024
+
+    def __init__(self, payload: Dict[str, Any], content_key: str, file_path: str):
+        """
+        Args:
+            payload: The other fields of the body, which must not include content_key.
+            content_key: The name of the field holding the file's base64 encoded content.
+            file_path: The local path of the file to encode.
+        """
+        import json
+        import os
+
+        assert content_key not in payload, f"""The payload must not include the content key "{content_key}"."""
+
+        self.payload = payload
+        self.content_key = content_key
+        self.file_path = file_path
+
+        payload_json = json.dumps(payload)
+        separator = "" if len(payload) == 0 else ", "
+        self.__prefix = (payload_json[:-1] + separator + json.dumps(content_key) + ': "').encode("utf-8")
+        self.__suffix = '"}'.encode("utf-8")
+
+        # The length is fixed now, so the file must not change before it is sent, see __chunks().
+        stat = os.stat(file_path)
+        self.__file_id = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        self.__encoded_size = 4 * ((stat.st_size + 2) // 3)
+
+    def __len__(self) -> int:
+        return len(self.__prefix) + self.__encoded_size + len(self.__suffix)
+
+    def __str__(self) -> str:
+        return f"<{len(self)} byte body, {self.content_key} encoded from {self.file_path}>"
+
+    def open(self) -> Base64FileBody.Stream:
+        """Returns a new stream over the body, suitable for the data of a requests request."""
+        return Base64FileBody.Stream(self.__chunks(), len(self))
+
+    def __chunks(self) -> Iterator[bytes]:
+        import os
+        import base64
+
+        yield self.__prefix
+
+        with open(self.file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if (stat.st_ino, stat.st_size, stat.st_mtime_ns) != self.__file_id:
+                raise IOError(f"The file {self.file_path} was replaced or modified after the request body was created.")
+
+            while True:
+                chunk = f.read(Base64FileBody.CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield base64.b64encode(chunk)
+
+        yield self.__suffix
+
+    class Stream(object):
+        """A read-once, file-like view of the body whose known length lets requests send a Content-Length header."""
+
+        def __init__(self, chunks: Iterator[bytes], length: int):
+            self.__chunks = chunks
+            self.__length = length
+            self.__buffer = b""
+
+        def __len__(self) -> int:
+            return self.__length
+
+        def __iter__(self) -> Iterator[bytes]:
+            if self.__buffer:
+                yield self.__buffer
+                self.__buffer = b""
+            yield from self.__chunks
+
+        def read(self, size: int = -1) -> bytes:
+            while size < 0 or len(self.__buffer) < size:
+                chunk = next(self.__chunks, None)
+                if chunk is None:
+                    break
+                self.__buffer += chunk
+
+            if size < 0:
+                result, self.__buffer = self.__buffer, b""
+            else:
+                result, self.__buffer = self.__buffer[:size], self.__buffer[size:]
+
+            return result
+
+
+# The completed downloads of this process, the source_url and modification time by local_file_path, and a lock per
+# local_file_path, so that only one download at a time ever writes to any one path.
+_downloads: Dict[str, Tuple[str, float]] = dict()
+_download_locks: Dict[str, threading.Lock] = dict()
+_downloads_lock = threading.Lock()
+
+
+def download_file(source_url: str, local_file_path: Optional[str] = None, *, reuse: bool = True, timeout: Tuple[float, float] = (5, 300)) -> str:
+    """
+    Downloads the specified URL to a local file, streaming it to disk rather than holding it in memory.
+
+    Args:
+        source_url: The URL to download.
+        local_file_path: Where to save the file.  Defaults to a path unique to the URL in the system's temporary
+            directory, see tempfile.gettempdir().
+        reuse: If true, a file this process already downloaded from the same URL to the same path is reused instead
+            of being downloaded again, and concurrent requests for the same download wait for a single transfer.
+        timeout: The seconds to wait to connect, and then between bytes received, as for requests.get().
+
+    Returns:
+        The local path of the downloaded file.
+    """
+    import os
+    import hashlib
+    import tempfile
+    import requests
+
+    if local_file_path is None:
+        file_name = source_url.split("?")[0].split("/")[-1]
+        url_hash = hashlib.sha256(source_url.encode("utf-8")).hexdigest()[:12]
+        local_file_path = os.path.join(tempfile.gettempdir(), f"{url_hash}-{file_name}")
+
+    with _downloads_lock:
+        lock = _download_locks.setdefault(local_file_path, threading.Lock())
+
+    with lock:
+        if reuse and os.path.exists(local_file_path) and _downloads.get(local_file_path) == (source_url, os.path.getmtime(local_file_path)):
+            return local_file_path  # Downloaded by this process from the same URL and unchanged since
+
+        # Written to a temporary file first so that a failed download never leaves a partial file behind.
+        temp_file_path = f"{local_file_path}.{threading.get_ident()}.tmp"
+        try:
+            with requests.get(source_url, stream=True, timeout=timeout) as response:
+                response.raise_for_status()
+                with open(temp_file_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
+
+            os.replace(temp_file_path, local_file_path)
+
+        finally:
+            if os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+
+        with _downloads_lock:
+            _downloads[local_file_path] = (source_url, os.path.getmtime(local_file_path))
+
+    return local_file_path
@@ -3,6 +3,7 @@ from typing import Type, List, Dict, Union, Any, Optional, Callable
 
 class BuildConfig:
     from dbacademy.dbrest import DBAcademyRestClient
+    from dbacademy.dbbuild.notebook_source_class import NotebookSource
 
     LANGUAGE_OPTIONS_DEFAULT = "Default"
 
@@ -131,14 +132,15 @@ class BuildConfig:
                  i18n: bool = False,
                  i18n_language: str = None,
                  ignoring: list = None,
-                 publishing_info: dict = None):
+                 publishing_info: dict = None,
+                 notebook_source: NotebookSource = None):
 
         import uuid, time
         from dbacademy.common import Cloud
         from dbacademy.dbbuild.publish.notebook_def_class import NotebookDef
         from dbacademy.dbhelper.course_config_class import CourseConfig
         from dbacademy import dbgems
-        from dbacademy.clients.rest.factory import dbrest_factory
+        from dbacademy.dbbuild.notebook_source_class import WorkspaceNotebookSource
 
         self.__validated = False
         self.__created_notebooks = False
@@ -159,7 +161,11 @@ class BuildConfig:
 
         self.test_type = None
         self.notebooks: Union[None, Dict[str, NotebookDef]] = None
-        self.__client = client or dbrest_factory.current_workspace()
+        # Created on first use, see BuildConfig.client, so that a build reading a LocalNotebookSource doesn't require a workspace
+        self.__client = client
+
+        # Where the source notebooks are read from, by default the workspace; see also LocalNotebookSource
+        self.notebook_source = notebook_source or WorkspaceNotebookSource(self.client)
 
         # The instance of this test run
         self.suite_id = str(time.time()) + "-" + str(uuid.uuid1())
@@ -243,6 +249,11 @@ class BuildConfig:
 
     @property
     def client(self) -> DBAcademyRestClient:
+        from dbacademy.clients.rest.factory import dbrest_factory
+
+        if self.__client is None:
+            self.__client = dbrest_factory.current_workspace()
+
         return self.__client
 
     def __initialize_notebooks(self):
@@ -253,7 +264,7 @@ class BuildConfig:
         assert self.source_dir is not None, "BuildConfig.source_dir must be specified"
 
         self.notebooks = dict()
-        entities = self.client.workspace().ls(self.source_dir, recursive=True)
+        entities = self.notebook_source.ls(self.source_dir)
 
         if entities is None:
             raise Exception(f"The specified source directory ({self.source_dir}) does not exist.")
@@ -0,0 +1,129 @@
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class NotebookSource(metaclass=ABCMeta):
+    """
+    The location from which a build reads its source notebooks, see BuildConfig.notebook_source.
+
+    Paths are those of the notebooks without any file extension, i.e. f"{BuildConfig.source_dir}/{NotebookDef.path}",
+    and entries take the same form as those returned by the Workspace API.
+    """
+
+    @abstractmethod
+    def ls(self, path: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lists every notebook under the specified directory, recursively.
+        :param path: The directory to list
+        :return: the notebooks' entries or None if the directory does not exist
+        """
+        pass
+
+    @abstractmethod
+    def get_status(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        :param path: The path of the notebook
+        :return: the notebook's entry, including its language, or None if it does not exist
+        """
+        pass
+
+    @abstractmethod
+    def export_notebook(self, path: str) -> str:
+        """
+        :param path: The path of the notebook
+        :return: the notebook's source, in the same form as the Workspace API's SOURCE export format
+        """
+        pass
+
+
+class WorkspaceNotebookSource(NotebookSource):
+    """Reads the source notebooks from the Databricks workspace; the default."""
+
+    from dbacademy.dbrest import DBAcademyRestClient
+
+    def __init__(self, client: DBAcademyRestClient):
+        self.client = client
+
+    def ls(self, path: str) -> Optional[List[Dict[str, Any]]]:
+        return self.client.workspace().ls(path, recursive=True)
+
+    def get_status(self, path: str) -> Optional[Dict[str, Any]]:
+        return self.client.workspace().get_status(path)
+
+    def export_notebook(self, path: str) -> str:
+        return self.client.workspace().export_notebook(path)
+
+
+class LocalNotebookSource(NotebookSource):
+    """
+    Reads the source notebooks directly from the local file system, such as from a git checkout of the course, without
+    making any API calls. A notebook is any file with one of the EXTENSIONS whose first line is the marker that
+    Databricks writes when exporting a notebook as source, e.g. "# Databricks notebook source"; other files are ignored.
+    """
+
+    EXTENSIONS = {
+        ".py": "PYTHON",
+        ".sql": "SQL",
+        ".scala": "SCALA",
+        ".r": "R",
+    }
+
+    def ls(self, path: str) -> Optional[List[Dict[str, Any]]]:
+        import os
+
+        if not os.path.isdir(path):
+            return None
+
+        entities = list()
+
+        for root, dirs, files in os.walk(path):
+            for file_name in files:
+                file_path = os.path.join(root, file_name)
+                status = self.__to_status(file_path)
+                if status is not None:
+                    entities.append(status)
+
+        return entities
+
+    def get_status(self, path: str) -> Optional[Dict[str, Any]]:
+        file_path = self.__find_file(path)
+        return None if file_path is None else self.__to_status(file_path)
+
+    def export_notebook(self, path: str) -> str:
+        file_path = self.__find_file(path)
+        if file_path is None:
+            raise FileNotFoundError(f"The notebook \"{path}\" was not found.")
+
+        with open(file_path, encoding="utf-8") as f:
+            return f.read()
+
+    def __find_file(self, path: str) -> Optional[str]:
+        import os
+
+        for extension in self.EXTENSIONS:
+            for file_path in [f"{path}{extension}", f"{path}{extension.upper()}"]:
+                if os.path.isfile(file_path):
+                    return file_path
+
+        return None
+
+    def __to_status(self, file_path: str) -> Optional[Dict[str, Any]]:
+        import os
+        from dbacademy.dbbuild.publish.notebook_def_class import NotebookDef
+
+        path, extension = os.path.splitext(file_path)
+        language = self.EXTENSIONS.get(extension.lower())
+        if language is None:
+            return None
+
+        with open(file_path, encoding="utf-8") as f:
+            first_line = f.readline().rstrip()
+
+        if first_line != f"{NotebookDef.get_comment_marker(language)} Databricks notebook source":
+            return None  # A plain source file, not a notebook
+
+        return {
+            "path": path.replace(os.sep, "/"),
+            "object_type": "NOTEBOOK",
+            "language": language,
+        }
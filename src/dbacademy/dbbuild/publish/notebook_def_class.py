@@ -1,4 +1,7 @@
-from typing import Callable, Union, List, Dict
+import re
+from typing import Callable, Union, List, Dict, Optional, FrozenSet, Pattern
+
+from dbacademy.dbbuild.publish.publish_manifest_class import PublishManifest
 
 
 class NotebookError:
@@ -49,6 +52,10 @@ class NotebookDef:
     D_INCLUDE_FOOTER_TRUE = "INCLUDE_FOOTER_TRUE"
     D_INCLUDE_FOOTER_FALSE = "INCLUDE_FOOTER_FALSE"
 
+    # TODO Fix this error after a proper unit tests is created.
+    # noinspection RegExpDuplicateCharacterInClass
+    MUSTACHE_PATTERN = re.compile(r"{{[a-zA-Z\-\\_\\#\\/]*}}")
+
     SUPPORTED_DIRECTIVES = [D_SOURCE_ONLY, D_ANSWER, D_TODO, D_DUMMY, D_TROUBLESHOOTING_CONTENT, D_INSTALL_LIBRARIES,
                             D_INCLUDE_HEADER_TRUE, D_INCLUDE_HEADER_FALSE, D_INCLUDE_FOOTER_TRUE, D_INCLUDE_FOOTER_FALSE, ]
 
@@ -73,7 +80,6 @@ class NotebookDef:
         assert type(include_solution) == bool, f"""Expected the parameter "include_solution" to be of type "bool", found "{type(include_solution)}" """
 
         self.build_config = build_config
-        self.client = build_config.client
         self.path = path
         self.replacements = replacements or dict()
 
@@ -89,9 +95,20 @@ class NotebookDef:
         self.i18n_language = i18n_language
         self.i18n_guids = list()
 
+        # The replacements compiled into a single pattern, see replace_contents()
+        self.__replacements_source: Optional[Dict[str, str]] = None
+        self.__replacements_pattern: Optional[Pattern] = None
+
+        # The notebook paths that links are validated against, see create_path_index()
+        self.path_index: Optional[FrozenSet[str]] = None
+
         self.ignoring = ignoring
         self.version = version
 
+    @property
+    def client(self):
+        return self.build_config.client
+
     def __str__(self):
         result = self.path
         result += f"\n - include_solution = {self.include_solution}"
@@ -138,19 +155,7 @@ class NotebookDef:
             self.warn(lambda: False, f"Cmd #{i+1} | Found unexpected, relative, {what} target: \"{original_target}\" resolved as \"{target}\"".strip())
             return
 
-        all_paths = set()
-        for other in other_notebooks:
-            # Add the original notebook's path
-            all_paths.add(other.path)
-
-            # Get the notebook's directory
-            directory = '/'.join(other.path.split("/")[:-1])
-            all_paths.add(directory)
-
-            # While there are still parent directories, keep processing
-            while directory.count("/") > 0:
-                directory = '/'.join(directory.split("/")[:-1])
-                all_paths.add(directory)
+        all_paths = self.path_index if self.path_index is not None else NotebookDef.create_path_index(other_notebooks)
 
         offset = -1
 
@@ -169,11 +174,30 @@ class NotebookDef:
         if target.startswith("/"):
             target = target[1:]
 
-        notebooks = [n for n in all_paths if target == n]
-
         message = f"Cmd #{i+1} | Cannot find notebook for the {what} target: \"{original_target}\" resolved as \"{target}\""
-        # self.test(lambda: len(notebooks) != 0, message)
-        self.test(lambda: len(notebooks) != 0, message)
+        self.test(lambda: target in all_paths, message)
+
+    @staticmethod
+    def create_path_index(notebooks: list) -> FrozenSet[str]:
+        """
+        Returns the path of every specified notebook and of every directory containing one, against which
+        test_notebook_exists() resolves link targets. Build it once and pass it to publish() for each notebook.
+        """
+        all_paths = set()
+        for other in notebooks:
+            # Add the original notebook's path
+            all_paths.add(other.path)
+
+            # Get the notebook's directory
+            directory = '/'.join(other.path.split("/")[:-1])
+            all_paths.add(directory)
+
+            # While there are still parent directories, keep processing
+            while directory.count("/") > 0:
+                directory = '/'.join(directory.split("/")[:-1])
+                all_paths.add(directory)
+
+        return frozenset(all_paths)
 
     def test_pip_cells(self, language: str, command: str, i: int) -> str:
         """
@@ -418,10 +442,10 @@ class NotebookDef:
 
         source_notebook_path = f"{source_dir}/{self.path}"
 
-        source_info = self.client.workspace().get_status(source_notebook_path)
+        source_info = self.build_config.notebook_source.get_status(source_notebook_path)
         language = source_info["language"].lower()
 
-        raw_source = self.client.workspace().export_notebook(source_notebook_path)
+        raw_source = self.build_config.notebook_source.export_notebook(source_notebook_path)
 
         cmd_delim = self.get_cmd_delim(language)
         commands = raw_source.split(cmd_delim)
@@ -570,7 +594,7 @@ For more current information, please see <a href="https://files.training.databri
 
         return command
 
-    def publish(self, source_dir: str, target_dir: str, i18n_resources_dir: str, verbose: bool, debugging: bool, other_notebooks: list) -> None:
+    def publish(self, source_dir: str, target_dir: str, i18n_resources_dir: str, verbose: bool, debugging: bool, other_notebooks: list, manifest: PublishManifest = None, path_index: FrozenSet[str] = None, published_paths: FrozenSet[str] = None) -> None:
         from dbacademy.dbbuild.build_utils_class import BuildUtils
 
         assert type(source_dir) == str, f"""Expected the parameter "source_dir" to be of type "str", found "{type(source_dir)}" """
@@ -586,19 +610,40 @@ For more current information, please see <a href="https://files.training.databri
         self.errors = list()
         self.warnings = list()
         self.i18n_guids = list()
+        self.path_index = path_index if path_index is not None else NotebookDef.create_path_index(other_notebooks)
 
         print()
         print("=" * 80)
         print(f".../{self.path}")
 
         source_notebook_path = f"{source_dir}/{self.path}"
-        source_info = self.client.workspace().get_status(source_notebook_path)
+        source_info = self.build_config.notebook_source.get_status(source_notebook_path)
         language = source_info["language"].lower()
 
-        raw_source = self.client.workspace().export_notebook(source_notebook_path)
-
         state = StateVariables()
         i18n_source = self.load_i18n_source(i18n_resources_dir)
+
+        students_notebook_path = f"{target_dir}/{self.path}"
+        solutions_notebook_path = f"{target_dir}/Solutions/{self.path}"
+
+        raw_source = None
+        fingerprint = None
+        if manifest is not None:
+            if source_info.get("modified_at") is None:
+                raw_source = self.build_config.notebook_source.export_notebook(source_notebook_path)
+                source_version = raw_source
+            else:
+                # Identifies the source's content without having to export it just to find it unchanged.
+                source_version = f"{source_info.get('object_id')}@{source_info.get('modified_at')}"
+
+            fingerprint = self.__fingerprint(manifest, source_version, language, target_dir, i18n_source, other_notebooks)
+            if self.__is_published(manifest, fingerprint, students_notebook_path, solutions_notebook_path, published_paths):
+                print("Skipping, unchanged since it was last published.")
+                return
+
+        if raw_source is None:
+            raw_source = self.build_config.notebook_source.export_notebook(source_notebook_path)
+
         state.i18n_guid_map = self.load_i18n_guid_map(i18n_source)
 
         cmd_delim = self.get_cmd_delim(language)
@@ -633,18 +678,56 @@ For more current information, please see <a href="https://files.training.databri
             self.warn(lambda: key not in self.path,  f"Found invalid character {key} in notebook name: {self.path}")
 
         # Create the student's notebooks
-        students_notebook_path = f"{target_dir}/{self.path}"
         BuildUtils.print_if(verbose, students_notebook_path)
         BuildUtils.print_if(verbose, f"...publishing {len(state.students_commands)} commands")
         self.publish_notebook(language, state.students_commands, students_notebook_path, print_warnings=True)
 
         # Create the solutions notebooks
         if self.include_solution:
-            solutions_notebook_path = f"{target_dir}/Solutions/{self.path}"
             BuildUtils.print_if(verbose, solutions_notebook_path)
             BuildUtils.print_if(verbose, f"...publishing {len(state.solutions_commands)} commands")
             self.publish_notebook(language, state.solutions_commands, solutions_notebook_path, print_warnings=False)
 
+        if manifest is not None:
+            manifest.record(fingerprint, students_notebook_path, [w.message for w in self.warnings])
+
+    def __fingerprint(self, manifest: PublishManifest, source_version: str, language: str, target_dir: str, i18n_source: Optional[str], other_notebooks: list) -> str:
+        from datetime import date
+        from dbacademy.dbhelper.dbacademy_helper_class import DBAcademyHelper
+
+        return manifest.fingerprint(source=source_version,
+                                    language=language,
+                                    path=self.path,
+                                    target_dir=target_dir,
+                                    directives=NotebookDef.SUPPORTED_DIRECTIVES,
+                                    replacements=self.replacements,
+                                    include_solution=self.include_solution,
+                                    ignoring=self.ignoring,
+                                    version=self.version,
+                                    i18n_language=self.i18n_language,
+                                    i18n_source=i18n_source,
+                                    other_notebooks=sorted([n.path for n in other_notebooks]),
+                                    year=date.today().year,  # Rendered into the footer
+                                    datasets_path=DBAcademyHelper.get_dbacademy_datasets_path(),  # Rendered into the troubleshooting cells
+                                    users_path=DBAcademyHelper.get_dbacademy_users_path())
+
+    def __is_published(self, manifest: PublishManifest, fingerprint: str, students_notebook_path: str, solutions_notebook_path: str, published_paths: Optional[FrozenSet[str]]) -> bool:
+        entry = manifest.get(fingerprint)
+        if entry is None:
+            return False
+
+        expected_paths = [students_notebook_path, solutions_notebook_path] if self.include_solution else [students_notebook_path]
+
+        # The manifest is local, so confirm the previously published notebooks weren't since removed from the workspace.
+        for path in expected_paths:
+            if published_paths is not None and path not in published_paths:
+                return False
+            elif published_paths is None and self.client.workspace().get_status(path) is None:
+                return False
+
+        self.warnings = [NotebookError(w) for w in entry.get("warnings", list())]
+        return True
+
     def update_command(self, *, state: StateVariables, language: str, command: str, i: int, other_notebooks: list, debugging: bool) -> str:
 
         cell_title = None
@@ -883,17 +966,18 @@ For more current information, please see <a href="https://files.training.databri
         return new_command
 
     def replace_contents(self, contents: str):
-        import re
+        pattern = self.__get_replacements_pattern()
 
-        for key in self.replacements:
-            old_value = "{{" + key + "}}"
-            new_value = self.replacements[key]
-            contents = contents.replace(old_value, new_value)
+        if pattern is None:
+            contents = self.__replace_sequentially(contents)
+        else:
+            replaced = pattern.sub(lambda match: self.__replacements_source[match.group(0)[2:-2]], contents)
 
-        # TODO Fix this error after a proper unit tests is created.
-        # noinspection RegExpDuplicateCharacterInClass
-        mustache_pattern = re.compile(r"{{[a-zA-Z\-\\_\\#\\/]*}}")
-        result = mustache_pattern.search(contents)
+            # A value can combine with the text around it to form a new {{key}}, which replacing one key at a time would
+            # go on to replace if that key comes later. That's rare, so rather than emulate it, fall back to that approach.
+            contents = self.__replace_sequentially(contents) if pattern.search(replaced) else replaced
+
+        result = NotebookDef.MUSTACHE_PATTERN.search(contents)
         if result is not None:
             self.test(lambda: False, f"A mustache pattern was detected after all replacements were processed: {result}")
 
@@ -909,6 +993,29 @@ For more current information, please see <a href="https://files.training.databri
 
         return contents
 
+    def __replace_sequentially(self, contents: str) -> str:
+        for key in self.replacements:
+            old_value = "{{" + key + "}}"
+            new_value = self.replacements[key]
+            contents = contents.replace(old_value, new_value)
+
+        return contents
+
+    def __get_replacements_pattern(self) -> Optional[Pattern]:
+        """
+        Returns a single pattern matching every {{key}} in the replacements, compiled once and again only if the
+        replacements change, or None if a key contains braces and so could overlap another key's pattern.
+        """
+        if self.__replacements_source != self.replacements:
+            self.__replacements_source = dict(self.replacements)
+
+            if len(self.replacements) == 0 or any("{" in key or "}" in key for key in self.replacements):
+                self.__replacements_pattern = None
+            else:
+                self.__replacements_pattern = re.compile("|".join([re.escape("{{" + key + "}}") for key in self.replacements]))
+
+        return self.__replacements_pattern
+
     @staticmethod
     def get_comment_marker(language):
         language = language.replace("%", "")
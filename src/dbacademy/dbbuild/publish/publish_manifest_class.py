@@ -0,0 +1,103 @@
+from typing import Any, Dict, List, Optional
+import functools
+import threading
+
+
+class PublishManifest:
+    """
+    A local record of the notebooks published by previous runs, keyed by a hash of everything that goes into a
+    published notebook: its source, the supported directives, the replacement map and the publishing settings.
+
+    NotebookDef.publish() consults it to skip notebooks whose inputs are unchanged since they were last published
+    successfully.  The version of the dbacademy library and the code that transforms the notebooks are part of every
+    fingerprint, see code_version(); bump VERSION only when the format of the manifest itself changes.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str):
+        import json
+        import os
+
+        self.__path = path
+        self.__lock = threading.Lock()
+        self.__entries: Dict[str, Dict[str, Any]] = dict()
+
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") == PublishManifest.VERSION:
+                self.__entries = data.get("entries", dict())
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @staticmethod
+    @functools.lru_cache()
+    def code_version() -> str:
+        """
+        Identifies the code that renders published notebooks: the installed version of the dbacademy library and a hash of
+        the modules whose templates, directives and helper paths end up in the published source.
+        """
+        import hashlib
+        from dbacademy import dbgems
+        from dbacademy.dbbuild.publish import notebook_def_class
+        from dbacademy.dbhelper import dbacademy_helper_class
+
+        try:
+            library_version = dbgems.lookup_current_module_version("dbacademy")
+        except Exception:
+            library_version = "unknown"  # Not installed as a distribution, e.g. run from a source checkout
+
+        digest = hashlib.sha256()
+        for module in [notebook_def_class, dbacademy_helper_class]:
+            with open(module.__file__, "rb") as f:
+                digest.update(f.read())
+
+        return f"{library_version}:{digest.hexdigest()}"
+
+    @staticmethod
+    def fingerprint(**inputs: Any) -> str:
+        """Returns a stable hash of the specified inputs, each of which must be JSON serializable, and the code_version()."""
+        import json
+        import hashlib
+
+        text = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha256(f"{PublishManifest.VERSION}:{PublishManifest.code_version()}:{text}".encode("utf-8")).hexdigest()
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        with self.__lock:
+            return self.__entries.get(fingerprint)
+
+    def record(self, fingerprint: str, target_path: str, warnings: List[str]) -> None:
+        with self.__lock:
+            # Any previous publication of the same notebook is superseded by this one.
+            for key in [k for k, v in self.__entries.items() if v.get("target_path") == target_path]:
+                del self.__entries[key]
+
+            self.__entries[fingerprint] = {
+                "target_path": target_path,
+                "warnings": warnings,
+            }
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries = dict()
+
+    def save(self) -> None:
+        import os
+        import json
+
+        with self.__lock:
+            data = {"version": PublishManifest.VERSION, "entries": self.__entries}
+
+        parent_dir = os.path.dirname(self.__path)
+        if parent_dir and not os.path.exists(parent_dir):
+            os.makedirs(parent_dir)
+
+        # Written to a temporary file first so that an interrupted save never leaves a corrupt manifest behind.
+        temp_path = f"{self.__path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.__path)
@@ -1,9 +1,11 @@
-from typing import List, Optional
+from typing import List, Optional, FrozenSet, Tuple
 
 
 class Publisher:
     from dbacademy.dbbuild.build_config_class import BuildConfig
     from dbacademy.dbbuild.publish.notebook_def_class import NotebookDef
+    from dbacademy.dbbuild.publish.publish_manifest_class import PublishManifest
+    from dbacademy.dbbuild.publish.thread_output_buffer_class import ThreadOutputBuffer
 
     VERSION_INFO_NOTEBOOK = "Version Info"
 
@@ -148,16 +150,19 @@ class Publisher:
         """
         assert self.__generated_notebooks, "The notebooks have not yet been generated. See Publisher.generate_notebooks()"
 
-    def generate_notebooks(self, *, skip_generation: bool = False, verbose=False, debugging=False) -> Optional[str]:
+    def generate_notebooks(self, *, skip_generation: bool = False, verbose=False, debugging=False, max_workers: int = 8, manifest_path: str = None) -> Optional[str]:
         """
         Generates the publishable notebooks from the source notebooks
         :param skip_generation: Overrides the default behavior and skips generation of the notebook
         :param verbose: True of verbose logging
         :param debugging: True for debug logging
+        :param max_workers: The maximum number of notebooks published concurrently
+        :param manifest_path: The local path of a PublishManifest; when specified, the target directory is not cleaned first and notebooks unchanged since they were last published are skipped. Notebooks no longer part of the course are then removed from the target once every other notebook is published.
         :return: The HTML results that should be rendered with displayHTML() from the calling notebook
         """
         from dbacademy import common, dbgems
         from dbacademy.dbbuild.publish.notebook_def_class import NotebookDef
+        from dbacademy.dbbuild.publish.publish_manifest_class import PublishManifest
         from dbacademy.dbbuild.build_utils_class import BuildUtils
         from dbacademy.dbbuild import BuildConfig
 
@@ -208,22 +213,33 @@ class Publisher:
             for path in self.white_list[1:]:
                 print(f"              {path}")
 
+        manifest = None if manifest_path is None else PublishManifest(manifest_path)
+
         # Now that we backed up the version-info, we can delete everything.
         target_status = self.client.workspace().get_status(self.target_dir)
-        if target_status is not None:
+        if target_status is not None and manifest is None:
             BuildUtils.print_if(verbose, "-" * 80)
             BuildUtils.clean_target_dir(self.client, self.target_dir, verbose)
 
+        published_paths = None
+        if manifest is not None:
+            # Listed once, both to confirm that skipped notebooks are still published and to find those no longer in the course.
+            published_paths = frozenset([n.get("path") for n in self.client.workspace().ls(self.target_dir, recursive=True) or list()])
+
         errors = 0
         warnings = 0
 
+        # Shared by every notebook for validating links to the others
+        path_index = NotebookDef.create_path_index(self.notebooks)
+
+        failed = self.__publish_notebooks(main_notebooks, verbose, debugging, manifest, path_index, published_paths, max_workers)
+
+        if manifest is not None:
+            if len(failed) == 0:
+                self.__remove_unpublished(main_notebooks, published_paths, verbose)
+            manifest.save()
+
         for notebook in main_notebooks:
-            notebook.publish(source_dir=self.source_dir,
-                             target_dir=self.target_dir,
-                             i18n_resources_dir=self.i18n_resources_dir,
-                             verbose=verbose, 
-                             debugging=debugging,
-                             other_notebooks=self.notebooks)
             errors += len(notebook.errors)
             warnings += len(notebook.warnings)
 
@@ -233,6 +249,17 @@ class Publisher:
         print(f"Found {warnings} warnings")
         print(f"Found {errors} errors")
 
+        if len(failed) > 0:
+            what = "notebook" if len(failed) == 1 else "notebooks"
+            print()
+            print(f"ABORTING: Failed to publish {len(failed)} {what}")
+            for notebook, e in failed:
+                print("-" * 80)
+                print(f"{notebook.path}: {e}")
+                for error in notebook.errors:
+                    print(f"  {error.message}")
+            raise Exception("Publish aborted - see previous errors for more information") from failed[0][1]
+
         html = f"""<html><body style="font-size:16px">
                          <div><a href="{dbgems.get_workspace_url()}#workspace{self.target_dir}/{Publisher.VERSION_INFO_NOTEBOOK}" target="_blank">See Published Version</a></div>"""
         for notebook in main_notebooks:
@@ -402,6 +429,57 @@ class Publisher:
                          test_type=test_type,
                          keep_success=keep_success)
 
+    def __publish_notebooks(self, notebooks: List[NotebookDef], verbose: bool, debugging: bool, manifest: Optional[PublishManifest], path_index: FrozenSet[str], published_paths: Optional[FrozenSet[str]], max_workers: int) -> List[Tuple[NotebookDef, Exception]]:
+        """Publishes the notebooks concurrently, returning those that failed along with the exception each raised."""
+        import sys
+        from contextlib import redirect_stdout
+        from multiprocessing.pool import ThreadPool
+        from dbacademy.dbbuild.publish.thread_output_buffer_class import ThreadOutputBuffer
+
+        # Each notebook's output is printed as one block when it finishes, rather than interleaved with the others.
+        output = ThreadOutputBuffer(sys.stdout)
+
+        with redirect_stdout(output):
+            with ThreadPool(max(1, min(max_workers, len(notebooks)))) as pool:
+                failures = pool.map(lambda n: self.__publish_notebook(n, verbose, debugging, manifest, path_index, published_paths, output), notebooks)
+
+        return [(notebook, e) for notebook, e in zip(notebooks, failures) if e is not None]
+
+    def __publish_notebook(self, notebook: NotebookDef, verbose: bool, debugging: bool, manifest: Optional[PublishManifest], path_index: FrozenSet[str], published_paths: Optional[FrozenSet[str]], output: ThreadOutputBuffer) -> Optional[Exception]:
+        with output.capture():
+            try:
+                notebook.publish(source_dir=self.source_dir,
+                                 target_dir=self.target_dir,
+                                 i18n_resources_dir=self.i18n_resources_dir,
+                                 verbose=verbose,
+                                 debugging=debugging,
+                                 other_notebooks=self.notebooks,
+                                 manifest=manifest,
+                                 path_index=path_index,
+                                 published_paths=published_paths)
+                return None
+
+            except Exception as e:
+                # Collected so that one failing notebook doesn't hide the errors of the others.
+                return e
+
+    def __remove_unpublished(self, notebooks: List[NotebookDef], published_paths: FrozenSet[str], verbose: bool) -> None:
+        """Removes the previously published notebooks that are no longer part of the course, the counterpart of BuildUtils.clean_target_dir()"""
+        from dbacademy.dbbuild.build_utils_class import BuildUtils
+
+        expected_paths = set()
+        for notebook in notebooks:
+            expected_paths.add(f"{self.target_dir}/{notebook.path}")
+            if notebook.include_solution:
+                expected_paths.add(f"{self.target_dir}/Solutions/{notebook.path}")
+
+        keepers = [f"{self.target_dir}/{k}" for k in Publisher.KEEPERS]
+
+        for path in sorted(published_paths - expected_paths):
+            if not any(path == k or path.startswith(f"{k}/") for k in keepers):
+                BuildUtils.print_if(verbose, f"Removing {path}, no longer part of the course")
+                self.client.workspace().delete_path(path)
+
     def __generate_html(self, notebook: NotebookDef) -> None:
         import time
         from dbacademy import dbgems
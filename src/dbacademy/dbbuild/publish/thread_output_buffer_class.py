@@ -0,0 +1,47 @@
+from typing import Iterator, TextIO
+from contextlib import contextmanager
+import io
+import threading
+
+
+class ThreadOutputBuffer(io.TextIOBase):
+    """
+    A stand-in for sys.stdout while work is done concurrently, see Publisher.generate_notebooks().
+
+    Output written by a thread inside capture() is collected separately from that of every other thread, so it can be
+    printed as one block once that thread's work is done; all other output is passed straight through to the target.
+    """
+
+    def __init__(self, target: TextIO):
+        super().__init__()
+        self.__target = target
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        buffer = getattr(self.__local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+
+        with self.__lock:
+            return self.__target.write(text)
+
+    def flush(self) -> None:
+        with self.__lock:
+            self.__target.flush()
+
+    @contextmanager
+    def capture(self) -> Iterator[None]:
+        """Collects the calling thread's output, writing it to the target as one block when the block exits."""
+        self.__local.buffer = io.StringIO()
+        try:
+            yield
+        finally:
+            text = self.__local.buffer.getvalue()
+            self.__local.buffer = None
+            with self.__lock:
+                self.__target.write(text)
+                self.__target.flush()
@@ -0,0 +1,140 @@
+from typing import Any, Dict, List, Optional, Tuple
+import queue
+import threading
+
+
+class StatusReporter:
+    """
+    Posts smoke-test results to the results API and status updates to Slack from a background thread, so that a slow
+    or failing endpoint never holds up the tests themselves.
+
+    Events are delivered in the order they were queued.  Whatever has accumulated while the previous batch was being
+    delivered is sent as the next batch, with consecutive Slack updates of the same type combined into one message.
+    Results are retried up to max_attempts times, as each carries a unique test_id and resending one is harmless;
+    Slack updates are sent only once, since a retried post could appear in the channel twice.  Delivery failures are
+    logged as warnings and never stop the worker.  Call flush() to block until everything queued so far is handled.
+    """
+
+    RESULTS_URL = "https://rqbr3jqop0.execute-api.us-west-2.amazonaws.com/prod/tests/smoke-tests"
+    SLACK_URL = "https://rqbr3jqop0.execute-api.us-west-2.amazonaws.com/prod/slack/client"
+    SLACK_CHANNEL = "curr-smoke-tests"
+
+    EVENT_RESULT = "result"
+    EVENT_SLACK = "slack"
+
+    def __init__(self, *, max_attempts: int = 3, backoff_seconds: float = 1):
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+
+        self.slack_first_message: Optional[str] = None
+        self.slack_thread_ts: Optional[str] = None
+
+        self.__queue: queue.Queue = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__thread: Optional[threading.Thread] = None
+
+    def log_result(self, payload: Dict[str, Any]) -> None:
+        self.__put((self.EVENT_RESULT, payload))
+
+    def send_status_update(self, message_type: str, message: str) -> None:
+        if self.slack_first_message is None:
+            self.slack_first_message = message
+
+        self.__put((self.EVENT_SLACK, (message_type, message)))
+
+    def flush(self) -> None:
+        """Blocks until every event queued so far has been delivered, or has failed its final attempt."""
+        self.__queue.join()
+
+    def __put(self, event: Tuple[str, Any]) -> None:
+        with self.__lock:
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="StatusReporter", daemon=True)
+                self.__thread.start()
+
+        self.__queue.put(event)
+
+    def __run(self) -> None:
+        while True:
+            batch = [self.__queue.get()]
+            while True:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self.__deliver(batch)
+            except Exception as e:
+                # Anything escaping __deliver() must not kill the worker, or flush() would wait forever.
+                self.__warn("Status Reporter Failure", e)
+            finally:
+                for _ in batch:
+                    self.__queue.task_done()
+
+    def __deliver(self, batch: List[Tuple[str, Any]]) -> None:
+        slack_updates: List[Tuple[str, str]] = list()
+
+        for event_type, event in batch + [(None, None)]:
+            # Combine consecutive Slack updates of the same type, but only once the thread exists; the first message starts it.
+            if event_type == self.EVENT_SLACK and len(slack_updates) > 0 and self.slack_thread_ts is not None and slack_updates[-1][0] == event[0]:
+                slack_updates.append(event)
+                continue
+
+            if len(slack_updates) > 0:
+                message_type = slack_updates[0][0]
+                message = "\n\n".join([m for _, m in slack_updates])
+                slack_updates = list()
+                try:
+                    self.__post_slack(message_type, message)  # Not retried, see above
+                except Exception as e:
+                    self.__warn("Slack Notification Failure", e)
+
+            if event_type == self.EVENT_SLACK:
+                slack_updates.append(event)
+
+            elif event_type == self.EVENT_RESULT:
+                try:
+                    self.__with_retry(lambda: self.__put_result(event))
+                except Exception as e:
+                    self.__warn("Smoke Test Logging Failure", e)
+
+    @staticmethod
+    def __warn(title: str, e: Exception) -> None:
+        import traceback
+        from dbacademy import common
+
+        message = f"{str(e)}\n{traceback.format_exc()}"
+        common.print_warning(title=title, message=message, length=100)
+
+    def __with_retry(self, deliver) -> None:
+        import time
+
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return deliver()
+            except Exception:
+                if attempt >= self.max_attempts:
+                    raise
+                time.sleep(self.backoff_seconds * 2 ** (attempt - 1))
+
+    def __put_result(self, payload: Dict[str, Any]) -> None:
+        import requests, json
+
+        response = requests.put(self.RESULTS_URL, data=json.dumps(payload))
+        assert response.status_code == 200, f"({response.status_code}): {response.text}"
+
+    def __post_slack(self, message_type: str, message: str) -> None:
+        import requests, json
+
+        payload = {
+            "channel": self.SLACK_CHANNEL,
+            "message": message,
+            "message_type": message_type,
+            "first_message": self.slack_first_message,
+            "thread_ts": self.slack_thread_ts
+        }
+
+        response = requests.post(self.SLACK_URL, data=json.dumps(payload))
+        assert response.status_code == 200, f"({response.status_code}): {response.text}"
+        self.slack_thread_ts = response.json().get("data", {}).get("thread_ts")
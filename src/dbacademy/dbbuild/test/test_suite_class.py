@@ -1,3 +1,6 @@
+from typing import Any, List, Optional
+
+
 class TestSuite:
     from dbacademy.dbbuild.build_config_class import BuildConfig
 
@@ -10,6 +13,7 @@ class TestSuite:
     def __init__(self, *, build_config: BuildConfig, test_dir: str, test_type: str, keep_success: bool = False):
         from dbacademy import dbgems
         from dbacademy.dbbuild.test.test_instance_class import TestInstance
+        from dbacademy.dbbuild.test.status_reporter_class import StatusReporter
 
         self.test_dir = test_dir
         self.build_config = build_config
@@ -18,8 +22,7 @@ class TestSuite:
         self.test_rounds = dict()
         self.test_results = list()
 
-        self.slack_thread_ts = None
-        self.slack_first_message = None
+        self.status_reporter = StatusReporter()
 
         self.keep_success = keep_success
 
@@ -30,7 +33,7 @@ class TestSuite:
 
         assert test_type in TestSuite.TEST_TYPES, f"The test type is expected to be one of {TestSuite.TEST_TYPES}, found \"{test_type}\""
 
-        self.test_type = test_type
+        self.test_type = self.to_tag_value(test_type)
 
         # Define each test_round first to make the next step full-proof
         for notebook in self.build_config.notebooks.values():
@@ -68,17 +71,23 @@ class TestSuite:
             # Delete all successful jobs, keeping those jobs that failed
             self.client.jobs.delete_by_name(job_names=self.get_all_job_names(), success_only=True)
 
-    def create_test_job(self, *, job_name: str, notebook_path: str, policy_id: str = None):
+    @staticmethod
+    def to_tag_value(value: str) -> str:
         import re
+
+        value = re.sub(r"[^a-zA-Z\d]", "-", value.lower())
+        while "--" in value:
+            value = value.replace("--", "-")
+        return value
+
+    def create_test_job(self, *, job_name: str, notebook_path: str, policy_id: str = None):
         from dbacademy.dbrest.jobs import JobConfig
         from dbacademy.dbrest.clusters import JobClusterConfig
         from dbacademy.common import Cloud
 
-        self.build_config.spark_conf["dbacademy.smoke-test"] = "true"
-
-        self.test_type = re.sub(r"[^a-zA-Z\d]", "-", self.test_type.lower())
-        while "--" in self.test_type:
-            self.test_type = self.test_type.replace("--", "-")
+        # A copy, as jobs are created concurrently and the build config's spark_conf is shared between them.
+        spark_conf = dict(self.build_config.spark_conf)
+        spark_conf["dbacademy.smoke-test"] = "true"
 
         job_config = JobConfig(job_name=job_name, timeout_seconds=120*60, tags={
                 "dbacademy.course": self.build_config.build_name,
@@ -98,7 +107,7 @@ class TestSuite:
         cluster_config = JobClusterConfig(cloud=Cloud.current_cloud(),
                                           num_workers=self.build_config.workers,
                                           spark_version=self.build_config.spark_version,
-                                          spark_conf=self.build_config.spark_conf,
+                                          spark_conf=spark_conf,
                                           node_type_id=None,  # Expecting to have an instance pool when testing
                                           instance_pool_id=self.build_config.instance_pool_id,
                                           single_user_name=self.build_config.single_user_name,
@@ -160,46 +169,107 @@ class TestSuite:
                 response = self.client.runs().wait_for(run_id)
                 passed = False if not self.conclude_test(test, response) else passed
 
+        self.flush_status_updates()
         return passed
 
-    def test_all_asynchronously(self, test_round: int, service_principal: str = None, policy_id: str = None) -> bool:
-        from dbacademy import dbgems
-
-        tests = self.test_rounds[test_round]
+    def test_all_asynchronously(self, test_round: int, service_principal: str = None, policy_id: str = None, max_concurrent_runs: int = None) -> bool:
+        tests = sorted(self.test_rounds[test_round], key=lambda t: t.notebook.order)
 
         self.send_first_message()
 
         what = "notebook" if len(tests) == 1 else "notebooks"
         self.send_status_update("info", f"Round #{test_round}: Testing {len(tests)} {what}  asynchronously")
 
-        # Launch each test
-        for test in tests:
-            self.send_status_update("info", f"Starting */{test.notebook.path}*")
+        passed = self.__schedule_tests(tests, max_concurrent_runs or len(tests), service_principal, policy_id)
+
+        self.flush_status_updates()
+        return passed
+
+    def test_all(self, *, max_concurrent_runs: int = 10, sequential_rounds: List[int] = None, fail_fast: bool = True, service_principal: str = None, policy_id: str = None) -> bool:
+        """
+        Tests every round in ascending order, each round starting only once the previous one has finished.
+        Within a round, up to max_concurrent_runs notebooks are tested at once and each slot is refilled as soon as
+        its run finishes; the rounds in sequential_rounds (by default the setup round, #1) are instead tested one
+        notebook at a time in their configured order.
+        """
+        sequential_rounds = [1] if sequential_rounds is None else sequential_rounds
+
+        passed = True
+        for test_round in sorted(r for r in self.test_rounds if r > 0):
+            if test_round in sequential_rounds:
+                passed = self.test_all_synchronously(test_round, fail_fast=fail_fast, service_principal=service_principal, policy_id=policy_id) and passed
+            else:
+                passed = self.test_all_asynchronously(test_round, service_principal=service_principal, policy_id=policy_id, max_concurrent_runs=max_concurrent_runs) and passed
+
+            if fail_fast and not passed:
+                print(f"Skipping the remaining rounds, round #{test_round} failed.")
+                break
+
+        return passed
+
+    def __launch_test(self, test, service_principal: Optional[str], policy_id: Optional[str]) -> None:
+        from dbacademy import dbgems
 
-            test.job_id = self.create_test_job(job_name=test.job_name,
-                                               notebook_path=test.notebook_path,
-                                               policy_id=policy_id)
-            if service_principal:
-                sp = self.client.scim.service_principals.get_by_name(service_principal)
-                self.client.permissions.jobs.change_owner(job_id=test.job_id, owner_type="service_principal", owner_id=sp.get("applicationId"))
+        test.job_id = self.create_test_job(job_name=test.job_name,
+                                           notebook_path=test.notebook_path,
+                                           policy_id=policy_id)
+        if service_principal:
+            sp = self.client.scim.service_principals.get_by_name(service_principal)
+            self.client.permissions.jobs.change_owner(job_id=test.job_id, owner_type="service_principal", owner_id=sp.get("applicationId"))
 
-            test.run_id = self.client.jobs.run_now(test.job_id).get("run_id")
+        test.run_id = self.client.jobs.run_now(test.job_id).get("run_id")
 
-            print(f"""/{test.notebook.path}\n - https://{dbgems.get_browser_host_name()}?o={dbgems.get_workspace_id()}#job/{test.job_id}/run/{test.run_id}""")
+        print(f"""/{test.notebook.path}\n - https://{dbgems.get_browser_host_name()}?o={dbgems.get_workspace_id()}#job/{test.job_id}/run/{test.run_id}""")
+
+    def __schedule_tests(self, tests: List[Any], max_concurrent_runs: int, service_principal: Optional[str], policy_id: Optional[str]) -> bool:
+        from multiprocessing.pool import ThreadPool
 
         # Assume that all tests passed
         passed = True
-        print(f"""\nWaiting for all test to complete:""")
+        queued = list(tests)
+        running = dict()
 
-        # Block until all tests completed
-        for test in tests:
-            self.send_status_update("info", f"Waiting for */{test.notebook.path}*")
+        while len(queued) > 0 or len(running) > 0:
+            # Fill every free slot, creating and starting the jobs concurrently
+            launching = queued[:max(1, max_concurrent_runs) - len(running)]
+            queued = queued[len(launching):]
+
+            for test in launching:
+                self.send_status_update("info", f"Starting */{test.notebook.path}*")
+
+            if len(launching) > 0:
+                with ThreadPool(len(launching)) as pool:
+                    errors = pool.map(lambda t: self.__try_launch_test(t, service_principal, policy_id), launching)
+
+                running.update({test.run_id: test for test, error in zip(launching, errors) if error is None})
+                errors = [e for e in errors if e is not None]
 
-            response = self.client.runs().wait_for(test.run_id)
-            passed = False if not self.conclude_test(test, response) else passed
+                if len(errors) > 0:
+                    # Don't leave the runs that did start orphaned; nothing will be waiting on them.
+                    for run_id, test in running.items():
+                        print(f"Cancelling run #{run_id} for /{test.notebook.path}")
+                        self.client.runs().cancel(run_id)
+                    raise errors[0]
+
+            # Block until a run finishes, going back to refill its slot if any tests are still queued
+            for response in self.client.runs().wait_for_all(list(running)):
+                test = running.pop(response.get("run_id"))
+                passed = False if not self.conclude_test(test, response) else passed
+
+                if len(queued) > 0:
+                    break
 
         return passed
 
+    def __try_launch_test(self, test, service_principal: Optional[str], policy_id: Optional[str]) -> Optional[Exception]:
+        try:
+            self.__launch_test(test, service_principal, policy_id)
+            return None
+        except Exception as e:
+            if test.run_id:
+                self.client.runs().cancel(test.run_id)  # The run started, but something failed afterwards
+            return e
+
     def conclude_test(self, test, response) -> bool:
         import json
         self.log_run(test, response)
@@ -224,8 +294,7 @@ class TestSuite:
         return ResultsEvaluator(self.test_results, self.keep_success)
 
     def log_run(self, test, response):
-        import time, uuid, requests, json
-        from dbacademy import common
+        import time, uuid
         from dbacademy.dbbuild.build_utils_class import BuildUtils
 
         job_id = response.get("job_id", 0)
@@ -256,15 +325,7 @@ class TestSuite:
         }
 
         self.test_results.append(payload)
-
-        try:
-            response = requests.put("https://rqbr3jqop0.execute-api.us-west-2.amazonaws.com/prod/tests/smoke-tests", data=json.dumps(payload))
-            assert response.status_code == 200, f"({response.status_code}): {response.text}"
-
-        except Exception as e:
-            import traceback
-            message = f"{str(e)}\n{traceback.format_exc()}"
-            common.print_warning(title="Smoke Test Logging Failure", message=message, length=100)
+        self.status_reporter.log_result(payload)
 
         if result_state == "FAILED":
             message_type = "error"
@@ -276,27 +337,13 @@ class TestSuite:
         self.send_status_update(message_type, f"*`{result_state}` /{test.notebook.path}*\n\n{url}")
 
     def send_first_message(self):
-        if self.slack_first_message is None:
+        if self.status_reporter.slack_first_message is None:
             self.send_status_update("info", f"*{self.build_config.name}*\nCloud: *{self.build_config.cloud}* | Mode: *{self.test_type}*")
 
     def send_status_update(self, message_type, message):
-        import requests, json
-        from dbacademy import common
-
-        if self.slack_first_message is None:
-            self.slack_first_message = message
+        # Delivered in the background, see flush_status_updates()
+        self.status_reporter.send_status_update(message_type, message)
 
-        payload = {
-            "channel": "curr-smoke-tests",
-            "message": message,
-            "message_type": message_type,
-            "first_message": self.slack_first_message,
-            "thread_ts": self.slack_thread_ts
-        }
-
-        try:
-            response = requests.post("https://rqbr3jqop0.execute-api.us-west-2.amazonaws.com/prod/slack/client", data=json.dumps(payload))
-            assert response.status_code == 200, f"({response.status_code}): {response.text}"
-            self.slack_thread_ts = response.json().get("data", {}).get("thread_ts")
-        except Exception as e:
-            common.print_warning(title="Slack Notification Failure", message=str(e), length=100)
+    def flush_status_updates(self):
+        """Blocks until every queued test result and status update has been posted."""
+        self.status_reporter.flush()
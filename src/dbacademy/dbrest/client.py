@@ -1,9 +1,35 @@
 from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 from dbacademy.clients.rest.common import ApiClient
 
+if TYPE_CHECKING:
+    from dbacademy.dbrest.clusters import ClustersClient
+    from dbacademy.dbrest.cluster_policies import ClustersPolicyClient
+    from dbacademy.dbrest.instance_pools import InstancePoolsClient
+    from dbacademy.dbrest.jobs import JobsClient
+    from dbacademy.dbrest.ml import MlClient
+    from dbacademy.clients.rest.permissions import Permissions
+    from dbacademy.dbrest.pipelines import PipelinesClient
+    from dbacademy.dbrest.repos import ReposClient
+    from dbacademy.dbrest.runs import RunsClient
+    from dbacademy.dbrest.scim import ScimClient
+    from dbacademy.dbrest.sql import SqlClient
+    from dbacademy.dbrest.tokens import TokensClient
+    from dbacademy.dbrest.token_management import TokenManagementClient
+    from dbacademy.dbrest.uc import UcClient
+    from dbacademy.dbrest.workspace import WorkspaceClient
+    from dbacademy.dbrest.serving_endpoints import ServingEndpointsClient
+
 
 class DBAcademyRestClient(ApiClient):
-    """Databricks Academy REST API client."""
+    """
+    Databricks Academy REST API client.
+
+    The sub-clients (clusters, jobs, workspace, etc.) are imported and constructed on first access.
+    """
     # from dbacademy.dbrest.accounts import AccountsClient
 
     def __init__(self,
@@ -60,53 +86,85 @@ class DBAcademyRestClient(ApiClient):
 
         self.endpoint = endpoint
 
+    @cached_property
+    def clusters(self) -> ClustersClient:
         from dbacademy.dbrest.clusters import ClustersClient
-        self.clusters = ClustersClient(self)
+        return ClustersClient(self)
 
+    @cached_property
+    def cluster_policies(self) -> ClustersPolicyClient:
         from dbacademy.dbrest.cluster_policies import ClustersPolicyClient
-        self.cluster_policies = ClustersPolicyClient(self)
+        return ClustersPolicyClient(self)
 
+    @cached_property
+    def instance_pools(self) -> InstancePoolsClient:
         from dbacademy.dbrest.instance_pools import InstancePoolsClient
-        self.instance_pools = InstancePoolsClient(self)
+        return InstancePoolsClient(self)
 
+    @cached_property
+    def jobs(self) -> JobsClient:
         from dbacademy.dbrest.jobs import JobsClient
-        self.jobs = JobsClient(self)
+        return JobsClient(self)
 
+    @cached_property
+    def ml(self) -> MlClient:
         from dbacademy.dbrest.ml import MlClient
-        self.ml = MlClient(self)
+        return MlClient(self)
 
+    @cached_property
+    def permissions(self) -> Permissions:
         from dbacademy.clients.rest.permissions import Permissions
-        self.permissions = Permissions(self)
+        return Permissions(self)
 
+    @cached_property
+    def pipelines(self) -> PipelinesClient:
         from dbacademy.dbrest.pipelines import PipelinesClient
-        self.pipelines = PipelinesClient(self)
+        return PipelinesClient(self)
 
+    @cached_property
+    def repos(self) -> ReposClient:
         from dbacademy.dbrest.repos import ReposClient
-        self.repos = ReposClient(self)
+        return ReposClient(self)
 
+    @cached_property
+    def runs(self) -> RunsClient:
         from dbacademy.dbrest.runs import RunsClient
-        self.runs = RunsClient(self)
+        return RunsClient(self)
 
+    @cached_property
+    def scim(self) -> ScimClient:
         from dbacademy.dbrest.scim import ScimClient
-        self.scim = ScimClient(self)
+        return ScimClient(self)
 
+    @cached_property
+    def sql(self) -> SqlClient:
         from dbacademy.dbrest.sql import SqlClient
-        self.sql = SqlClient(self)
+        return SqlClient(self)
 
+    @cached_property
+    def tokens(self) -> TokensClient:
         from dbacademy.dbrest.tokens import TokensClient
-        self.tokens = TokensClient(self)
+        return TokensClient(self)
 
+    @cached_property
+    def token_management(self) -> TokenManagementClient:
         from dbacademy.dbrest.token_management import TokenManagementClient
-        self.token_management = TokenManagementClient(self)
+        return TokenManagementClient(self)
 
+    @cached_property
+    def uc(self) -> UcClient:
         from dbacademy.dbrest.uc import UcClient
-        self.uc = UcClient(self)
+        return UcClient(self)
 
+    @cached_property
+    def workspace(self) -> WorkspaceClient:
         from dbacademy.dbrest.workspace import WorkspaceClient
-        self.workspace = WorkspaceClient(self)
+        return WorkspaceClient(self)
 
+    @cached_property
+    def serving_endpoints(self) -> ServingEndpointsClient:
         from dbacademy.dbrest.serving_endpoints import ServingEndpointsClient
-        self.serving_endpoints = ServingEndpointsClient(self)
+        return ServingEndpointsClient(self)
 
     # def accounts(self, account_id: str) -> AccountsClient:
     #     from dbacademy.dbrest.accounts import AccountsClient
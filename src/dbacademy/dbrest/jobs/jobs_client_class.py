@@ -1,7 +1,8 @@
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from dbacademy import common
 from dbacademy.dbrest import DBAcademyRestClient
 from dbacademy.clients.rest.common import ApiContainer
+from dbacademy.clients.rest.pagination import paginate
 
 
 class JobsClient(ApiContainer):
@@ -53,31 +54,8 @@ class JobsClient(ApiContainer):
         return self.client.api("GET", f"{self.client.endpoint}/api/2.0/jobs/get?job_id={job_id}")
 
     def get_by_name(self, name: str):
-        offset = 0  # Start with zero
-        limit = 25  # Default maximum
-
-        def search(jobs_list):
-            job_ids = [j.get("job_id") for j in jobs_list if name == j.get("settings").get("name")]
-            return (False, None) if len(job_ids) == 0 else (True, self.get_by_id(job_ids[0]))
-
-        target_url = f"{self.client.endpoint}/api/2.1/jobs/list?limit={limit}"
-        response = self.client.api("GET", target_url)
-        jobs = response.get("jobs", list())
-
-        found, job = search(jobs)
-        if found:
-            return job
-
-        while response.get("has_more", False):
-            offset += limit
-            response = self.client.api("GET", f"{target_url}&offset={offset}")
-            jobs = response.get("jobs", list())
-
-            found, job = search(jobs)
-            if found:
-                return job
-
-        return None
+        job_id = next((j.get("job_id") for j in self.iterate() if name == j.get("settings").get("name")), None)
+        return None if job_id is None else self.get_by_id(job_id)
 
     def list_n(self, offset: int = 0, limit: int = 25, expand_tasks: bool = False):
         limit = min(25, limit)
@@ -87,20 +65,13 @@ class JobsClient(ApiContainer):
         response = self.client.api("GET", target_url)
         return response.get("jobs", list())
 
-    def list(self, expand_tasks: bool = False):
-        offset = 0  # Start with zero
-        limit = 25  # Default maximum
-
-        target_url = f"{self.client.endpoint}/api/2.1/jobs/list?limit={limit}&expand_tasks={expand_tasks}"
-        response = self.client.api("GET", target_url)
-        all_jobs = response.get("jobs", list())
-
-        while response.get("has_more", False):
-            offset += limit
-            response = self.client.api("GET", f"{target_url}&offset={offset}")
-            all_jobs.extend(response.get("jobs", list()))
+    def iterate(self, expand_tasks: bool = False) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all jobs, one page at a time."""
+        data = {"limit": 25, "expand_tasks": expand_tasks}  # 25 is the maximum page size
+        return paginate(self.client, f"{self.client.endpoint}/api/2.1/jobs/list", "jobs", data, style="offset")
 
-        return all_jobs
+    def list(self, expand_tasks: bool = False):
+        return list(self.iterate(expand_tasks))
 
     @common.deprecated("Use JobsClient.delete_by_id() instead")
     def delete_by_job_id(self, job_id):
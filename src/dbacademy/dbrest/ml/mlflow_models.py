@@ -1,5 +1,8 @@
+from typing import Any, Dict, Iterator
+
 from dbacademy.dbrest import DBAcademyRestClient
 from dbacademy.clients.rest.common import ApiContainer
+from dbacademy.clients.rest.pagination import paginate
 
 
 class MLflowModelsClient(ApiContainer):
@@ -8,21 +11,12 @@ class MLflowModelsClient(ApiContainer):
         self.client = client
         self.base_uri = f"{self.client.endpoint}/api/2.0/preview/mlflow/registered-models"
 
-    def list(self):
-        results = []
-        max_results = 1000
-
-        url = f"{self.base_uri}/search?max_results={max_results}"
+    def iterate(self) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all registered models, one page at a time."""
+        return paginate(self.client, f"{self.base_uri}/search", "registered_models", {"max_results": 1000})
 
-        response = self.client.api("GET", url)
-        results.extend(response.get("registered_models", []))
-
-        while "next_page_token" in response:
-            next_page_token = response["next_page_token"]
-            response = self.client.api("GET", f"{url}&page_token={next_page_token}")
-            results.extend(response.get("registered_models", []))
-
-        return results
+    def list(self):
+        return list(self.iterate())
 
     def delete(self, name: str):
         url = f"{self.base_uri}/delete"
@@ -1,8 +1,9 @@
 from dbacademy.dbrest import DBAcademyRestClient
 import builtins
-from typing import Union
+from typing import Any, Dict, Iterator, Union
 
 from dbacademy.clients.rest.common import ApiContainer
+from dbacademy.clients.rest.pagination import paginate
 
 
 class PipelinesClient(ApiContainer):
@@ -10,18 +11,12 @@ class PipelinesClient(ApiContainer):
         self.client = client
         self.base_uri = f"{self.client.endpoint}/api/2.0/pipelines"
 
-    def list(self, max_results=100):
-        pipelines = []
-        response = self.client.api("GET", f"{self.base_uri}?max_results={max_results}")
-
-        while True:
-            pipelines.extend(response.get("statuses", builtins.list()))
-            next_page_token = response.get("next_page_token")
-            if next_page_token is None:
-                break
-            response = self.client.api("GET", f"{self.base_uri}?max_results={max_results}&page_token={next_page_token}")
+    def iterate(self, max_results=100) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all pipelines, one page at a time."""
+        return paginate(self.client, self.base_uri, "statuses", {"max_results": max_results})
 
-        return pipelines
+    def list(self, max_results=100):
+        return builtins.list(self.iterate(max_results))
 
     # def list_events_by_id(self):
     #     return self.client.execute_get_json(f"{self.base_uri}/{pipeline_id}/events")
@@ -33,7 +28,7 @@ class PipelinesClient(ApiContainer):
         return self.client.api("GET", f"{self.base_uri}/{pipeline_id}", _expected=(200, 404))
 
     def get_by_name(self, pipeline_name):
-        for pipeline in self.list():
+        for pipeline in self.iterate():
             if pipeline.get("name") == pipeline_name:
                 pipeline_id = pipeline.get("pipeline_id")
                 return self.get_by_id(pipeline_id)
@@ -1,38 +1,34 @@
-from typing import Any, Dict, Union, List
+from typing import Any, Dict, Iterable, Iterator, Union, List
 from dbacademy.dbrest import DBAcademyRestClient
 import builtins
 
 from dbacademy.clients.rest.common import ApiContainer
+from dbacademy.clients.rest.pagination import paginate
 
 
 class RunsClient(ApiContainer):
+    TERMINAL_STATES = ("TERMINATED", "INTERNAL_ERROR", "SKIPPED")
+
     def __init__(self, client: DBAcademyRestClient):
         self.client = client
 
     def get(self, run_id: Union[str, int]) -> Dict[str, Any]:
         return self.client.api("GET", f"{self.client.endpoint}/api/2.0/jobs/runs/get?run_id={run_id}")
 
+    def iterate(self, job_id: Union[str, int] = None, offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Lazily iterate over all runs, or over the runs of the specified job, one page at a time."""
+        data = {"limit": 1000} if job_id is None else {"limit": 1000, "job_id": job_id}
+        return paginate(self.client, f"{self.client.endpoint}/api/2.0/jobs/runs/list", "runs", data, style="offset", offset=offset)
+
     def list(self, runs: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         runs = runs or builtins.list()
-        url = f"{self.client.endpoint}/api/2.0/jobs/runs/list?limit=1000&offset={len(runs)}"
-        json_response = self.client.api("GET", url)
-        runs.extend(json_response.get("runs", builtins.list()))
-
-        if not json_response.get("has_more", False):
-            return runs
-        else:
-            return self.list(runs)
+        runs.extend(self.iterate(offset=len(runs)))
+        return runs
 
     def list_by_job_id(self, job_id: Union[str, int], runs: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         runs = runs or builtins.list()
-        url = f"{self.client.endpoint}/api/2.0/jobs/runs/list?limit=1000&offset={len(runs)}&job_id={job_id}"
-        json_response = self.client.api("GET", url)
-        runs.extend(json_response.get("runs", builtins.list()))
-
-        if not json_response.get("has_more", False):
-            return runs
-        else:
-            return self.list_by_job_id(job_id, runs)
+        runs.extend(self.iterate(job_id, offset=len(runs)))
+        return runs
 
     def cancel(self, run_id: Union[str, int]) -> Dict[str, Any]:
         return self.client.api("POST", f"{self.client.endpoint}/api/2.0/jobs/runs/cancel", run_id=run_id)
@@ -41,21 +37,38 @@ class RunsClient(ApiContainer):
         return self.client.api("POST", f"{self.client.endpoint}/api/2.0/jobs/runs/delete", run_id=run_id, _expected=(200, 400))
 
     def wait_for(self, run_id: Union[str, int]) -> Dict[str, Any]:
+        return next(self.wait_for_all([run_id]))
+
+    def wait_for_all(self, run_ids: Iterable[Union[str, int]], *, min_interval: float = 5, max_interval: float = 30, backoff: float = 1.5) -> Iterator[Dict[str, Any]]:
+        """
+        Wait for many runs at once, yielding each run as it reaches a terminal state, in the order they finish.
+
+        All pending runs are polled in a single loop; the delay between polls starts at min_interval and grows by
+        the backoff factor up to max_interval, so short runs are noticed quickly and long runs are not over-polled.
+        """
         import time
 
-        wait = 15
-        response = self.get(run_id)
-        state = response["state"]["life_cycle_state"]
-        job_id = response.get("job_id", 0)
+        pending = builtins.list(dict.fromkeys(run_ids))
+        states = dict()
+        interval = min_interval
+
+        while True:
+            for run_id in builtins.list(pending):
+                response = self.get(run_id)
+                state = response["state"]["life_cycle_state"]
+
+                if state in self.TERMINAL_STATES:
+                    pending.remove(run_id)
+                    yield response
+
+                elif states.get(run_id) != state:
+                    job_id = response.get("job_id", 0)
+                    print(f" - Job #{job_id}-{run_id} is {state}")
 
-        if state != "TERMINATED" and state != "INTERNAL_ERROR" and state != "SKIPPED":
-            if state == "PENDING" or state == "RUNNING":
-                print(f" - Job #{job_id}-{run_id} is {state}, checking again in {wait} seconds")
-                time.sleep(wait)
-            else:
-                print(f" - Job #{job_id}-{run_id} is {state}, checking again in 5 seconds")
-                time.sleep(5)
+                states[run_id] = state
 
-            return self.wait_for(run_id)
+            if len(pending) == 0:
+                return
 
-        return response
+            time.sleep(interval)
+            interval = min(max_interval, interval * backoff)
@@ -135,3 +135,20 @@ class ScimUsersClient(ApiContainer):
         }
         url = f"{self.client.endpoint}/api/2.0/preview/scim/v2/Users/{user_id}"
         return self.client.api("PATCH", url, params)
+
+    def remove_entitlements(self, user_id: str, entitlements: List[str]) -> Optional[Dict[str, Any]]:
+        if len(entitlements) == 0:
+            return None
+
+        # One PATCH with a remove operation per entitlement, each using the same path as remove_entitlement().
+        params = {
+            "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
+            "Operations": [
+                {
+                    "op": "remove",
+                    "path": f"""entitlements[value eq "{entitlement}"]""",
+                } for entitlement in entitlements
+            ]
+        }
+        url = f"{self.client.endpoint}/api/2.0/preview/scim/v2/Users/{user_id}"
+        return self.client.api("PATCH", url, params)
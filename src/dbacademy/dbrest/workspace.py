@@ -1,4 +1,4 @@
-from typing import Union, Dict, Any, List, Optional
+from typing import Union, Dict, Any, Iterator, List, Optional
 from dbacademy.dbrest import DBAcademyRestClient
 from dbacademy.clients.rest.common import ApiContainer
 
@@ -7,7 +7,7 @@ class WorkspaceClient(ApiContainer):
     def __init__(self, client: DBAcademyRestClient):
         self.client = client
 
-    def ls(self, path: str, recursive: bool = False, object_types: List[str] = None) -> Optional[List[Dict[str, Any]]]:
+    def ls(self, path: str, recursive: bool = False, object_types: List[str] = None, max_workers: int = 8) -> Optional[List[Dict[str, Any]]]:
 
         object_types = object_types or ["NOTEBOOK"]
 
@@ -23,23 +23,52 @@ class WorkspaceClient(ApiContainer):
             except Exception as e:
                 raise Exception(f"Unexpected exception listing {path}") from e
         else:
-            entities = []
-            queue = self.ls(path)
-            
-            if queue is None:
+            objects = self.ls(path)
+
+            if objects is None:
                 return None
 
-            while len(queue) > 0:
-                next_item = queue.pop()
-                object_type = next_item["object_type"]
-                if object_type in object_types:
-                    entities.append(next_item)
-                elif object_type == "DIRECTORY":
-                    result = self.ls(next_item["path"])
-                    if result is not None:
-                        queue.extend(result)
+            return list(self.__walk(objects, object_types, max_workers))
+
+    def walk(self, path: str, object_types: List[str] = None, max_workers: int = 8) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily lists the objects of the specified types under path, recursively, yielding each directory's objects as
+        soon as it has been listed. Up to max_workers directories are listed concurrently, so the time taken grows with
+        the depth of the tree rather than with the number of directories. Nothing is yielded if path does not exist.
+        """
+        return self.__walk(self.ls(path) or [], object_types or ["NOTEBOOK"], max_workers)
+
+    def __walk(self, objects: List[Dict[str, Any]], object_types: List[str], max_workers: int) -> Iterator[Dict[str, Any]]:
+        import queue
+        from multiprocessing.pool import ThreadPool
 
-            return entities
+        listed = queue.Queue()
+
+        def list_directory(directory: str) -> None:
+            try:
+                listed.put((self.ls(directory) or [], None))
+            except Exception as ex:
+                listed.put((None, ex))
+
+        # The pool is terminated when the generator is closed, abandoning any listings still in flight.
+        with ThreadPool(max(1, max_workers)) as pool:
+            listed.put((objects, None))
+            pending = 1
+
+            while pending > 0:
+                results, error = listed.get()
+                pending -= 1
+
+                if error is not None:
+                    raise error
+
+                for result in results:
+                    object_type = result["object_type"]
+                    if object_type in object_types:
+                        yield result
+                    elif object_type == "DIRECTORY":
+                        pool.apply_async(list_directory, (result["path"],))
+                        pending += 1
 
     def mkdirs(self, path: str) -> Dict[str, Any]:
         params = {"path": path}
@@ -63,36 +92,26 @@ class WorkspaceClient(ApiContainer):
         return self.client.api("POST", f"{self.client.endpoint}/api/2.0/workspace/import", payload)
 
     def import_dbc_files(self, target_path: str, source_url: str, overwrite: bool = True, local_file_path: str = None) -> Dict[str, Any]:
-        import os, base64
-        from urllib import request
+        from dbacademy.clients.rest.streaming import Base64FileBody, download_file
 
         if local_file_path is None and source_url is None:
             raise AssertionError(f"Either the local_file_path ({local_file_path}) or source_url ({source_url}) parameter must be specified")
 
-        if local_file_path is None:
-            file_name = source_url.split("/")[-1]
-            local_file_path = f"/tmp/{file_name}"
-
         if source_url is not None:
-            if os.path.exists(local_file_path):
-                os.remove(local_file_path)
-
-            request.urlretrieve(source_url, local_file_path)
-
-        with open(local_file_path, mode='rb') as file:
-            content = file.read()
+            # Reused if this process already downloaded it, e.g. when importing the same DBC into many workspaces.
+            local_file_path = download_file(source_url, local_file_path)
 
         if overwrite:
             self.delete_path(target_path)
 
         self.mkdirs("/".join(target_path.split("/")[:-1]))
 
-        payload = {
-            "content": base64.b64encode(content).decode("utf-8"),
+        # The content is encoded from disk as the request is sent rather than held in memory as one base64 string.
+        payload = Base64FileBody({
             "path": target_path,
             "overwrite": False,
             "format": "DBC",
-        }
+        }, "content", local_file_path)
         return self.client.api("POST", f"{self.client.endpoint}/api/2.0/workspace/import", payload)
 
     def import_notebook(self, language: str, notebook_path: str, content: str, overwrite: bool = True) -> Dict[str, Any]:
@@ -0,0 +1,202 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from requests.exceptions import ConnectionError
+
+from dbacademy.clients.classrooms.monitor import ScanCheckpoint, scan_workspaces_streaming
+
+
+class FakeWorkspace(dict):
+    """Stands in for an accounts Workspace; the scan only uses its url and dict fields."""
+
+    def __init__(self, number: int):
+        super().__init__(deployment_name=f"ws-{number}", workspace_name=f"Workspace {number}")
+        self.url = f"https://ws-{number}.cloud.databricks.com/api/"
+
+
+class ConcurrencyProbe:
+    """A scan function that records the maximum number of workspaces being worked on at once."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def __call__(self, ws):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.seconds)
+            return {"name": ws["workspace_name"]}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestScanWorkspacesStreaming(unittest.TestCase):
+
+    def test_results(self):
+        workspaces = [FakeWorkspace(i) for i in range(10)]
+        rows = list(scan_workspaces_streaming(lambda ws: [1, 2], workspaces, max_workers=3, progress_seconds=None))
+
+        self.assertEqual(20, len(rows))
+        self.assertEqual({ws.url for ws in workspaces}, {ws.url for ws, _, _ in rows})
+        self.assertTrue(all(r == {"result": 1} or r == {"result": 2} for _, r, _ in rows))
+        self.assertTrue(all(e is None for _, _, e in rows))
+
+    def test_max_workers(self):
+        probe = ConcurrencyProbe(0.05)
+        rows = list(scan_workspaces_streaming(probe, [FakeWorkspace(i) for i in range(20)], max_workers=4, progress_seconds=None))
+
+        self.assertEqual(20, len(rows))
+        self.assertLessEqual(probe.max_active, 4)
+
+    def test_timeout_counts_against_max_workers(self):
+        probe = ConcurrencyProbe(0.3)
+        rows = list(scan_workspaces_streaming(probe, [FakeWorkspace(i) for i in range(10)],
+                                              max_workers=2, timeout_seconds=0.1, progress_seconds=None))
+
+        self.assertEqual(10, len(rows))
+        self.assertTrue(all(isinstance(e, TimeoutError) for _, _, e in rows))
+        self.assertLessEqual(probe.max_active, 2)
+
+    def test_timeout_keeps_fast_results(self):
+        def function(ws):
+            if ws["deployment_name"] == "ws-0":
+                time.sleep(0.5)
+            return "ok"
+
+        rows = list(scan_workspaces_streaming(function, [FakeWorkspace(i) for i in range(5)],
+                                              max_workers=5, timeout_seconds=0.2, progress_seconds=None))
+
+        errors = {ws["deployment_name"]: e for ws, _, e in rows}
+        self.assertIsInstance(errors.pop("ws-0"), TimeoutError)
+        self.assertEqual({None}, set(errors.values()))
+
+    def test_exception(self):
+        def function(_ws):
+            raise ValueError("broken")
+
+        scan = scan_workspaces_streaming(function, [FakeWorkspace(0)], progress_seconds=None)
+        self.assertRaises(ValueError, list, scan)
+
+    def test_progress(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            list(scan_workspaces_streaming(ConcurrencyProbe(0.05), [FakeWorkspace(i) for i in range(6)],
+                                           max_workers=2, progress_seconds=0.01))
+
+        lines = output.getvalue().splitlines()
+        self.assertGreater(len(lines), 1)
+        self.assertRegex(lines[0], r"^Scanned \d/6 workspaces in \d+s \(\d+\.\d/s\), ETA (\d+s|unknown)$")
+        self.assertTrue(lines[-1].startswith("Scanned 6/6 workspaces"))
+        self.assertTrue(lines[-1].endswith("ETA 0s"))
+
+    def test_progress_unknown_total(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            list(scan_workspaces_streaming(lambda ws: None, (FakeWorkspace(i) for i in range(3)), progress_seconds=60))
+
+        self.assertRegex(output.getvalue(), r"^Scanned 3 workspaces in \d+s \(\d+\.\d/s\)\n$")
+
+
+class TestScanCheckpoint(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "scan.jsonl")
+        self.workspaces = [FakeWorkspace(i) for i in range(3)]
+        self.scanned = list()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def scan(self, function, **kwargs):
+        def recording_function(ws):
+            self.scanned.append(ws["deployment_name"])
+            return function(ws)
+
+        self.scanned = list()
+        return list(scan_workspaces_streaming(recording_function, self.workspaces, checkpoint_path=self.path,
+                                              progress_seconds=None, **kwargs))
+
+    def records(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_resume_after_failure(self):
+        from dbacademy.clients.rest.common import DatabricksApiException
+
+        def failing(ws):
+            if ws["deployment_name"] == "ws-1":
+                raise DatabricksApiException("Internal error", 500)
+            return {"count": 1}
+
+        self.scan(failing)
+        self.assertEqual({"ws-0", "ws-1", "ws-2"}, set(self.scanned))
+
+        rows = self.scan(lambda ws: {"count": 2})
+        self.assertEqual(["ws-1"], self.scanned)
+        counts = {ws["deployment_name"]: r["count"] for ws, r, _ in rows}
+        self.assertEqual({"ws-0": 1, "ws-1": 2, "ws-2": 1}, counts)
+
+        self.assertEqual(3, len(self.scan(lambda ws: {"count": 3})))
+        self.assertEqual([], self.scanned)
+
+    def test_resume_after_timeout(self):
+        def slow(ws):
+            if ws["deployment_name"] == "ws-0":
+                time.sleep(0.3)
+            return {"count": 1}
+
+        rows = self.scan(slow, timeout_seconds=0.1)
+        self.assertIsInstance({ws["deployment_name"]: e for ws, _, e in rows}["ws-0"], TimeoutError)
+
+        # The abandoned scan of ws-0 completes later, but must not be recorded as a success.
+        time.sleep(0.4)
+        self.assertEqual(["error"], [r["status"] for r in self.records() if r["deployment"] == "ws-0"])
+
+        self.scan(lambda ws: {"count": 2})
+        self.assertEqual(["ws-0"], self.scanned)
+
+    def test_resume_after_ignored_connection_error(self):
+        def unreachable(ws):
+            if ws["deployment_name"] == "ws-2":
+                raise ConnectionError("Connection refused")
+            return {"count": 1}
+
+        rows = self.scan(unreachable, ignore_connection_errors=True)
+        self.assertEqual({"ws-0", "ws-1"}, {ws["deployment_name"] for ws, _, _ in rows})
+        self.assertEqual("error", [r for r in self.records() if r["deployment"] == "ws-2"][0]["status"])
+
+        self.scan(lambda ws: {"count": 2}, ignore_connection_errors=True)
+        self.assertEqual(["ws-2"], self.scanned)
+
+    def test_empty_results(self):
+        self.assertEqual([], self.scan(lambda ws: None))
+        self.assertEqual([], self.scan(lambda ws: None))
+        self.assertEqual([], self.scanned)
+
+    def test_results_not_json(self):
+        from datetime import datetime
+
+        rows = self.scan(lambda ws: {"started": datetime(2023, 1, 1)})
+        self.assertEqual(3, len(rows))
+        self.assertEqual({"error"}, {r["status"] for r in self.records()})
+
+        self.assertFalse(ScanCheckpoint(self.path).is_complete(self.workspaces[0]))
+        self.scan(lambda ws: {"started": "2023-01-01"})
+        self.assertEqual(3, len(self.scanned))
+        self.assertTrue(ScanCheckpoint(self.path).is_complete(self.workspaces[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
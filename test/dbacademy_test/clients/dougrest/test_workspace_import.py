@@ -0,0 +1,44 @@
+import base64
+import unittest
+from unittest import mock
+
+from dbacademy.clients.dougrest.workspace import Workspace
+
+
+class FakeDatabricks:
+    """Records the API calls made by the Workspace."""
+
+    def __init__(self):
+        self.calls = list()
+
+    def api(self, method, path, data=None):
+        self.calls.append((method, path, data))
+        return {}
+
+
+class TestImportFromUrl(unittest.TestCase):
+
+    def test_source_format_base64_encoded(self):
+        databricks = FakeDatabricks()
+        response = mock.MagicMock(content=b"# Databricks notebook source\nprint(1)")
+
+        with mock.patch("requests.get", return_value=response):
+            Workspace(databricks).import_from_url("https://example.com/Lesson.py", "/Users/someone/Lesson", format="SOURCE")
+
+        method, path, data = databricks.calls[0]
+        self.assertEqual(("POST", "2.0/workspace/import"), (method, path))
+        self.assertEqual("SOURCE", data["format"])
+        self.assertEqual(response.content, base64.b64decode(data["content"]))
+
+    def test_other_formats_base64_encoded(self):
+        databricks = FakeDatabricks()
+        response = mock.MagicMock(content=b"<html></html>")
+
+        with mock.patch("requests.get", return_value=response):
+            Workspace(databricks).import_from_url("https://example.com/Lesson.html", "/Users/someone/Lesson", format="HTML")
+
+        self.assertEqual(response.content, base64.b64decode(databricks.calls[0][2]["content"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import threading
+import time
+import unittest
+
+from dbacademy.clients.rest.factory import AzureTokenCache
+
+
+class TestAzureTokenCache(unittest.TestCase):
+
+    def sign_in(self, expires_in: float = 3600, delay: float = 0):
+        def sign_in():
+            self.calls += 1
+            time.sleep(delay)
+            return {"access_token": f"token-{self.calls}", "expires_in": expires_in}
+        return sign_in
+
+    def setUp(self) -> None:
+        self.calls = 0
+
+    def test_cached(self):
+        cache = AzureTokenCache()
+        self.assertEqual("token-1", cache.get("key", self.sign_in()))
+        self.assertEqual("token-1", cache.get("key", self.sign_in()))
+        self.assertEqual(1, self.calls)
+
+    def test_keys(self):
+        cache = AzureTokenCache()
+        self.assertEqual("token-1", cache.get("key-a", self.sign_in()))
+        self.assertEqual("token-2", cache.get("key-b", self.sign_in()))
+
+    def test_expired(self):
+        cache = AzureTokenCache()
+        self.assertEqual("token-1", cache.get("key", self.sign_in(expires_in=0)))
+        self.assertEqual("token-2", cache.get("key", self.sign_in(expires_in=0)))
+
+    def test_expires_on(self):
+        cache = AzureTokenCache()
+        cache.get("key", lambda: {"access_token": "token", "expires_on": str(time.time() + 3600)})
+        self.assertEqual("token", cache.get("key", self.sign_in()))
+        self.assertEqual(0, self.calls)
+
+    def test_background_refresh(self):
+        cache = AzureTokenCache()
+        cache.refresh_margin_seconds = 60
+        self.assertEqual("token-1", cache.get("key", self.sign_in(expires_in=30)))
+        # Within the margin, the current token is returned while a replacement is fetched.
+        self.assertEqual("token-1", cache.get("key", self.sign_in()))
+        token = None
+        for _ in range(100):
+            token = cache.get("key", self.sign_in())
+            if token != "token-1":
+                break
+            time.sleep(0.01)
+        self.assertEqual("token-2", token)
+        self.assertEqual(2, self.calls)
+
+    def test_single_flight(self):
+        cache = AzureTokenCache()
+        results = []
+        sign_in = self.sign_in(delay=0.1)
+        threads = [threading.Thread(target=lambda: results.append(cache.get("key", sign_in))) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, self.calls)
+        self.assertEqual(["token-1"] * 10, results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from dbacademy.clients.rest.common import ApiClient
+from dbacademy.clients.rest.connection_pool import connection_pool_manager
+
+
+class TestConnectionPoolManager(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        connection_pool_manager.disable()
+
+    def test_disabled_by_default(self):
+        client_a = ApiClient("https://a.cloud.databricks.com/api/", token="a")
+        client_b = ApiClient("https://b.cloud.databricks.com/api/", token="b")
+        self.assertIsNot(client_a.http_adapter, client_b.http_adapter)
+
+    def test_shared(self):
+        adapter = connection_pool_manager.enable(pool_connections=5, pool_maxsize=2, pool_block=True)
+        client_a = ApiClient("https://a.cloud.databricks.com/api/", token="a")
+        client_b = ApiClient("https://b.cloud.databricks.com/api/", token="b")
+        self.assertIs(adapter, client_a.http_adapter)
+        self.assertIs(adapter, client_b.session.get_adapter("https://b.cloud.databricks.com/api/"))
+        self.assertNotEqual(client_a.session.headers["Authorization"], client_b.session.headers["Authorization"])
+
+    def test_disable(self):
+        connection_pool_manager.enable()
+        connection_pool_manager.disable()
+        self.assertIsNone(connection_pool_manager.adapter)
+
+
+if __name__ == '__main__':
+    unittest.main()
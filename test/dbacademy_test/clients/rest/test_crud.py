@@ -0,0 +1,96 @@
+import unittest
+
+from dbacademy.clients.rest.common import DatabricksApiException
+from dbacademy.clients.rest.crud import CRUD
+
+
+class Widgets(CRUD):
+    """An in-memory CRUD that counts the number of list calls made."""
+
+    def __init__(self):
+        super().__init__(None, "/widgets", "widget")
+        self.items = {}
+        self.next_id = 1
+        self.list_calls = 0
+
+    def _list(self, *, _expected=None):
+        self.list_calls += 1
+        return [dict(item) for item in self.items.values()]
+
+    def _get(self, item_id, *, _expected=None):
+        return self.items.get(item_id)
+
+    def _create(self, item, *, _expected=None):
+        item_id = self.next_id
+        self.next_id += 1
+        self.items[item_id] = dict(item, widget_id=item_id)
+        return item_id
+
+    def _update(self, item, *, _expected=None):
+        self.items[item["widget_id"]].update(item)
+        return item["widget_id"]
+
+    def _delete(self, item_id, *, _expected=None):
+        return self.items.pop(item_id, None)
+
+
+class TestCrudIndex(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        widgets = Widgets()
+        widgets.create_by_example({"widget_name": "a"})
+        widgets.get_by_name("a")
+        widgets.get_by_name("a")
+        self.assertEqual(2, widgets.list_calls)
+
+    def test_repeated_lookups(self):
+        widgets = Widgets()
+        for name in "abc":
+            widgets.create_by_example({"widget_name": name})
+        widgets.enable_index(ttl_seconds=60)
+        for name in "abcabc":
+            self.assertEqual(name, widgets.get_by_name(name)["widget_name"])
+        self.assertIsNone(widgets.get_by_name("z", if_not_exists="ignore"))
+        self.assertEqual(1, widgets.list_calls)
+
+    def test_invalidated_on_write(self):
+        widgets = Widgets()
+        widgets.enable_index(ttl_seconds=60)
+        self.assertIsNone(widgets.get_by_name("a", if_not_exists="ignore"))
+        widgets.create_by_example({"widget_name": "a"})
+        widget = widgets.get_by_name("a")
+        self.assertEqual(2, widgets.list_calls)
+
+        widgets.delete_by_id(widget["widget_id"])
+        self.assertRaises(DatabricksApiException, widgets.get_by_name, "a")
+        self.assertEqual(3, widgets.list_calls)
+
+    def test_expired(self):
+        widgets = Widgets()
+        widgets.create_by_example({"widget_name": "a"})
+        widgets.enable_index(ttl_seconds=0)
+        widgets.get_by_name("a")
+        widgets.get_by_name("a")
+        self.assertEqual(2, widgets.list_calls)
+
+
+class TestCrudDocs(unittest.TestCase):
+
+    def test_docs_formatted(self):
+        widgets = Widgets()
+        self.assertNotIn("{plural}", widgets.list.__doc__)
+        self.assertTrue(Widgets.__dict__.get("_CRUD__docs_formatted"))
+
+    def test_docs_formatted_once(self):
+        Widgets()
+        doc = Widgets.list.__doc__
+        Widgets.list.__doc__ = "{plural} unformatted"
+        try:
+            Widgets()
+            self.assertEqual("{plural} unformatted", Widgets.list.__doc__)
+        finally:
+            Widgets.list.__doc__ = doc
+
+
+if __name__ == '__main__':
+    unittest.main()
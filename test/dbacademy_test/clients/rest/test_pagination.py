@@ -0,0 +1,61 @@
+import unittest
+
+from dbacademy.clients.rest.pagination import paginate
+
+
+class FakeClient:
+    """Serves a fixed list of items from a paginated endpoint, recording each request."""
+
+    def __init__(self, items, page_size):
+        self.items = items
+        self.page_size = page_size
+        self.requests = []
+
+    def api(self, _http_method, _endpoint_path, _data=None):
+        self.requests.append(dict(_data))
+        if "page_token" in _data or "offset" in _data:
+            start = int(_data.get("page_token", _data.get("offset")))
+        else:
+            start = 0
+        end = start + self.page_size
+        response = {"items": self.items[start:end]}
+        if end < len(self.items):
+            response["has_more"] = True
+            response["next_page_token"] = str(end)
+        return response
+
+
+class TestPagination(unittest.TestCase):
+
+    def test_offset(self):
+        client = FakeClient(list(range(10)), page_size=3)
+        self.assertEqual(list(range(10)), list(paginate(client, "2.1/jobs/list", "items", {"limit": 3}, style="offset")))
+        self.assertEqual([0, 3, 6, 9], [r["offset"] for r in client.requests])
+        self.assertTrue(all(r["limit"] == 3 for r in client.requests))
+
+    def test_offset_start(self):
+        client = FakeClient(list(range(10)), page_size=3)
+        self.assertEqual([4, 5, 6, 7, 8, 9], list(paginate(client, "2.1/jobs/list", "items", style="offset", offset=4)))
+
+    def test_token(self):
+        client = FakeClient(list(range(10)), page_size=4)
+        self.assertEqual(list(range(10)), list(paginate(client, "2.0/pipelines", "items")))
+        self.assertEqual([None, "4", "8"], [r.get("page_token") for r in client.requests])
+
+    def test_stops_early(self):
+        client = FakeClient(list(range(100)), page_size=10)
+        self.assertEqual(15, next(i for i in paginate(client, "2.0/pipelines", "items") if i == 15))
+        self.assertEqual(2, len(client.requests))
+
+    def test_empty(self):
+        client = FakeClient([], page_size=10)
+        self.assertEqual([], list(paginate(client, "2.0/pipelines", "items")))
+        self.assertEqual([], list(paginate(client, "2.0/pipelines", "items", style="offset")))
+
+    def test_invalid_style(self):
+        client = FakeClient([], page_size=10)
+        self.assertRaises(ValueError, list, paginate(client, "2.0/pipelines", "items", style="cursor"))
+
+
+if __name__ == '__main__':
+    unittest.main()
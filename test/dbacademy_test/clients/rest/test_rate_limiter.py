@@ -0,0 +1,53 @@
+import unittest
+
+from dbacademy.clients.rest.common import ApiClient
+from dbacademy.clients.rest.rate_limiter import RateLimiter, TokenBucket, rate_limiter
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_token_bucket_burst(self):
+        bucket = TokenBucket(rate=10, capacity=3)
+        self.assertEqual(0, bucket.reserve())
+        self.assertEqual(0, bucket.reserve())
+        self.assertEqual(0, bucket.reserve())
+        self.assertAlmostEqual(0.1, bucket.reserve(), delta=0.01)
+        self.assertAlmostEqual(0.2, bucket.reserve(), delta=0.01)
+
+    def test_token_bucket_invalid_rate(self):
+        self.assertRaises(ValueError, TokenBucket, 0)
+
+    def test_unlimited_by_default(self):
+        limiter = RateLimiter()
+        self.assertIsNone(limiter.get_bucket("example.cloud.databricks.com"))
+        self.assertEqual(0, limiter.acquire("example.cloud.databricks.com"))
+
+    def test_default_rate_per_key(self):
+        limiter = RateLimiter(default_rate=5)
+        bucket_a = limiter.get_bucket("a.cloud.databricks.com")
+        bucket_b = limiter.get_bucket("b.cloud.databricks.com")
+        self.assertIsNot(bucket_a, bucket_b)
+        self.assertIs(bucket_a, limiter.get_bucket("a.cloud.databricks.com"))
+
+    def test_set_rate(self):
+        limiter = RateLimiter()
+        limiter.set_rate("a.cloud.databricks.com", 2, burst=4)
+        self.assertEqual(2, limiter.get_bucket("a.cloud.databricks.com").rate)
+        self.assertEqual(4, limiter.get_bucket("a.cloud.databricks.com").capacity)
+        limiter.set_rate("a.cloud.databricks.com", None)
+        self.assertIsNone(limiter.get_bucket("a.cloud.databricks.com"))
+
+    def test_shared_across_clients(self):
+        client_a = ApiClient("https://shared.cloud.databricks.com/api/", token="none")
+        client_b = ApiClient("https://shared.cloud.databricks.com/api/", token="none")
+        try:
+            client_a.set_rate_limit(1)
+            self.assertIsNotNone(rate_limiter.get_bucket("shared.cloud.databricks.com"))
+            client_b.set_rate_limit(None)
+            self.assertIsNone(rate_limiter.get_bucket("shared.cloud.databricks.com"))
+        finally:
+            rate_limiter.set_rate("shared.cloud.databricks.com", None)
+
+
+if __name__ == '__main__':
+    unittest.main()
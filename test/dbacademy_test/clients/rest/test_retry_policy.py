@@ -0,0 +1,102 @@
+import unittest
+
+import requests
+
+from dbacademy.clients.rest.common import ApiClient
+from dbacademy.clients.rest.retry import RetryPolicy
+
+
+def response_of(status_code: int, text: str = "{}", headers: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode("utf-8")
+    response.headers.update(headers or {})
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_rate_limited_any_method(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.should_retry_response("POST", response_of(429)))
+        self.assertTrue(policy.should_retry_response("POST", response_of(500, '{"error_code": "REQUEST_LIMIT_EXCEEDED"}')))
+        self.assertFalse(policy.should_retry_response("POST", response_of(500)))
+
+    def test_gateway_errors_idempotent_only(self):
+        policy = RetryPolicy()
+        for status_code in (502, 503, 504):
+            self.assertTrue(policy.should_retry_response("GET", response_of(status_code)))
+            self.assertTrue(policy.should_retry_response("DELETE", response_of(status_code)))
+            self.assertFalse(policy.should_retry_response("POST", response_of(status_code)))
+        self.assertFalse(policy.should_retry_response("GET", response_of(200)))
+        self.assertFalse(policy.should_retry_response("GET", response_of(404)))
+
+    def test_connection_errors(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.should_retry_exception("GET", requests.exceptions.ConnectionError()))
+        self.assertFalse(policy.should_retry_exception("POST", requests.exceptions.ConnectionError()))
+        self.assertTrue(policy.should_retry_exception("POST", requests.exceptions.ConnectTimeout()))
+        self.assertFalse(policy.should_retry_exception("GET", requests.exceptions.ReadTimeout()))
+
+    def test_backoff_full_jitter(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=8)
+        for attempt in range(10):
+            ceiling = min(8, 2 ** attempt)
+            for _ in range(20):
+                self.assertTrue(0 <= policy.backoff(attempt) <= ceiling)
+
+    def test_retry_after(self):
+        policy = RetryPolicy()
+        self.assertEqual(7, policy.backoff(0, response_of(429, headers={"Retry-After": "7"})))
+        self.assertEqual(0, RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"))
+        self.assertIsNone(RetryPolicy.parse_retry_after("garbage"))
+        self.assertIsNone(RetryPolicy.parse_retry_after(None))
+
+    def test_api_retries(self):
+        responses = [response_of(503), response_of(429), response_of(200, '{"ok": true}')]
+        client = ApiClient("https://localhost/api/", token="none",
+                           retry_policy=RetryPolicy(backoff_base=0, backoff_max=0))
+        client.dns_verify = False
+        client.session.request = lambda *args, **kwargs: responses.pop(0)
+
+        self.assertEqual({"ok": True}, client.api("GET", "2.0/clusters/list"))
+        self.assertEqual([], responses)
+
+    def test_api_no_retry_post(self):
+        responses = [response_of(503), response_of(200)]
+        client = ApiClient("https://localhost/api/", token="none",
+                           retry_policy=RetryPolicy(backoff_base=0, backoff_max=0))
+        client.dns_verify = False
+        client.session.request = lambda *args, **kwargs: responses.pop(0)
+
+        self.assertRaises(requests.HTTPError, client.api, "POST", "2.0/clusters/create")
+        self.assertEqual(1, len(responses))
+
+    def test_api_max_total_seconds(self):
+        attempts = []
+
+        def request(*args, **kwargs):
+            attempts.append(args)
+            raise requests.exceptions.ConnectionError("Connection reset by peer")
+
+        client = ApiClient("https://localhost/api/", token="none",
+                           retry_policy=RetryPolicy(backoff_base=10, backoff_max=10, max_total_seconds=0))
+        client.dns_verify = False
+        client.session.request = request
+
+        self.assertRaises(requests.exceptions.ConnectionError, client.api, "GET", "2.0/clusters/list")
+        self.assertEqual(1, len(attempts))
+
+    def test_max_retries_not_shared(self):
+        parent = ApiClient("https://localhost/api/", token="none")
+        child = ApiClient("https://localhost/api/2.0/", client=parent)
+        self.assertIs(parent.retry_policy, child.retry_policy)
+
+        child.max_retries = 3
+        self.assertEqual(3, child.max_retries)
+        self.assertEqual(25, parent.max_retries)
+        self.assertIsNot(parent.retry_policy, child.retry_policy)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,238 @@
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from dbacademy.clients.rest.common import ApiClient
+from dbacademy.clients.rest.retry import RetryPolicy
+from dbacademy.clients.rest.streaming import Base64FileBody, download_file
+
+
+class TestBase64FileBody(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write_file(self, content: bytes) -> str:
+        file_path = os.path.join(self.temp_dir.name, "Lessons.dbc")
+        with open(file_path, "wb") as f:
+            f.write(content)
+        return file_path
+
+    def expected(self, payload: dict, content: bytes) -> bytes:
+        return json.dumps({**payload, "content": base64.b64encode(content).decode("utf-8")}).encode("utf-8")
+
+    def test_matches_json(self):
+        payload = {"path": "/Users/someone/Lessons", "overwrite": False, "format": "DBC"}
+
+        # Sizes either side of a chunk boundary, and of every base64 padding length.
+        for size in [0, 1, 2, 3, Base64FileBody.CHUNK_SIZE - 1, Base64FileBody.CHUNK_SIZE, 2 * Base64FileBody.CHUNK_SIZE + 1]:
+            content = os.urandom(size)
+            body = Base64FileBody(payload, "content", self.write_file(content))
+            expected = self.expected(payload, content)
+
+            self.assertEqual(expected, b"".join(body.open()), f"size={size}")
+            self.assertEqual(len(expected), len(body), f"size={size}")
+            self.assertEqual(len(expected), len(body.open()), f"size={size}")
+            self.assertEqual(expected, json.dumps(json.loads(body.open().read())).encode("utf-8"), f"size={size}")
+
+    def test_empty_payload(self):
+        body = Base64FileBody({}, "content", self.write_file(b"abc"))
+        self.assertEqual({"content": "YWJj"}, json.loads(body.open().read()))
+
+    def test_read_chunks(self):
+        content = os.urandom(Base64FileBody.CHUNK_SIZE + 7)
+        body = Base64FileBody({"path": "/x"}, "content", self.write_file(content))
+
+        stream = body.open()
+        chunks = list()
+        while True:
+            chunk = stream.read(8192)
+            if not chunk:
+                break
+            self.assertLessEqual(len(chunk), 8192)
+            chunks.append(chunk)
+
+        self.assertEqual(self.expected({"path": "/x"}, content), b"".join(chunks))
+
+    def test_content_key_in_payload(self):
+        self.assertRaises(AssertionError, Base64FileBody, {"content": ""}, "content", self.write_file(b""))
+
+    def test_api_retries_with_fresh_stream(self):
+        content = os.urandom(1000)
+        body = Base64FileBody({"path": "/x", "format": "DBC"}, "content", self.write_file(content))
+        sent = list()
+
+        def request(method, url, data=None, **kwargs):
+            sent.append(data.read())
+            response = requests.Response()
+            response.status_code = 429 if len(sent) == 1 else 200
+            response._content = b"{}"
+            return response
+
+        client = ApiClient("https://localhost/api/", token="none",
+                           retry_policy=RetryPolicy(backoff_base=0, backoff_max=0))
+        client.dns_verify = False
+        client.session.request = request
+
+        self.assertEqual({}, client.api("POST", "2.0/workspace/import", body))
+        self.assertEqual([self.expected(body.payload, content)] * 2, sent)
+        self.assertRaises(AssertionError, client.api, "POST", "2.0/workspace/import", body, overwrite=True)
+
+    def test_file_replaced(self):
+        file_path = self.write_file(b"abc")
+        body = Base64FileBody({"path": "/x"}, "content", file_path)
+
+        other_path = os.path.join(self.temp_dir.name, "Other.dbc")
+        with open(other_path, "wb") as f:
+            f.write(b"abcdef")
+        os.replace(other_path, file_path)
+
+        self.assertRaises(IOError, body.open().read)
+
+
+class FakeDownloads:
+    """Stands in for requests.get(), serving the content of each URL and counting the downloads of each."""
+
+    def __init__(self, content: dict, seconds: float = 0, fail: bool = False):
+        self.content = content
+        self.seconds = seconds
+        self.fail = fail
+        self.lock = threading.Lock()
+        self.requests = list()
+        self.active = 0
+        self.max_active = 0
+
+    def get(self, url, stream=False, timeout=None):
+        with self.lock:
+            self.requests.append((url, stream, timeout))
+
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.side_effect = lambda chunk_size: self.chunks(url)
+        return response
+
+    def chunks(self, url):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.seconds)
+            yield self.content[url][:1]
+            if self.fail:
+                raise requests.exceptions.ChunkedEncodingError("Connection broken")
+            yield self.content[url][1:]
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestDownloadFile(unittest.TestCase):
+
+    CONTENT = {"https://example.com/a.dbc": b"aaa", "https://example.com/b.dbc": b"bbb"}
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "download.dbc")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def download(self, url: str, **kwargs) -> bytes:
+        local_file_path = download_file(url, self.path, **kwargs)
+        self.assertEqual(self.path, local_file_path)
+
+        with open(local_file_path, "rb") as f:
+            return f.read()
+
+    def download_concurrently(self, urls):
+        results = [None] * len(urls)
+
+        def download(i):
+            results[i] = download_file(urls[i], self.path)
+
+        threads = [threading.Thread(target=download, args=(i,)) for i in range(len(urls))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    def test_reuse(self):
+        downloads = FakeDownloads(self.CONTENT)
+
+        with mock.patch("requests.get", downloads.get):
+            self.assertEqual(b"aaa", self.download("https://example.com/a.dbc"))
+            self.assertEqual(b"aaa", self.download("https://example.com/a.dbc"))
+            self.assertEqual(1, len(downloads.requests))
+
+            self.assertEqual(b"aaa", self.download("https://example.com/a.dbc", reuse=False))
+            self.assertEqual(2, len(downloads.requests))
+
+            # The same path, but a different URL
+            self.assertEqual(b"bbb", self.download("https://example.com/b.dbc"))
+            self.assertEqual(3, len(downloads.requests))
+
+    def test_default_path(self):
+        downloads = FakeDownloads(self.CONTENT)
+
+        with mock.patch("tempfile.gettempdir", return_value=self.temp_dir.name):
+            with mock.patch("requests.get", downloads.get):
+                path_a = download_file("https://example.com/a.dbc")
+                path_b = download_file("https://example.com/b.dbc")
+
+        self.assertEqual(self.temp_dir.name, os.path.dirname(path_a))
+        self.assertTrue(path_a.endswith("-a.dbc"))
+        self.assertNotEqual(path_a, path_b)
+
+    def test_timeout(self):
+        downloads = FakeDownloads(self.CONTENT)
+
+        with mock.patch("requests.get", downloads.get):
+            self.download("https://example.com/a.dbc", timeout=(1, 2))
+
+        self.assertEqual([("https://example.com/a.dbc", True, (1, 2))], downloads.requests)
+
+    def test_concurrent_callers(self):
+        downloads = FakeDownloads(self.CONTENT, seconds=0.05)
+
+        with mock.patch("requests.get", downloads.get):
+            self.assertEqual([self.path] * 5, self.download_concurrently(["https://example.com/a.dbc"] * 5))
+
+        self.assertEqual(1, len(downloads.requests))
+        with open(self.path, "rb") as f:
+            self.assertEqual(b"aaa", f.read())
+
+    def test_concurrent_callers_different_urls(self):
+        downloads = FakeDownloads(self.CONTENT, seconds=0.05)
+
+        with mock.patch("requests.get", downloads.get):
+            self.download_concurrently(["https://example.com/a.dbc", "https://example.com/b.dbc"] * 2)
+
+        # Downloads to the same path never overlap, whatever their URL.
+        self.assertEqual(4, len(downloads.requests))
+        self.assertEqual(1, downloads.max_active)
+
+    def test_failed_download_cleaned_up(self):
+        with mock.patch("requests.get", FakeDownloads(self.CONTENT).get):
+            self.download("https://example.com/a.dbc")
+
+        with mock.patch("requests.get", FakeDownloads(self.CONTENT, fail=True).get):
+            self.assertRaises(requests.exceptions.ChunkedEncodingError, self.download, "https://example.com/b.dbc")
+
+        self.assertEqual(["download.dbc"], os.listdir(self.temp_dir.name))
+        with open(self.path, "rb") as f:
+            self.assertEqual(b"aaa", f.read())
+
+if __name__ == '__main__':
+    unittest.main()
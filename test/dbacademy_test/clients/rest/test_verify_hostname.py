@@ -0,0 +1,42 @@
+import socket
+import unittest
+from unittest.mock import patch
+
+from requests.exceptions import ConnectionError
+
+from dbacademy.clients.rest.common import ApiClient
+
+
+class TestVerifyHostname(unittest.TestCase):
+
+    def setUp(self) -> None:
+        ApiClient.clear_dns_cache()
+
+    def tearDown(self) -> None:
+        ApiClient.clear_dns_cache()
+
+    def test_positive_cached(self):
+        client = ApiClient("https://cached.cloud.databricks.com/api/", token="none")
+        with patch("socket.gethostbyname", return_value="127.0.0.1") as lookup:
+            client._verify_hostname(client.url)
+            client._verify_hostname(client.url + "2.0/clusters/list")
+            self.assertEqual(1, lookup.call_count)
+
+    def test_negative_cached(self):
+        client = ApiClient("https://missing.cloud.databricks.com/api/", token="none")
+        with patch("socket.gethostbyname", side_effect=socket.gaierror("not found")) as lookup:
+            self.assertRaises(ConnectionError, client._verify_hostname, client.url)
+            self.assertRaises(ConnectionError, client._verify_hostname, client.url)
+            self.assertEqual(1, lookup.call_count)
+
+    def test_expired(self):
+        client = ApiClient("https://expired.cloud.databricks.com/api/", token="none")
+        client.dns_cache_seconds = 0
+        with patch("socket.gethostbyname", return_value="127.0.0.1") as lookup:
+            client._verify_hostname(client.url)
+            client._verify_hostname(client.url)
+            self.assertEqual(2, lookup.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from dbacademy.dbbuild.publish.publish_manifest_class import PublishManifest
+
+
+class TestPublishManifest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "manifests", "publish.json")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_fingerprint(self):
+        a = PublishManifest.fingerprint(source="print(1)", replacements={"a": "1", "b": "2"})
+        b = PublishManifest.fingerprint(replacements={"b": "2", "a": "1"}, source="print(1)")
+        c = PublishManifest.fingerprint(source="print(1)", replacements={"a": "1", "b": "3"})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+
+    def test_round_trip(self):
+        manifest = PublishManifest(self.path)
+        self.assertIsNone(manifest.get("abc"))
+        manifest.record("abc", "/Target/Lesson 1", ["Some warning"])
+        manifest.save()
+
+        manifest = PublishManifest(self.path)
+        self.assertEqual({"target_path": "/Target/Lesson 1", "warnings": ["Some warning"]}, manifest.get("abc"))
+
+    def test_superseded(self):
+        manifest = PublishManifest(self.path)
+        manifest.record("abc", "/Target/Lesson 1", [])
+        manifest.record("def", "/Target/Lesson 2", [])
+        manifest.record("ghi", "/Target/Lesson 1", [])
+        self.assertIsNone(manifest.get("abc"))
+        self.assertIsNotNone(manifest.get("def"))
+        self.assertIsNotNone(manifest.get("ghi"))
+
+    def test_other_version_ignored(self):
+        import json
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            json.dump({"version": PublishManifest.VERSION - 1, "entries": {"abc": {"target_path": "/Target/Lesson 1"}}}, f)
+
+        self.assertIsNone(PublishManifest(self.path).get("abc"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,8 @@
+import contextlib
+import io
+import os
+import tempfile
+import time
 import unittest
 
 
@@ -22,5 +27,204 @@ class MyTestCase(unittest.TestCase):
         # self.build_config.validate_all_tests_passed("TES")
 
 
+class FakeNotebook:
+    """Prints several lines while publishing, pausing between them so that concurrent notebooks would interleave."""
+
+    def __init__(self, path: str, fail: bool = False):
+        self.path = path
+        self.fail = fail
+        self.errors = list()
+        self.warnings = list()
+        self.published_with = None
+
+    def publish(self, **kwargs):
+        self.published_with = kwargs
+        for i in range(3):
+            print(f"{self.path}: line {i}")
+            time.sleep(0.01)
+        if self.fail:
+            raise ValueError(f"Failed to publish {self.path}")
+
+
+class TestPublisherConcurrency(unittest.TestCase):
+
+    def publish_notebooks(self, notebooks, max_workers=4):
+        from dbacademy.dbbuild.publish.publisher_class import Publisher
+
+        # Skips __init__, which requires a workspace for the build config.
+        publisher = Publisher.__new__(Publisher)
+        publisher.source_dir = "/Repos/Examples/example-course-source/Source"
+        publisher.target_dir = "/Repos/Examples/example-course-source/Published"
+        publisher.i18n_resources_dir = None
+        publisher.notebooks = notebooks
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            failed = publisher._Publisher__publish_notebooks(notebooks, False, False, None, frozenset(), None, max_workers)
+        return failed, output.getvalue()
+
+    def test_output_not_interleaved(self):
+        notebooks = [FakeNotebook(f"Lesson {i}") for i in range(6)]
+        failed, output = self.publish_notebooks(notebooks)
+
+        self.assertEqual([], failed)
+        self.assertTrue(all(n.published_with is not None for n in notebooks))
+
+        lines = output.splitlines()
+        self.assertEqual(18, len(lines))
+        for i in range(0, len(lines), 3):
+            path = lines[i].split(":")[0]
+            self.assertEqual([f"{path}: line {n}" for n in range(3)], lines[i:i+3])
+
+    def test_failures_collected(self):
+        notebooks = [FakeNotebook("Lesson 1"), FakeNotebook("Lesson 2", fail=True), FakeNotebook("Lesson 3", fail=True)]
+        failed, output = self.publish_notebooks(notebooks)
+
+        self.assertEqual(["Lesson 2", "Lesson 3"], [n.path for n, _ in failed])
+        self.assertTrue(all(isinstance(e, ValueError) for _, e in failed))
+        self.assertIn("Lesson 1: line 2", output)
+        self.assertIn("Lesson 3: line 2", output)
+
+
+class FakeNotebookSource:
+    """Serves a single source notebook, counting the calls made for it."""
+
+    SOURCE = "# Databricks notebook source\n# INCLUDE_HEADER_FALSE\n\n# COMMAND ----------\n\nprint(1)\n\n# COMMAND ----------\n\n# INCLUDE_FOOTER_FALSE\n"
+
+    def __init__(self, modified_at=None):
+        self.modified_at = modified_at
+        self.exported = 0
+
+    def get_status(self, path):
+        status = {"path": path, "object_type": "NOTEBOOK", "language": "PYTHON"}
+        if self.modified_at is not None:
+            status.update(object_id=1, modified_at=self.modified_at)
+        return status
+
+    def export_notebook(self, _path):
+        self.exported += 1
+        return self.SOURCE
+
+
+class FakeWorkspaceApi:
+    """Records the notebooks imported into, and the paths deleted from, the target workspace."""
+
+    def __init__(self):
+        self.imported = list()
+        self.deleted = list()
+        self.status_requests = 0
+
+    def mkdirs(self, _path):
+        pass
+
+    def import_notebook(self, _language, path, _source):
+        self.imported.append(path)
+
+    def get_status(self, _path):
+        self.status_requests += 1
+        return None
+
+    def delete_path(self, path):
+        self.deleted.append(path)
+
+
+class FakeClient:
+    def __init__(self):
+        self.workspace_api = FakeWorkspaceApi()
+
+    def workspace(self):
+        return self.workspace_api
+
+
+class TestPublishWithManifest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        from dbacademy.dbbuild.publish.publish_manifest_class import PublishManifest
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest = PublishManifest(os.path.join(self.temp_dir.name, "publish.json"))
+        self.client = FakeClient()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def create_notebook(self, notebook_source: FakeNotebookSource):
+        from dbacademy.dbbuild.build_config_class import BuildConfig
+        from dbacademy.dbbuild.publish.notebook_def_class import NotebookDef
+
+        # Skips __init__, which requires a workspace.
+        build_config = BuildConfig.__new__(BuildConfig)
+        build_config._BuildConfig__client = self.client
+        build_config.notebook_source = notebook_source
+
+        return NotebookDef(build_config=build_config,
+                           path="Lesson 1",
+                           replacements={},
+                           include_solution=True,
+                           test_round=2,
+                           ignored=False,
+                           order=0,
+                           i18n=False,
+                           i18n_language=None,
+                           ignoring=[],
+                           version="1.2.3")
+
+    def publish(self, notebook, published_paths=None):
+        with contextlib.redirect_stdout(io.StringIO()):
+            notebook.publish(source_dir="/Source",
+                             target_dir="/Published",
+                             i18n_resources_dir="/Resources",
+                             verbose=False,
+                             debugging=False,
+                             other_notebooks=[notebook],
+                             manifest=self.manifest,
+                             published_paths=published_paths)
+
+    def test_unchanged_skipped(self):
+        notebook_source = FakeNotebookSource()
+        self.publish(self.create_notebook(notebook_source), published_paths=frozenset())
+        self.assertEqual(["/Published/Lesson 1", "/Published/Solutions/Lesson 1"], self.client.workspace_api.imported)
+
+        self.publish(self.create_notebook(notebook_source), published_paths=frozenset(self.client.workspace_api.imported))
+        self.assertEqual(2, len(self.client.workspace_api.imported))
+        self.assertEqual(0, self.client.workspace_api.status_requests)
+
+    def test_skipped_without_export(self):
+        notebook_source = FakeNotebookSource(modified_at=1000)
+        self.publish(self.create_notebook(notebook_source), published_paths=frozenset())
+        self.assertEqual(1, notebook_source.exported)
+
+        self.publish(self.create_notebook(notebook_source), published_paths=frozenset(self.client.workspace_api.imported))
+        self.assertEqual(1, notebook_source.exported)
+        self.assertEqual(2, len(self.client.workspace_api.imported))
+
+        notebook_source.modified_at = 2000
+        self.publish(self.create_notebook(notebook_source), published_paths=frozenset(self.client.workspace_api.imported))
+        self.assertEqual(2, notebook_source.exported)
+        self.assertEqual(4, len(self.client.workspace_api.imported))
+
+    def test_removed_from_target_republished(self):
+        notebook_source = FakeNotebookSource()
+        self.publish(self.create_notebook(notebook_source), published_paths=frozenset())
+        self.publish(self.create_notebook(notebook_source), published_paths=frozenset(["/Published/Lesson 1"]))
+        self.assertEqual(4, len(self.client.workspace_api.imported))
+
+    def test_unpublished_removed(self):
+        from types import SimpleNamespace
+        from dbacademy.dbbuild.publish.publisher_class import Publisher
+
+        # Skips __init__, which requires a workspace for the build config.
+        publisher = Publisher.__new__(Publisher)
+        publisher.target_dir = "/Published"
+        publisher.client = self.client
+
+        notebooks = [SimpleNamespace(path="Lesson 1", include_solution=True), SimpleNamespace(path="Lesson 2", include_solution=False)]
+        published_paths = frozenset(["/Published/Lesson 1", "/Published/Solutions/Lesson 1", "/Published/Lesson 2",
+                                     "/Published/Solutions/Lesson 2", "/Published/Lesson 3", "/Published/docs/Guide"])
+
+        publisher._Publisher__remove_unpublished(notebooks, published_paths, False)
+        self.assertEqual(["/Published/Lesson 3", "/Published/Solutions/Lesson 2"], self.client.workspace_api.deleted)
+
+
 if __name__ == '__main__':
     unittest.main()
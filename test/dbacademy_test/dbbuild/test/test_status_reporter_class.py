@@ -0,0 +1,136 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from dbacademy.dbbuild.test.status_reporter_class import StatusReporter
+
+
+def response_of(status_code: int, body: dict = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body or {}).encode("utf-8")
+    return response
+
+
+class FakeEndpoints:
+    """Records the calls made to the results and Slack endpoints, failing the first `failures` of each."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.results = list()
+        self.slack = list()
+        self.attempts = 0
+
+    def put(self, url, data):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            return response_of(500)
+        self.results.append(json.loads(data))
+        return response_of(200)
+
+    def post(self, url, data):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise requests.exceptions.ConnectionError("Connection reset by peer")
+        self.slack.append(json.loads(data))
+        return response_of(200, {"data": {"thread_ts": "1234.5678"}})
+
+
+class TestStatusReporter(unittest.TestCase):
+
+    def flush(self, reporter: StatusReporter) -> None:
+        thread = threading.Thread(target=reporter.flush, daemon=True)
+        thread.start()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive(), "flush() did not return")
+
+    def test_results_in_order(self):
+        endpoints = FakeEndpoints()
+        reporter = StatusReporter()
+
+        with patch("requests.put", endpoints.put):
+            for i in range(10):
+                reporter.log_result({"test_id": i})
+            self.flush(reporter)
+
+        self.assertEqual(list(range(10)), [r["test_id"] for r in endpoints.results])
+
+    def test_results_retried(self):
+        endpoints = FakeEndpoints(failures=2)
+        reporter = StatusReporter(max_attempts=3, backoff_seconds=0)
+
+        with patch("requests.put", endpoints.put):
+            reporter.log_result({"test_id": 1})
+            self.flush(reporter)
+
+        self.assertEqual(3, endpoints.attempts)
+        self.assertEqual([{"test_id": 1}], endpoints.results)
+
+    def test_slack_not_retried(self):
+        endpoints = FakeEndpoints(failures=1)
+        reporter = StatusReporter(max_attempts=3, backoff_seconds=0)
+
+        with patch("requests.post", endpoints.post):
+            reporter.send_status_update("info", "Starting")
+            self.flush(reporter)
+            reporter.send_status_update("info", "Finished")
+            self.flush(reporter)
+
+        self.assertEqual(2, endpoints.attempts)
+        self.assertEqual(["Finished"], [m["message"] for m in endpoints.slack])
+
+    def test_slack_combined_once_threaded(self):
+        endpoints = FakeEndpoints()
+        reporter = StatusReporter()
+        gate = threading.Event()
+
+        def blocked_put(url, data):
+            gate.wait(timeout=5)
+            return endpoints.put(url, data)
+
+        with patch("requests.post", endpoints.post), patch("requests.put", blocked_put):
+            reporter.send_status_update("info", "First")
+            reporter.send_status_update("info", "Second")
+            self.flush(reporter)
+
+            # Queued while the worker is blocked delivering the result, so they arrive as one batch.
+            reporter.log_result({"test_id": 1})
+            for message_type, message in [("info", "A"), ("info", "B"), ("error", "C")]:
+                reporter.send_status_update(message_type, message)
+            gate.set()
+            self.flush(reporter)
+
+        messages = [(m["message_type"], m["message"]) for m in endpoints.slack]
+        # First and Second are never combined, as the Slack thread doesn't exist until First has been posted.
+        self.assertEqual([("info", "First"), ("info", "Second"), ("info", "A\n\nB"), ("error", "C")], messages)
+        self.assertIsNone(endpoints.slack[0]["thread_ts"])
+        self.assertEqual("1234.5678", endpoints.slack[-1]["thread_ts"])
+
+    def test_delivery_error_does_not_stop_worker(self):
+        endpoints = FakeEndpoints()
+        reporter = StatusReporter()
+        original = reporter._StatusReporter__deliver
+        calls = list()
+
+        def deliver(batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise ValueError("Unexpected event")
+            original(batch)
+
+        reporter._StatusReporter__deliver = deliver
+
+        with patch("requests.put", endpoints.put):
+            reporter.log_result({"test_id": 1})
+            self.flush(reporter)
+            reporter.log_result({"test_id": 2})
+            self.flush(reporter)
+
+        self.assertEqual([{"test_id": 2}], endpoints.results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from dbacademy.dbbuild.test import test_suite_class
+
+
+class FakeNotebook:
+    def __init__(self, path: str, order: int):
+        self.path = path
+        self.order = order
+        self.ignored = False
+
+
+class FakeTest:
+    def __init__(self, number: int):
+        self.notebook = FakeNotebook(f"Lesson {number}", number)
+        self.notebook_path = f"/Test/Lesson {number}"
+        self.job_name = f"[TEST] lesson-{number}"
+        self.job_id = 0
+        self.run_id = 0
+
+
+class FakeBuildConfig:
+    name = "Example Course"
+    build_name = "example-course"
+    suite_id = "suite"
+    cloud = "AWS"
+    spark_version = "11.3.x-scala2.12"
+    workers = 0
+    instance_pool_id = None
+    single_user_name = None
+    job_arguments = dict()
+    libraries = list()
+
+    def __init__(self):
+        self.spark_conf = {"spark.master": "local[*]"}
+
+
+class FakeStatusReporter:
+    slack_first_message = "first"
+
+    def log_result(self, payload):
+        pass
+
+    def send_status_update(self, message_type, message):
+        pass
+
+    def flush(self):
+        pass
+
+
+class FakeJobs:
+    def __init__(self, fail_job_names=()):
+        self.fail_job_names = fail_job_names
+        self.configs = dict()
+        self.lock = threading.Lock()
+
+    def create_from_config(self, job_config):
+        with self.lock:
+            job_id = len(self.configs) + 1
+            self.configs[job_id] = job_config
+            return job_id
+
+    def run_now(self, job_id):
+        if self.configs[job_id].params["name"] in self.fail_job_names:
+            raise RuntimeError("Quota exceeded")
+        return {"run_id": job_id * 100}
+
+
+class FakeRuns:
+    def __init__(self, client):
+        self.client = client
+
+    def wait_for_all(self, run_ids):
+        self.client.max_running = max(self.client.max_running, len(run_ids))
+        for run_id in sorted(run_ids):
+            yield {"run_id": run_id, "job_id": run_id // 100, "state": {"life_cycle_state": "TERMINATED", "result_state": self.client.result_state}}
+
+    def wait_for(self, run_id):
+        return next(self.wait_for_all([run_id]))
+
+    def cancel(self, run_id):
+        self.client.cancelled.append(run_id)
+
+
+class FakeClient:
+    def __init__(self, fail_job_names=(), result_state="SUCCESS"):
+        self.jobs = FakeJobs(fail_job_names)
+        self.result_state = result_state
+        self.cancelled = list()
+        self.max_running = 0
+
+    def runs(self):
+        return FakeRuns(self)
+
+
+@patch("dbacademy.dbgems.get_workspace_url", lambda: "https://example.cloud.databricks.com/")
+@patch("dbacademy.dbgems.get_browser_host_name", lambda: "example.cloud.databricks.com")
+@patch("dbacademy.dbgems.get_workspace_id", lambda: "1234")
+class TestTestSuite(unittest.TestCase):
+
+    def create_suite(self, rounds, **kwargs):
+        # Skips __init__, which verifies each notebook against the workspace.
+        suite = test_suite_class.TestSuite.__new__(test_suite_class.TestSuite)
+        suite.build_config = FakeBuildConfig()
+        suite.client = FakeClient(**kwargs)
+        suite.test_type = test_suite_class.TestSuite.TEST_TYPE_STOCK
+        suite.test_results = list()
+        suite.status_reporter = FakeStatusReporter()
+        suite.test_rounds = rounds
+        return suite
+
+    def test_all(self):
+        suite = self.create_suite({0: [], 1: [FakeTest(1)], 2: [FakeTest(i) for i in range(2, 10)]})
+
+        self.assertTrue(suite.test_all(max_concurrent_runs=3))
+        self.assertEqual(9, len(suite.test_results))
+        self.assertEqual(3, suite.client.max_running)
+        self.assertEqual([], suite.client.cancelled)
+
+    def test_all_fail_fast(self):
+        suite = self.create_suite({1: [FakeTest(1)], 2: [FakeTest(2)]}, result_state="FAILED")
+
+        self.assertFalse(suite.test_all())
+        self.assertEqual(["[TEST] lesson-1"], [r["job_name"] for r in suite.test_results])
+
+    def test_job_parameters_not_shared(self):
+        suite = self.create_suite({2: [FakeTest(i) for i in range(8)]})
+
+        self.assertTrue(suite.test_all_asynchronously(2, max_concurrent_runs=8))
+        self.assertEqual({"spark.master": "local[*]"}, suite.build_config.spark_conf)
+        self.assertEqual("stock", suite.test_type)
+
+        for job_config in suite.client.jobs.configs.values():
+            cluster = job_config.params["tasks"][0]["new_cluster"]
+            self.assertEqual("true", cluster["spark_conf"]["dbacademy.smoke-test"])
+
+    def test_launch_failure_cancels_started_runs(self):
+        tests = [FakeTest(i) for i in range(4)]
+        suite = self.create_suite({2: tests}, fail_job_names=["[TEST] lesson-2"])
+
+        self.assertRaises(RuntimeError, suite.test_all_asynchronously, 2)
+        self.assertEqual(sorted(t.run_id for t in tests if t.run_id), sorted(suite.client.cancelled))
+        self.assertEqual(3, len(suite.client.cancelled))
+
+
+if __name__ == '__main__':
+    unittest.main()
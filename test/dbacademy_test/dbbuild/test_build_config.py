@@ -151,6 +151,21 @@ class TestBuildConfig(unittest.TestCase):
         self.assertFalse("A01 - Databricks Workspace/DE 1.0 - Module Introduction" in build_config.notebooks)
         self.assertTrue("A02 - ETL with Spark/DE 2.0 - Module Introduction" in build_config.notebooks)
 
+    def test_local_notebook_source_without_workspace(self):
+        from unittest import mock
+        from dbacademy.dbbuild.build_config_class import BuildConfig
+        from dbacademy.dbbuild.notebook_source_class import LocalNotebookSource
+
+        with mock.patch("dbacademy.dbgems.get_notebook_path", return_value="/Repos/Examples/example-course-source/Build-Scripts/Publish"):
+            with mock.patch("dbacademy.clients.rest.factory.dbrest_factory.current_workspace", return_value="client") as current_workspace:
+                build_config = BuildConfig(name="Test Suite", version="1.2.3", notebook_source=LocalNotebookSource())
+                self.assertEqual(0, current_workspace.call_count)
+
+                # Created on first use only
+                self.assertEqual("client", build_config.client)
+                self.assertEqual("client", build_config.client)
+                self.assertEqual(1, current_workspace.call_count)
+
 
 if __name__ == '__main__':
     unittest.main()
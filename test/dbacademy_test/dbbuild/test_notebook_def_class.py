@@ -31,8 +31,10 @@ class TestNotebookDef(unittest.TestCase):
         from dbacademy.dbbuild import BuildConfig
 
         version = "1.2.3"
-        build_config = BuildConfig(name="Unit Test",
-                                   version=version)
+
+        # Skips __init__, which requires a workspace; these tests only exercise the notebook's transformations.
+        build_config = BuildConfig.__new__(BuildConfig)
+        build_config._BuildConfig__client = None
 
         return NotebookDef(build_config=build_config,
                            path="Agenda",
@@ -236,6 +238,24 @@ class TestNotebookDef(unittest.TestCase):
         result = command.replace(f"{m} MAGIC ", "")
         print(result)
 
+    def test_replace_contents(self):
+        notebook = self.create_notebook()
+        notebook.replacements["course_name"] = "Unit Test"
+        notebook.replacements["version_number"] = "v1.2.3"
+
+        actual = notebook.replace_contents("# MAGIC {{course_name}}, {{version_number}} | {{course_name}} {unchanged}")
+        self.assertEqual("# MAGIC Unit Test, v1.2.3 | Unit Test {unchanged}", actual)
+        self.assert_n_errors(0, notebook)
+
+    def test_replace_contents_chained(self):
+        notebook = self.create_notebook()
+        notebook.replacements["outer"] = "{{inner}}"
+        notebook.replacements["inner"] = "value"
+
+        # Keys are replaced in order, so a value may contain a key that comes after it
+        self.assertEqual("value value", notebook.replace_contents("{{outer}} {{inner}}"))
+        self.assert_n_errors(0, notebook)
+
     def test_build_install_libraries_cell_v1(self):
         command = r"""
     # INSTALL_LIBRARIES
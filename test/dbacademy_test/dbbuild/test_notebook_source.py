@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from dbacademy.dbbuild.notebook_source_class import LocalNotebookSource, NotebookSource
+
+
+class TestNotebookSource(unittest.TestCase):
+
+    def test_abstract(self):
+        self.assertRaises(TypeError, NotebookSource)
+
+
+class TestLocalNotebookSource(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = os.path.join(self.temp_dir.name, "Source").replace(os.sep, "/")
+
+        self.write("Version Info.py", "# Databricks notebook source\n# MAGIC %md Version Info")
+        self.write("Includes/Classroom-Setup.sql", "-- Databricks notebook source\nSELECT 1")
+        self.write("Includes/Helpers.scala", "// Databricks notebook source\nprintln(1)")
+        self.write("Includes/module.py", "import os")
+        self.write("README.md", "# Readme")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write(self, path: str, content: str) -> None:
+        file_path = os.path.join(self.source_dir, path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w") as f:
+            f.write(content)
+
+    def test_ls(self):
+        entities = LocalNotebookSource().ls(self.source_dir)
+        actual = sorted([(e.get("path")[len(self.source_dir)+1:], e.get("language")) for e in entities])
+
+        self.assertEqual([("Includes/Classroom-Setup", "SQL"), ("Includes/Helpers", "SCALA"), ("Version Info", "PYTHON")], actual)
+        self.assertTrue(all(e.get("object_type") == "NOTEBOOK" for e in entities))
+
+    def test_ls_missing(self):
+        self.assertIsNone(LocalNotebookSource().ls(f"{self.source_dir}/Missing"))
+
+    def test_get_status(self):
+        source = LocalNotebookSource()
+        self.assertEqual("SQL", source.get_status(f"{self.source_dir}/Includes/Classroom-Setup").get("language"))
+        self.assertIsNone(source.get_status(f"{self.source_dir}/Includes/module"))
+        self.assertIsNone(source.get_status(f"{self.source_dir}/Missing"))
+
+    def test_export_notebook(self):
+        source = LocalNotebookSource()
+        self.assertEqual("# Databricks notebook source\n# MAGIC %md Version Info", source.export_notebook(f"{self.source_dir}/Version Info"))
+        self.assertRaises(FileNotFoundError, source.export_notebook, f"{self.source_dir}/Missing")
+
+
+if __name__ == '__main__':
+    unittest.main()
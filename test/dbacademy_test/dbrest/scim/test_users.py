@@ -153,5 +153,42 @@ class TestUsers(unittest.TestCase):
         self.assertTrue(found_jacob)
 
 
+class FakeClient:
+    endpoint = "https://example.cloud.databricks.com"
+
+    def __init__(self):
+        self.requests = []
+
+    def api(self, _http_method, _endpoint_path, _data=None, **_kwargs):
+        self.requests.append((_http_method, _endpoint_path, _data))
+        return {}
+
+
+class TestUsersEntitlements(unittest.TestCase):
+
+    def test_remove_entitlements(self):
+        from dbacademy.dbrest.scim.users import ScimUsersClient
+
+        client = FakeClient()
+        ScimUsersClient(client).remove_entitlements("1234", ["allow-cluster-create", "workspace-access"])
+
+        self.assertEqual(1, len(client.requests))
+        method, url, payload = client.requests[0]
+        self.assertEqual("PATCH", method)
+        self.assertEqual("https://example.cloud.databricks.com/api/2.0/preview/scim/v2/Users/1234", url)
+        self.assertEqual(["urn:ietf:params:scim:api:messages:2.0:PatchOp"], payload["schemas"])
+        self.assertEqual([
+            {"op": "remove", "path": 'entitlements[value eq "allow-cluster-create"]'},
+            {"op": "remove", "path": 'entitlements[value eq "workspace-access"]'},
+        ], payload["Operations"])
+
+    def test_remove_no_entitlements(self):
+        from dbacademy.dbrest.scim.users import ScimUsersClient
+
+        client = FakeClient()
+        self.assertIsNone(ScimUsersClient(client).remove_entitlements("1234", []))
+        self.assertEqual([], client.requests)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from dbacademy.dbrest.runs import RunsClient
+
+
+class FakeClient:
+    """Serves the life cycle states of runs, advancing each run one state per poll."""
+
+    endpoint = "https://example.cloud.databricks.com"
+
+    def __init__(self, states):
+        self.states = states
+        self.polls = {run_id: 0 for run_id in states}
+
+    def api(self, _http_method, _endpoint_path, *_args, **_kwargs):
+        run_id = int(_endpoint_path.split("run_id=")[1])
+        states = self.states[run_id]
+        state = states[min(self.polls[run_id], len(states) - 1)]
+        self.polls[run_id] += 1
+        return {"run_id": run_id, "job_id": 1, "state": {"life_cycle_state": state}}
+
+
+class TestRunsClient(unittest.TestCase):
+
+    def test_wait_for_single(self):
+        client = FakeClient({1: ["PENDING", "RUNNING", "TERMINATED"]})
+        runs = RunsClient(client)
+        runs_wait = runs.wait_for_all([1], min_interval=0, max_interval=0)
+        self.assertEqual("TERMINATED", next(runs_wait)["state"]["life_cycle_state"])
+        self.assertEqual(3, client.polls[1])
+
+    def test_wait_for_all_in_completion_order(self):
+        client = FakeClient({
+            1: ["RUNNING"] * 5 + ["TERMINATED"],
+            2: ["RUNNING", "SKIPPED"],
+            3: ["INTERNAL_ERROR"],
+        })
+        runs = RunsClient(client)
+        finished = [r["run_id"] for r in runs.wait_for_all([1, 2, 3], min_interval=0, max_interval=0)]
+        self.assertEqual([3, 2, 1], finished)
+        # Finished runs are no longer polled.
+        self.assertEqual({1: 6, 2: 2, 3: 1}, client.polls)
+
+    def test_wait_for_many_polls_without_recursion(self):
+        import sys
+        client = FakeClient({1: ["RUNNING"] * (sys.getrecursionlimit() + 10) + ["TERMINATED"]})
+        response = RunsClient(client).wait_for_all([1], min_interval=0, max_interval=0)
+        self.assertEqual("TERMINATED", next(response)["state"]["life_cycle_state"])
+
+    def test_wait_for_all_empty(self):
+        self.assertEqual([], list(RunsClient(FakeClient({})).wait_for_all([])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from dbacademy.dbrest.workspace import WorkspaceClient
+
+
+class FakeClient:
+    """Serves a workspace tree three directories deep, with two notebooks and three sub-directories per directory."""
+
+    endpoint = "https://example.cloud.databricks.com"
+
+    def __init__(self):
+        self.listed = []
+
+    def api(self, _http_method, _endpoint_path, *_args, path: str = None, **_kwargs):
+        self.listed.append(path)
+        if path.startswith("/Missing"):
+            return None
+
+        objects = [{"path": f"{path}/Notebook {i}", "object_type": "NOTEBOOK"} for i in range(2)]
+        if path.count("/") < 3:
+            objects.extend([{"path": f"{path}/Folder {i}", "object_type": "DIRECTORY"} for i in range(3)])
+        return {"objects": objects}
+
+
+class TestWorkspaceClient(unittest.TestCase):
+
+    def test_ls_recursive(self):
+        client = FakeClient()
+        notebooks = WorkspaceClient(client).ls("/Source", recursive=True, max_workers=4)
+
+        # 1 + 3 + 9 directories, each with two notebooks
+        self.assertEqual(26, len(notebooks))
+        self.assertEqual(26, len(set(n["path"] for n in notebooks)))
+        self.assertEqual(13, len(client.listed))
+
+    def test_ls_recursive_directories(self):
+        objects = WorkspaceClient(FakeClient()).ls("/Source", recursive=True, object_types=["DIRECTORY"])
+        self.assertEqual(3, len(objects))
+
+    def test_ls_recursive_missing(self):
+        self.assertIsNone(WorkspaceClient(FakeClient()).ls("/Missing", recursive=True))
+
+    def test_walk_stops_early(self):
+        walker = WorkspaceClient(FakeClient()).walk("/Source", max_workers=1)
+        self.assertEqual("/Source/Notebook 0", next(walker)["path"])
+        walker.close()
+
+    def test_walk_missing(self):
+        self.assertEqual([], list(WorkspaceClient(FakeClient()).walk("/Missing")))
+
+
+if __name__ == '__main__':
+    unittest.main()